@@ -0,0 +1,215 @@
+import argparse
+import csv
+import gc
+import itertools
+import json
+import os.path
+import subprocess
+import sys
+import tempfile
+import time
+
+from collections.abc import Callable
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import descriptors
+import lark
+import printer
+
+from generate_network import generate_network
+from mutate import apply_mutation, load_parser, op_choices, parse_ta
+
+# operators to be timed and size of networks at scale 1
+# (processes and events are scaled slower than the other parameters, as the number of mutations of add_sync grows exponentially in the number of processes)
+ops = [op for op in op_choices if op != "all"]
+base_size = {"processes": 2, "locations": 5, "edges": 8, "clocks": 2, "events": 3, "syncs": 2}
+
+mutate_script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src", "mutate.py")
+
+def network_size(scale: int) -> dict[str, int]:
+    """
+    :param scale: scaling factor
+    :return: parameters of generate_network for given scale
+    """
+
+    size = {name: value * scale for name, value in base_size.items()}
+    size["processes"] = base_size["processes"] + scale // 2
+    size["events"] = base_size["events"] + scale - 1
+    return size
+
+def calibrate() -> float:
+    """
+    Measures time of a fixed amount of work, benchmark times are stored relative to the fastest of these measurements, so baselines can be compared across machines.
+
+    :return: time in seconds
+    """
+
+    start = time.perf_counter()
+    total = 0
+    for i in range(2000000):
+        total = total + i % 7
+    return time.perf_counter() - start
+
+def operator_run(tree: lark.ParseTree, op: str, max_mutations: int) -> Callable[[], int]:
+    """
+    :param tree: AST of TA
+    :param op: mutation operator
+    :param max_mutations: only the first mutations up to this number are generated
+    :return: function generating and serializing the mutations of given operator (without checking them) and returning their number
+    """
+
+    ta_printer = printer.Printer(tree)
+
+    def run() -> int:
+        count = 0
+        for mutation in itertools.islice(apply_mutation(tree, op, 1), max_mutations):
+            ta_printer.to_text(descriptors.materialize(tree, mutation))
+            count = count + 1
+        return count
+
+    return run
+
+def measure(run: Callable[[], int], runs: int) -> tuple[int, float]:
+    """
+    Measures time of calling given function repeatedly.
+    Like in timeit, garbage collection is disabled during the measurement, so its time does not depend on the garbage left by earlier measurements.
+
+    :param run: function to be measured
+    :param runs: number of calls
+    :return: result of last call and time in seconds
+    """
+
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for _ in range(runs):
+            count = run()
+        return count, time.perf_counter() - start
+    finally:
+        gc.enable()
+
+def autorange(run: Callable[[], int], min_time: float) -> int:
+    """
+    Determines how often given function is called per measurement, so short times are not dominated by timer resolution and noise.
+
+    :param run: function to be measured
+    :param min_time: minimum duration of a measurement in seconds
+    :return: number of calls (doubled until a measurement takes at least min_time)
+    """
+
+    runs = 1
+    while(measure(run, runs)[1] < min_time):
+        runs = runs * 2
+    return runs
+
+def time_pipeline(in_file: str, op: str, repeat: int) -> float:
+    """
+    Measures time of a full run of mutate.py (including the checks with TChecker).
+
+    :param in_file: path to TA file
+    :param op: mutation operator
+    :param repeat: number of measurements, the fastest is reported
+    :return: time in seconds
+    """
+
+    best = float("inf")
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory() as out_dir:
+            start = time.perf_counter()
+            subprocess.run([sys.executable, mutate_script, "--in_ta", in_file, "--out_dir", out_dir, "--op", op], check = True, stdout = subprocess.DEVNULL)
+            best = min(best, time.perf_counter() - start)
+    return best
+
+if "__main__" == __name__:
+
+    parser = argparse.ArgumentParser(description = "Times all mutation operators on synthetic networks of increasing size and compares the times with a baseline.")
+    parser.add_argument("--scales", type = int, nargs = "+", default = [1, 2, 4], help = "Scaling factors of the synthetic networks. Default is 1 2 4.")
+    parser.add_argument("--repeat", type = int, default = 5, help = "Number of measurements per operator (and of the calibration), the fastest is reported. Default is 5.")
+    parser.add_argument("--max_mutations", type = int, default = 10000, help = "Maximum number of mutations generated per operator and scale. Default is 10000.")
+    parser.add_argument("--pipeline", action = "store_true", help = "Also time full runs of mutate.py with operator all (requires TChecker).")
+    parser.add_argument("--out", type = str, default = "benchmark_results.csv", help = "Path to output CSV file with the times of all operators at all scales. Default is benchmark_results.csv.")
+    parser.add_argument("--baseline", type = str, default = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json"),
+                        help = "Path to baseline JSON file. Default is baseline.json next to this script.")
+    parser.add_argument("--update_baseline", action = "store_true", help = "Write measured times to baseline file instead of comparing with it.")
+    parser.add_argument("--tolerance", type = float, default = 2.0, help = "Factor by which a time may exceed its baseline before it counts as regression. Default is 2.0.")
+    parser.add_argument("--min_time", type = float, default = 0.1, help = "Minimum duration of every measurement in seconds, operators are run repeatedly per measurement until it is reached. Default is 0.1.")
+
+    args = parser.parse_args()
+
+    if(args.repeat < 1):
+        raise ValueError("Number of measurements must be positive.")
+
+    ta_parser = load_parser()
+
+    # fastest time of every benchmark, together with scale, size of network and number of mutations
+    measurements: list[tuple[int, dict[str, int], str, int | str, float]] = []
+
+    # fastest time of the calibration workload (measured once per round of measurements at every scale)
+    calibration = float("inf")
+
+    with tempfile.TemporaryDirectory() as network_dir:
+        for scale in args.scales:
+            size = network_size(scale)
+            network = generate_network(**size)
+
+            tree = parse_ta(ta_parser, network)
+            runs = {op: operator_run(tree, op, args.max_mutations) for op in ops}
+            runs_per_measurement = {op: autorange(run, args.min_time) for op, run in runs.items()}
+
+            # the measurements of all operators are interleaved (one measurement of every operator per round),
+            # so a temporary slowdown of the machine only affects single measurements of several operators instead of all measurements of one operator
+            counts = {}
+            best = {op: float("inf") for op in ops}
+            for _ in range(args.repeat):
+                calibration = min(calibration, calibrate())
+                for op, run in runs.items():
+                    counts[op], seconds = measure(run, runs_per_measurement[op])
+                    best[op] = min(best[op], seconds / runs_per_measurement[op])
+
+            for op in ops:
+                measurements.append((scale, size, op, counts[op], best[op]))
+                print(f"scale {scale:3} {op:30} {counts[op]:7} mutations {best[op]:9.4f}s")
+
+            if(args.pipeline):
+                in_file = os.path.join(network_dir, f"synthetic_{scale}.tck")
+                with open(in_file, "w") as network_file:
+                    network_file.write(network)
+                seconds = time_pipeline(in_file, "all", args.repeat)
+                measurements.append((scale, size, "pipeline", "", seconds))
+                print(f"scale {scale:3} {'pipeline':30} {'':7}           {seconds:9.4f}s")
+
+    # relative times by benchmark name
+    results: dict[str, float] = {}
+
+    with open(args.out, "w", newline = '') as file:
+        csv_writer = csv.writer(file)
+        csv_writer.writerow(["scale"] + list(base_size.keys()) + ["op", "mutations", "time", "relative time"])
+        for scale, size, op, count, seconds in measurements:
+            results[f"{op}@{scale}"] = seconds / calibration
+            csv_writer.writerow([scale] + list(size.values()) + [op, count, seconds, seconds / calibration])
+
+    if(args.update_baseline):
+        with open(args.baseline, "w") as file:
+            json.dump(results, file, indent = 2, sort_keys = True)
+        sys.exit()
+
+    if(not os.path.isfile(args.baseline)):
+        sys.exit("No baseline found, create one with --update_baseline.")
+
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+
+    # compare fastest relative times with fastest relative times of baseline
+    regressions = []
+    for name, relative_time in results.items():
+        if(name not in baseline):
+            continue
+        if(relative_time > args.tolerance * baseline[name]):
+            regressions.append(f"{name}: {relative_time / baseline[name]:.1f} times slower than baseline")
+
+    if(len(regressions) > 0):
+        sys.exit("Regressions found:\n" + "\n".join(regressions))
+
+    print("No regressions found.")
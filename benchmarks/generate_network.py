@@ -0,0 +1,75 @@
+import argparse
+import random
+
+def generate_network(processes: int, locations: int, edges: int, clocks: int, events: int, syncs: int, seed: int = 0) -> str:
+    """
+    Generates a random network of timed automata in TChecker syntax.
+    Every process has the given number of locations and edges, guards, invariants and resets use randomly chosen clocks.
+
+    :param processes: number of processes
+    :param locations: number of locations per process
+    :param edges: number of edges per process
+    :param clocks: number of clocks (shared by all processes)
+    :param events: number of events
+    :param syncs: number of synchronisations (between two randomly chosen processes, at most one per pair of processes and event)
+    :param seed: seed of random generator, equal arguments yield equal networks
+    :return: network in TChecker syntax
+    """
+
+    rng = random.Random(seed)
+
+    lines = [f"system:synthetic_{processes}_{locations}_{edges}_{clocks}_{events}_{syncs}", ""]
+    lines.extend(f"event:e{i}" for i in range(events))
+    lines.extend(f"clock:1:x{i}" for i in range(clocks))
+    lines.append("")
+
+    process_events = {}
+    for p in range(processes):
+        lines.append(f"process:P{p}")
+
+        for l in range(locations):
+            attributes = []
+            if(0 == l):
+                attributes.append("initial:")
+            elif(clocks > 0 and rng.random() < 0.3):
+                attributes.append(f"invariant: x{rng.randrange(clocks)}<={rng.randint(1, 10)}")
+            lines.append(f"location:P{p}:l{l}" + (f"{{{' : '.join(attributes)}}}" if len(attributes) > 0 else ""))
+
+        process_events[p] = set()
+        for _ in range(edges):
+            source, target, event = rng.randrange(locations), rng.randrange(locations), rng.randrange(events)
+            process_events[p].add(event)
+
+            attributes = []
+            if(clocks > 0 and rng.random() < 0.6):
+                guard = [f"x{rng.randrange(clocks)}{rng.choice(['<', '<=', '>=', '>', '=='])}{rng.randint(0, 10)}" for _ in range(rng.randint(1, 2))]
+                attributes.append(f"provided: {' && '.join(guard)}")
+            if(clocks > 0 and rng.random() < 0.4):
+                attributes.append(f"do: x{rng.randrange(clocks)}=0")
+            lines.append(f"edge:P{p}:l{source}:l{target}:e{event}" + (f"{{{' : '.join(attributes)}}}" if len(attributes) > 0 else ""))
+
+        lines.append("")
+
+    # synchronise events that occur in both processes
+    candidates = sorted((p, q, event) for p in range(processes) for q in range(p + 1, processes) for event in process_events[p] & process_events[q])
+    for p, q, event in rng.sample(candidates, min(syncs, len(candidates))):
+        lines.append(f"sync:P{p}@e{event}:P{q}@e{event}")
+
+    return "\n".join(lines) + "\n"
+
+if "__main__" == __name__:
+
+    parser = argparse.ArgumentParser(description = "Generates a random network of timed automata in TChecker syntax.")
+    parser.add_argument("--processes", type = int, default = 2, help = "Number of processes. Default is 2.")
+    parser.add_argument("--locations", type = int, default = 4, help = "Number of locations per process. Default is 4.")
+    parser.add_argument("--edges", type = int, default = 6, help = "Number of edges per process. Default is 6.")
+    parser.add_argument("--clocks", type = int, default = 2, help = "Number of clocks. Default is 2.")
+    parser.add_argument("--events", type = int, default = 3, help = "Number of events. Default is 3.")
+    parser.add_argument("--syncs", type = int, default = 2, help = "Number of synchronisations. Default is 2.")
+    parser.add_argument("--seed", type = int, default = 0, help = "Seed of random generator. Default is 0.")
+    parser.add_argument("--out", type = str, required = True, help = "Path to output .tck file.")
+
+    args = parser.parse_args()
+
+    with open(args.out, "w") as file:
+        file.write(generate_network(args.processes, args.locations, args.edges, args.clocks, args.events, args.syncs, args.seed))
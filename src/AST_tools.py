@@ -1,4 +1,6 @@
-import copy
+import declaration_index
+
+from collections.abc import Iterator
 
 from lark import ParseTree, Token, Tree
 
@@ -8,6 +10,7 @@ def exchange_node(tree: ParseTree, old_node: ParseTree | Token, new_node: ParseT
     """
     Exchanges old_node in given tree with new_node. 
     Only exchanges the first occurrence of old_node in the tree.
+    Only the nodes on the path from the root to old_node are copied, all other subtrees are shared with the given tree.
 
     :param tree: tree to be altered
     :param old_node: node to be exchanged
@@ -23,35 +26,28 @@ def exchange_node(tree: ParseTree, old_node: ParseTree | Token, new_node: ParseT
 
     def exchange_node_helper(tree: ParseTree, old_node, new_node) -> ParseTree:
 
+        result = shallow_copy(tree)
+
         # old_node is direct child node of tree
         if(old_node in tree.children):
-            for i, child in enumerate(tree.children):
-                if(child == old_node):
-                    tree.children[i] = new_node
-                    break
+            result.children[tree.children.index(old_node)] = new_node
 
         # given node is no direct child node of tree
         else:
-            new_children = []
-
-            exchanged_node = False
-            for child in tree.children:
-                if(exchanged_node or isinstance(child, Token) or not contains_child_node(child, old_node)):
-                    new_children.append(child)
-                else:
-                    new_children.append(exchange_node_helper(child, old_node, new_node))
-                    exchanged_node = True
-
-            tree.set(tree.data, new_children)
+            for i, child in enumerate(tree.children):
+                if(isinstance(child, Tree) and contains_child_node(child, old_node)):
+                    result.children[i] = exchange_node_helper(child, old_node, new_node)
+                    break
 
-        return tree
+        return result
 
-    return exchange_node_helper(copy.deepcopy(tree), old_node, new_node)
+    return exchange_node_helper(tree, old_node, new_node)
 
 def remove_node(tree: ParseTree, node: ParseTree | Token) -> ParseTree:
     """
     Removes given node from given tree. 
     Only removes the first occurrence of the node in the tree.
+    Only the nodes on the path from the root to the removed node are copied, all other subtrees are shared with the given tree.
 
     :param tree: tree to be altered
     :param node: node to be removed
@@ -63,27 +59,143 @@ def remove_node(tree: ParseTree, node: ParseTree | Token) -> ParseTree:
 
     def remove_node_helper(tree: ParseTree, node) -> ParseTree:
 
+        result = shallow_copy(tree)
+
         # given node is direct child node of tree
         if(node in tree.children):
-            tree.children.remove(node)
+            result.children.remove(node)
 
         # given node is no direct child node of tree
         else:
-            new_children = []
+            for i, child in enumerate(tree.children):
+                if(isinstance(child, Tree) and contains_child_node(child, node)):
+                    result.children[i] = remove_node_helper(child, node)
+                    break
+
+        return result
+
+    return remove_node_helper(tree, node)
+
+def get_node_at(tree: ParseTree, path: tuple[int, ...]) -> ParseTree | Token:
+    """
+    Returns node at given child-index path in given tree.
+
+    :param tree: tree to be searched
+    :param path: child-index path of node relative to tree
+    :return: node at path
+    """
+
+    for idx in path:
+        tree = tree.children[idx]
+    return tree
+
+def exchange_node_at(tree: ParseTree, path: tuple[int, ...], new_node: ParseTree | Token) -> ParseTree | Token:
+    """
+    Exchanges node at given child-index path in given tree with new_node.
+    Only the nodes on the path are copied, all other subtrees are shared with the given tree.
+
+    :param tree: tree to be altered
+    :param path: child-index path of node to be exchanged relative to tree
+    :param new_node: node to be inserted at path
+    :return: tree with node at path exchanged with new_node
+    """
+
+    if(0 == len(path)):
+        return new_node
+
+    result = shallow_copy(tree)
+    result.children[path[0]] = exchange_node_at(tree.children[path[0]], path[1:], new_node)
+    return result
+
+def remove_node_at(tree: ParseTree, path: tuple[int, ...]) -> ParseTree:
+    """
+    Removes node at given child-index path from given tree.
+    Only the nodes on the path are copied, all other subtrees are shared with the given tree.
+
+    :param tree: tree to be altered
+    :param path: child-index path of node to be removed relative to tree (must not be empty)
+    :return: tree without node at path
+    """
+
+    result = shallow_copy(tree)
+    if(1 == len(path)):
+        result.children.pop(path[0])
+    else:
+        result.children[path[0]] = remove_node_at(tree.children[path[0]], path[1:])
+    return result
 
-            removed_node = False
-            for child in tree.children:
-                if(removed_node or isinstance(child, Token) or not contains_child_node(child, node)):
-                    new_children.append(child)
-                else:
-                    new_children.append(remove_node_helper(child, node))
-                    removed_node = True
+def insert_node_at(tree: ParseTree, path: tuple[int, ...], new_node: ParseTree | Token) -> ParseTree:
+    """
+    Inserts new_node into given tree before the node at given child-index path.
+    Only the nodes on the path are copied, all other subtrees are shared with the given tree.
+
+    :param tree: tree to be altered
+    :param path: child-index path new_node is inserted at relative to tree (must not be empty)
+    :param new_node: node to be inserted
+    :return: tree with new_node inserted at path
+    """
+
+    result = shallow_copy(tree)
+    if(1 == len(path)):
+        result.children.insert(path[0], new_node)
+    else:
+        result.children[path[0]] = insert_node_at(tree.children[path[0]], path[1:], new_node)
+    return result
 
-            tree.set(tree.data, new_children)
+def iter_subtrees_with_paths(tree: ParseTree) -> Iterator[tuple[tuple[int, ...], ParseTree]]:
+    """
+    Yields all subtrees of given tree together with their child-index path relative to tree.
+    Subtrees are yielded in the same order as by lark's Tree.iter_subtrees (and therefore Tree.find_data).
+
+    :param tree: tree to be searched
+    :return: iterator over pairs of path and subtree
+    """
 
-        return tree
+    queue = [((), tree)]
+    subtrees = {}
+    for path, subtree in queue:
+        if(id(subtree) in subtrees):
+            continue
+        subtrees[id(subtree)] = (path, subtree)
+        queue += [(path + (i,), child) for i, child in reversed(list(enumerate(subtree.children))) if isinstance(child, Tree) and id(child) not in subtrees]
 
-    return remove_node_helper(copy.deepcopy(tree), node)
+    return reversed(list(subtrees.values()))
+
+def find_data_with_paths(tree: ParseTree, data: str) -> Iterator[tuple[tuple[int, ...], ParseTree]]:
+    """
+    Yields all subtrees of given tree with given data together with their child-index path relative to tree (same order as Tree.find_data).
+
+    :param tree: tree to be searched
+    :param data: data of subtrees to search for (e.g. "provided_attribute")
+    :return: iterator over pairs of path and subtree
+    """
+
+    return ((path, subtree) for path, subtree in iter_subtrees_with_paths(tree) if subtree.data == data)
+
+def shallow_copy(tree: ParseTree) -> ParseTree:
+    """
+    Copies the root node of given tree. 
+    The children list of the copy can be altered without affecting the given tree, the child nodes themselves are shared.
+    (Trees are never altered in place by the mutation operators, so sharing subtrees between the original TA and its mutations is safe.)
+
+    :param tree: tree to be copied
+    :return: copy of the root node of tree
+    """
+
+    return Tree(tree.data, list(tree.children))
+
+def find_declarations(tree: ParseTree, *data: str) -> Iterator[tuple[int, ParseTree]]:
+    """
+    Yields all declarations of given types in given TA together with their index in the system declaration (in order of declaration).
+
+    :param tree: tree of TA to be searched
+    :param data: declaration types to search for (e.g. "edge_declaration")
+    :return: iterator over pairs of index and declaration
+    """
+
+    for i, child in enumerate(tree.children):
+        if(isinstance(child, Tree) and child.data in data):
+            yield i, child
 
 def contains_child_node(tree: ParseTree | Token, node: ParseTree | Token) -> bool:
     """
@@ -106,18 +218,14 @@ def contains_child_node(tree: ParseTree | Token, node: ParseTree | Token) -> boo
 def is_clock_expr(tree: ParseTree, expr: ParseTree | Token) -> bool:
     """
     Determines whether expression in given tree is a clock expression (contains a clock id).
-    (Lark might falsely classify a clock expression as a predicate expression, therefore additional checking is needed.)
+    (The parser classifies every comparison as predicate expression since clock ids can only be told apart from int ids by their declarations.)
 
     :param tree: tree of TA the expression occurs in
     :param expr: expression to check
     :return: True iff expression is clock expression
     """
 
-    for clock_declaration in tree.find_data("clock_declaration"):
-        if(contains_child_node(expr, clock_declaration.children[4])):
-            return True
-
-    return False
+    return declaration_index.get(tree).contains_clock(expr)
 
 def get_all_clocks(tree: ParseTree) -> list[ParseTree]:
     """
@@ -127,28 +235,26 @@ def get_all_clocks(tree: ParseTree) -> list[ParseTree]:
     :return: list of nodes, each representing one clock id
     """
 
-    clocks = []
-    for clock in tree.find_data("clock_declaration"):
-        for i in range(int(str(clock.children[2]))):
-            clock_id = clock.children[4]
-            clock_node = Tree(Token('RULE', 'int_or_clock_id'), 
-                         [clock_id, Token('LEFT_BRACKET_TOK', '['),
-                          Tree(Token('RULE', 'int_term'), [Token('SIGNED_INT', i)]), 
-                          Token('RIGHT_BRACKET_TOK', ']')])
-            clocks.append(clock_node)
-
-    return clocks
+    return declaration_index.get(tree).clock_ids.copy()
 
 def get_all_clock_exprs(tree: ParseTree, expr: ParseTree) -> list[ParseTree]:
     """
     Returns all clock expressions occurring in given tree.
-    (Lark might falsely classify a clock expression as a predicate expression, therefore additional checking is needed.)
+    (The parser classifies every comparison as predicate expression since clock ids can only be told apart from int ids by their declarations.)
 
     :param tree: tree of TA to get clocks from
     :return: list of nodes, each representing one clock id
     """
 
-    atomic_expressions = list(expr.find_data("predicate_expr"))
-    atomic_expressions.extend(expr.find_data("clock_expr"))
+    return [clock_expr for _, clock_expr in get_all_clock_exprs_with_paths(tree, expr)]
+
+def get_all_clock_exprs_with_paths(tree: ParseTree, expr: ParseTree) -> list[tuple[tuple[int, ...], ParseTree]]:
+    """
+    Returns all clock expressions occurring in given tree together with their child-index path relative to expr.
+
+    :param tree: tree of TA to get clocks from
+    :param expr: tree to search for clock expressions
+    :return: list of pairs of path and clock expression
+    """
 
-    return list(filter(lambda e: is_clock_expr(tree, e), atomic_expressions))
+    return [(path, e) for path, e in find_data_with_paths(expr, "predicate_expr") if is_clock_expr(tree, e)]
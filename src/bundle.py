@@ -0,0 +1,165 @@
+import argparse
+import csv
+import gzip
+import itertools
+import json
+import os
+import zlib
+
+from collections.abc import Callable, Iterator
+
+class Bundle:
+    """
+    Single file containing mutated TAs instead of one file per mutation.
+    Every mutation is stored as a separate gzip member holding one JSON object (so the whole file can be read as a gzip compressed JSON lines stream),
+    the byte offset and length of every member are recorded in an index file, so single mutations can be read without decompressing the others.
+    Added mutations are buffered and only written to disk by flush and close.
+    """
+
+    def __init__(self, path: str, is_kept: Callable[[str], bool] | None = None):
+        """
+        :param path: path to bundle file, the index is written to the same path with suffix .index.csv
+        :param is_kept: function deciding by file name whether a mutation of an existing bundle is kept (e.g. when resuming a run), a new bundle is started if None
+        """
+
+        self.path = path
+        self.index_path = path + ".index.csv"
+
+        # file name, folder, offset and length of every mutation in bundle,
+        # read from the members themselves, as the index (or the last member) may be torn if a run was interrupted
+        entries = []
+        if(is_kept is not None and os.path.isfile(path)):
+            entries = [entry for entry in members(path) if is_kept(entry[0])]
+
+        # drop mutations that are not kept, if the kept mutations are the first ones, the bundle is truncated after them, otherwise they are copied to a new bundle
+        starts = itertools.accumulate((length for _, _, _, length in entries), initial = 0)
+        if(all(offset == start for (_, _, offset, _), start in zip(entries, starts))):
+            with open(path, "ab") as file:
+                file.truncate(sum(length for _, _, _, length in entries))
+        else:
+            copied = []
+            with open(path, "rb") as source, open(path + ".tmp", "wb") as target:
+                for name, folder, offset, length in entries:
+                    source.seek(offset)
+                    copied.append((name, folder, target.tell(), length))
+                    target.write(source.read(length))
+            os.replace(path + ".tmp", path)
+            entries = copied
+
+        with open(self.index_path + ".tmp", "w", newline = '') as file:
+            csv.writer(file).writerows(entries)
+        os.replace(self.index_path + ".tmp", self.index_path)
+
+        self.file = open(path, "ab")
+        self.index_file = open(self.index_path, "a", newline = '')
+        self.index_writer = csv.writer(self.index_file)
+
+    def add(self, name: str, folder: str, ta: str) -> None:
+        """
+        Appends given mutation to bundle.
+
+        :param name: file name of mutation
+        :param folder: folder the mutation would be written to, relative to the output directory ("" for the output directory itself)
+        :param ta: mutated TA in TChecker syntax
+        """
+
+        member = gzip.compress((json.dumps({"mutation": name, "folder": folder, "ta": ta}) + "\n").encode(), mtime = 0)
+        offset = self.file.tell()
+        self.file.write(member)
+        self.index_writer.writerow([name, folder, offset, len(member)])
+
+    def flush(self, sync: bool = False) -> None:
+        """
+        Writes all added mutations to disk.
+
+        :param sync: whether to wait until the bundle and its index are stored on the device (e.g. before recording a checkpoint)
+        """
+
+        for file in [self.file, self.index_file]:
+            file.flush()
+            if(sync):
+                os.fsync(file.fileno())
+
+    def close(self) -> None:
+        self.flush()
+        self.file.close()
+        self.index_file.close()
+
+def members(path: str) -> Iterator[tuple[str, str, int, int]]:
+    """
+    Reads the entries of all complete members of bundle in order, without its index.
+    Reading stops at the first incomplete or corrupt member (e.g. the last member of an interrupted run).
+
+    :param path: path to bundle file
+    :return: iterator over quadruples of file name, folder, offset and length of every member
+    """
+
+    with open(path, "rb") as file:
+        offset = 0
+        # bytes read from file but belonging to the next member
+        pending = b""
+        while(True):
+            decompressor = zlib.decompressobj(wbits = 31)
+            content = []
+            consumed = 0
+            while(not decompressor.eof):
+                chunk = pending or file.read(1 << 16)
+                pending = b""
+                if(not chunk):
+                    return
+                try:
+                    content.append(decompressor.decompress(chunk))
+                except zlib.error:
+                    return
+                consumed = consumed + len(chunk)
+
+            pending = decompressor.unused_data
+            length = consumed - len(pending)
+            record = json.loads(b"".join(content))
+            yield record["mutation"], record["folder"], offset, length
+            offset = offset + length
+
+def read(path: str, name: str) -> str:
+    """
+    Reads single mutation from bundle using its index.
+
+    :param path: path to bundle file
+    :param name: file name of mutation
+    :return: mutated TA in TChecker syntax
+    :raises KeyError: if bundle does not contain mutation
+    """
+
+    with open(path + ".index.csv", newline = '') as file:
+        entry = next((entry for entry in csv.reader(file) if entry[0] == name), None)
+    if(entry is None):
+        raise KeyError(name)
+
+    with open(path, "rb") as file:
+        file.seek(int(entry[2]))
+        return json.loads(gzip.decompress(file.read(int(entry[3]))))["ta"]
+
+def read_all(path: str) -> Iterator[tuple[str, str, str]]:
+    """
+    Reads all mutations from bundle in order.
+
+    :param path: path to bundle file
+    :return: iterator over triples of file name, folder and mutated TA
+    """
+
+    with gzip.open(path, "rt") as file:
+        for line in file:
+            record = json.loads(line)
+            yield record["mutation"], record["folder"], record["ta"]
+
+if "__main__" == __name__:
+
+    parser = argparse.ArgumentParser(description = "Extracts all mutations of a bundle into one file per mutation.")
+    parser.add_argument("--bundle", type = str, required = True, help = "Path to bundle file.")
+    parser.add_argument("--out_dir", type = str, required = True, help = "Path to output directory, mutations are written to the same folders as without bundle.")
+
+    args = parser.parse_args()
+
+    for name, folder, ta in read_all(args.bundle):
+        os.makedirs(os.path.join(args.out_dir, folder), exist_ok = True)
+        with open(os.path.join(args.out_dir, folder, name), "w") as file:
+            file.write(ta)
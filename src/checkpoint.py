@@ -0,0 +1,97 @@
+import json
+import os
+
+from collections.abc import Iterable
+
+class Checkpoint:
+    """
+    Progress of a run of mutate.py, recorded in a file with one JSON object per line.
+    The first line describes the run, every further line records how many mutations of an operator have been processed and how many of them have been written.
+    Results are handled in order of completion, so the processed mutations are recorded as the number of mutations that have all been processed
+    together with the numbers of the further processed mutations (in order of generation).
+    Records are only written to disk by sync, so the outputs of all recorded mutations can be written to disk in batches before,
+    and an interrupted run can be resumed after the last synced mutation.
+    """
+
+    def __init__(self, path: str | None, run: dict, resume: bool):
+        """
+        :param path: path to checkpoint file, progress is only kept in memory if None
+        :param run: description of run (e.g. hash of input TA and arguments), a run can only be resumed with the same description
+        :param resume: whether to resume from existing checkpoint file, a new checkpoint file is started otherwise
+        :raises ValueError: if checkpoint file belongs to a different run
+        """
+
+        # number of processed mutations (without gaps), number of written mutations and numbers of further processed mutations by operator, and progress not synced yet
+        self.progress: dict[str, tuple[int, int, tuple[int, ...]]] = {}
+        self.unsynced: dict[str, tuple[int, int, tuple[int, ...]]] = {}
+
+        self.file = None
+        if(path is None):
+            return
+
+        if(resume and os.path.isfile(path)):
+            with open(path) as file:
+                lines = file.read().splitlines()
+            if(0 < len(lines) and json.loads(lines[0]) != run):
+                raise ValueError("Checkpoint belongs to a different run and can not be resumed.")
+            for line in lines[1:]:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # last record may be incomplete if run was interrupted while writing it
+                    continue
+                self.progress[record["op"]] = (record["processed"], record["written"], tuple(record.get("done", ())))
+
+        # (re)write checkpoint file with latest progress of every operator, replacing the old file at once
+        with open(path + ".tmp", "w") as file:
+            file.write(json.dumps(run, sort_keys = True) + "\n")
+            for op, progress in self.progress.items():
+                file.write(record_line(op, *progress))
+        os.replace(path + ".tmp", path)
+
+        self.file = open(path, "a")
+
+    def sync(self) -> None:
+        """
+        Appends latest progress of every operator since the last sync to checkpoint file and writes it to disk.
+        """
+
+        if(self.file is not None and len(self.unsynced) > 0):
+            for op, progress in self.unsynced.items():
+                self.file.write(record_line(op, *progress))
+            self.file.flush()
+            os.fsync(self.file.fileno())
+        self.unsynced.clear()
+
+    def get(self, op: str) -> tuple[int, int, tuple[int, ...]]:
+        """
+        :param op: mutation operator
+        :return: number of processed mutations (without gaps), number of written mutations and numbers of further processed mutations of given operator
+        """
+
+        return self.progress.get(op, (0, 0, ()))
+
+    def record(self, op: str, processed: int, written: int, done: Iterable[int] = ()) -> None:
+        """
+        Records progress of given operator, it is written to disk by the next sync.
+
+        :param op: mutation operator
+        :param processed: number of mutations that have all been processed (including mutations that were not written)
+        :param written: number of written mutations
+        :param done: numbers of further processed mutations (all greater than processed)
+        """
+
+        self.progress[op] = (processed, written, tuple(sorted(done)))
+        self.unsynced[op] = self.progress[op]
+
+    def close(self) -> None:
+        self.sync()
+        if(self.file is not None):
+            self.file.close()
+
+def record_line(op: str, processed: int, written: int, done: tuple[int, ...]) -> str:
+    """
+    :return: line of checkpoint file recording given progress of given operator (see Checkpoint.record)
+    """
+
+    return json.dumps({"op": op, "processed": processed, "written": written, "done": list(done)}, sort_keys = True) + "\n"
@@ -0,0 +1,210 @@
+import AST_tools
+import declaration_index
+import operators
+
+from collections.abc import Iterable
+
+from lark import ParseTree, Tree
+
+class Counts:
+    """
+    Number of mutations of one operator, in total and by process.
+    A mutation is counted for every process whose locations, edges or synchronisations it alters, so the counts by process may add up to more than the total.
+    """
+
+    def __init__(self):
+        self.total: int = 0
+        self.by_process: dict[str, int] = {}
+
+    def add(self, count: int, processes: Iterable[str], in_total: bool = True) -> None:
+        """
+        Adds given number of mutations altering given processes.
+
+        :param count: number of mutations
+        :param processes: names of processes altered by each of the mutations
+        :param in_total: whether to add the mutations to the total (False if they have already been added for other processes)
+        """
+
+        if(in_total):
+            self.total = self.total + count
+        for process in processes:
+            self.by_process[process] = self.by_process.get(process, 0) + count
+
+class MutationCounter:
+    """
+    Computes the number of mutations yielded by each operator (see mutate.apply_mutation) from the declarations of a TA, without generating the mutations.
+    Attributes of declarations are only searched once and shared by all operators.
+    """
+
+    def __init__(self, tree: ParseTree):
+        """
+        :param tree: AST of TA to be mutated
+        """
+
+        self.tree = tree
+        self.index = declaration_index.get(tree)
+
+        self.process_names = [declaration_index.name(process) for process in self.index.processes]
+        self.event_names = [declaration_index.name(event) for event in self.index.events]
+        self.locations_by_process = {process: [declaration_index.name(location_id) for location_id in self.index.location_ids(process_id)]
+                                     for process, process_id in zip(self.process_names, self.index.processes)}
+        self.edges_and_locations = list(AST_tools.find_declarations(tree, "edge_declaration", "location_declaration"))
+
+        # clock expressions in guards or invariants by index of declaration (computed on first use)
+        self.clock_exprs_by_declaration: dict[int, list[ParseTree]] = {}
+
+    def attributes(self, declaration: ParseTree, data: str) -> list[ParseTree]:
+        """
+        :param declaration: declaration of TA
+        :param data: attribute type (e.g. "provided_attribute")
+        :return: attributes of given type in attribute list of declaration
+        """
+
+        if(not isinstance(declaration.children[-1], Tree) or declaration.children[-1].data != "attributes"):
+            return []
+        return [attribute for attribute in declaration.children[-1].children if isinstance(attribute, Tree) and attribute.data == data]
+
+    def clock_exprs(self, i: int, declaration: ParseTree) -> list[ParseTree]:
+        """
+        :param i: index of edge or location declaration in system declaration
+        :param declaration: edge or location declaration
+        :return: clock expressions in guards of edge or invariants of location
+        """
+
+        if(i not in self.clock_exprs_by_declaration):
+            constraint_data = "provided_attribute" if declaration.data == "edge_declaration" else "invariant_attribute"
+            self.clock_exprs_by_declaration[i] = [expr for constraint in self.attributes(declaration, constraint_data) for expr in AST_tools.get_all_clock_exprs(self.tree, constraint)]
+        return self.clock_exprs_by_declaration[i]
+
+    def count(self, op: str) -> Counts:
+        """
+        :param op: mutation operator (not "all")
+        :return: number of mutations of given operator in total and by process
+        """
+
+        tree, index = self.tree, self.index
+        process_names, event_names, locations_by_process, edges_and_locations = self.process_names, self.event_names, self.locations_by_process, self.edges_and_locations
+        counts = Counts()
+
+        def process_of(declaration: ParseTree) -> list[str]:
+            return [declaration_index.name(declaration.children[2])]
+
+        # sync constraints in order of declaration (skipping colons)
+        def constraints_of_sync(sync: ParseTree) -> list[ParseTree]:
+            return sync.children[2].children[::2]
+
+        def processes_of_sync(sync: ParseTree) -> list[str]:
+            return [declaration_index.name(constraint.children[0]) for constraint in constraints_of_sync(sync)]
+
+        def other_events(event: ParseTree) -> int:
+            return sum(1 for other_event in index.events if other_event != event)
+
+        match op:
+            case "change_event":
+                for _, edge in index.edges:
+                    counts.add(other_events(edge.children[8]), process_of(edge))
+            case "change_constraint_cmp":
+                for i, declaration in edges_and_locations:
+                    counts.add((len(operators.cmps) - 1) * len(self.clock_exprs(i, declaration)), process_of(declaration))
+            case "change_constraint_clock":
+                clocks = index.clock_ids
+                for i, declaration in edges_and_locations:
+                    count = 0
+                    for expr in self.clock_exprs(i, declaration):
+                        # positions of clocks that may be exchanged (see operators.change_constraint_clock)
+                        positions = [(0, 0), (2, 0)] + [(idx_in_expr, 2) for idx_in_expr in (0, 2) if 1 < len(expr.children[idx_in_expr].children)]
+                        for idx_in_expr, idx_in_term in positions:
+                            old_clock = expr.children[idx_in_expr].children[idx_in_term]
+                            if(not AST_tools.is_clock_expr(tree, old_clock)):
+                                continue
+                            is_without_index = isinstance(old_clock, Tree) and len(old_clock.children) == 1
+                            count = count + sum(1 for clock in clocks if not(clock == old_clock or (is_without_index and clock.children[0] == old_clock.children[0])))
+                    counts.add(count, process_of(declaration))
+            case "decrease_constraint_constant" | "increase_constraint_constant":
+                for i, declaration in edges_and_locations:
+                    counts.add(len(self.clock_exprs(i, declaration)), process_of(declaration))
+            case "invert_reset":
+                clocks = index.clock_ids
+                for _, edge in index.edges:
+                    # every reset of a clock is removed, every clock that is not reset is added
+                    reset_clocks = set()
+                    count = 0
+                    for do_attribute in self.attributes(edge, "do_attribute"):
+                        for assignment in do_attribute.find_data("int_assignment"):
+                            assigned = assignment.children[0]
+                            is_without_index = isinstance(assigned, Tree) and len(assigned.children) == 1
+                            for j, clock in enumerate(clocks):
+                                if(clock == assigned or (is_without_index and clock.children[0] == assigned.children[0])):
+                                    reset_clocks.add(j)
+                                    count = count + 1
+                    counts.add(count + len(clocks) - len(reset_clocks), process_of(edge))
+            case "invert_committed_location" | "invert_urgent_location":
+                for _, location in AST_tools.find_declarations(tree, "location_declaration"):
+                    counts.add(1, process_of(location))
+            case "negate_guard":
+                # guards of a transition are combined, so there is one mutation for every transition with a clock expression in its guards
+                for i, edge in index.edges:
+                    counts.add(1 if len(self.clock_exprs(i, edge)) > 0 else 0, process_of(edge))
+            case "add_location":
+                for process in process_names:
+                    counts.add(len(index.edges_by_process.get(process, [])), [process])
+            case "add_transition":
+                # transitions are only added if there is a transition to be cloned and an event declaration to add the dummy event before
+                if(len(index.edges) > 0 and len(index.events) > 0):
+                    for process in process_names:
+                        locations = locations_by_process[process]
+                        counts.add(sum(1 for source in locations for target in locations if (process, source, target) not in index.edges_by_source_and_target), [process])
+            case "change_transition_source" | "change_transition_target":
+                for _, edge in index.edges:
+                    counts.add(len(locations_by_process.get(declaration_index.name(edge.children[2]), [])) - 1, process_of(edge))
+            case "remove_location":
+                for _, location in AST_tools.find_declarations(tree, "location_declaration"):
+                    counts.add(0 if len(self.attributes(location, "initial_attribute")) > 0 else 1, process_of(location))
+            case "remove_transition":
+                for _, edge in index.edges:
+                    counts.add(1, process_of(edge))
+            case "add_sync":
+                # every process takes part in the new synchronisation with one of the events or not at all, at least two processes take part
+                processes, events = len(process_names), len(event_names)
+                counts.add((events + 1) ** processes - 1 - processes * events, [])
+                for process in process_names:
+                    counts.add(events * ((events + 1) ** (processes - 1) - 1), [process], in_total = False)
+
+                # existing synchronisations are not added again
+                # (these are synchronisations of at least two processes in order of declaration without weak sync constraints)
+                process_indices = {process: p for p, process in enumerate(process_names)}
+                existing_syncs = set()
+                for _, sync in index.syncs:
+                    constraints = constraints_of_sync(sync)
+                    pairs = tuple((declaration_index.name(constraint.children[0]), declaration_index.name(constraint.children[2])) for constraint in constraints)
+                    indices = [process_indices.get(process, -1) for process, _ in pairs]
+                    if(len(pairs) > 1 and all(len(constraint.children) == 3 for constraint in constraints) and all(event in event_names for _, event in pairs)
+                       and -1 not in indices and indices == sorted(set(indices))):
+                        existing_syncs.add(pairs)
+                for pairs in existing_syncs:
+                    counts.add(-1, [process for process, _ in pairs])
+            case "add_sync_constraint":
+                for _, sync in index.syncs:
+                    ids = set(declaration_index.name(node) for node in sync.find_data("id"))
+                    new_processes = [process for process in process_names if process not in ids]
+                    counts.add(len(event_names) * len(new_processes), processes_of_sync(sync))
+                    for process in new_processes:
+                        counts.add(len(event_names), [process], in_total = False)
+            case "change_sync_event":
+                for _, sync in index.syncs:
+                    counts.add(sum(other_events(constraint.children[2]) for constraint in constraints_of_sync(sync)), processes_of_sync(sync))
+            case "invert_sync_weakness":
+                for _, sync in index.syncs:
+                    counts.add(len(processes_of_sync(sync)), processes_of_sync(sync))
+            case "remove_sync":
+                for _, sync in index.syncs:
+                    counts.add(1, processes_of_sync(sync))
+            case "remove_sync_constraint":
+                for _, sync in index.syncs:
+                    processes = processes_of_sync(sync)
+                    # sync constraints are only removed from synchronisations with more than two of them
+                    counts.add(len(processes) if len(processes) > 2 else 0, processes)
+            case _:
+                raise ValueError("Unknown mutation operator.")
+
+        return counts
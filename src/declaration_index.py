@@ -0,0 +1,204 @@
+import threading
+import weakref
+
+from lark import ParseTree, Token, Tree
+
+class DeclarationIndex:
+    """
+    Index over the declarations of a TA, built in a single pass over the system declaration.
+    Declarations are stored together with their index in the system declaration (in order of declaration), identifiers are looked up by name.
+    The types of all ids are resolved once, so clock expressions can be detected by lookup.
+    """
+
+    def __init__(self, tree: ParseTree):
+        """
+        :param tree: AST of TA to be indexed
+        """
+
+        # ids of processes and events
+        self.processes: list[ParseTree] = []
+        self.events: list[ParseTree] = []
+        # ids of clocks together with their size
+        self.clocks: list[tuple[ParseTree, int]] = []
+        # location declarations by process name
+        self.locations: dict[str, list[tuple[int, ParseTree]]] = {}
+        # edge declarations, also by process name, by names of process, source and target location and by names of process and incident location
+        self.edges: list[tuple[int, ParseTree]] = []
+        self.edges_by_process: dict[str, list[tuple[int, ParseTree]]] = {}
+        self.edges_by_source_and_target: dict[tuple[str, str, str], list[tuple[int, ParseTree]]] = {}
+        self.edges_by_location: dict[tuple[str, str], list[tuple[int, ParseTree]]] = {}
+        # sync declarations
+        self.syncs: list[tuple[int, ParseTree]] = []
+        # names of all ids occurring in TA
+        self.ids: set[str] = set(name(node) for node in tree.find_data("id"))
+        # type ("clock" or "int") of all declared clock and int variables by name
+        self.id_types: dict[str, str] = {}
+
+        for i, declaration in enumerate(tree.children):
+            if(not isinstance(declaration, Tree)):
+                continue
+
+            match declaration.data:
+                case "process_declaration":
+                    self.processes.append(declaration.children[2])
+                case "event_declaration":
+                    self.events.append(declaration.children[2])
+                case "clock_declaration":
+                    self.clocks.append((declaration.children[4], int(str(declaration.children[2]))))
+                    self.id_types[name(declaration.children[4])] = "clock"
+                case "int_declaration":
+                    self.id_types[name(declaration.children[10])] = "int"
+                case "location_declaration":
+                    self.locations.setdefault(name(declaration.children[2]), []).append((i, declaration))
+                case "edge_declaration":
+                    process, source, target = (name(declaration.children[j]) for j in (2, 4, 6))
+                    self.edges.append((i, declaration))
+                    self.edges_by_process.setdefault(process, []).append((i, declaration))
+                    self.edges_by_source_and_target.setdefault((process, source, target), []).append((i, declaration))
+                    self.edges_by_location.setdefault((process, source), []).append((i, declaration))
+                    if(source != target):
+                        self.edges_by_location.setdefault((process, target), []).append((i, declaration))
+                case "sync_declaration":
+                    self.syncs.append((i, declaration))
+
+        # all valid clock ids, including all valid indices
+        self.clock_ids: list[ParseTree] = []
+        for clock_id, size in self.clocks:
+            for i in range(size):
+                self.clock_ids.append(Tree(Token('RULE', 'int_or_clock_id'), 
+                                      [clock_id, Token('LEFT_BRACKET_TOK', '['),
+                                       Tree(Token('RULE', 'int_term'), [Token('SIGNED_INT', i)]), 
+                                       Token('RIGHT_BRACKET_TOK', ']')]))
+
+        # names of all clocks whose value is read (i.e. that occur anywhere except in their declaration or on the left hand side of an assignment)
+        not_read = set(id(clock_id) for clock_id, _ in self.clocks)
+        not_read.update(id(assignment.children[0].children[0]) for assignment in tree.find_data("int_assignment"))
+        self.read_clocks: set[str] = set(name(node) for node in tree.find_data("id") if id(node) not in not_read and self.id_type(node) == "clock")
+
+        # resolve once for every node of the AST whether it contains a clock id (subtrees are visited before their parents)
+        self.contains_clock_by_node: dict[int, bool] = {}
+        for node in tree.iter_subtrees():
+            if(node.data == "id"):
+                self.contains_clock_by_node[id(node)] = self.id_type(node) == "clock"
+            else:
+                self.contains_clock_by_node[id(node)] = any(isinstance(child, Tree) and self.contains_clock_by_node[id(child)] for child in node.children)
+
+    def id_type(self, id: ParseTree) -> str:
+        """
+        Returns type of variable with given id.
+
+        :param id: id node
+        :return: "clock" or "int" if id is declared as clock or int variable, "unknown" otherwise
+        """
+
+        return self.id_types.get(name(id), "unknown")
+
+    def contains_clock(self, node: ParseTree | Token) -> bool:
+        """
+        Determines whether given node contains a clock id.
+        Constant time for nodes of the indexed AST, other nodes (e.g. of altered copies) are searched for clock ids.
+
+        :param node: node to be checked
+        :return: True iff node contains a clock id
+        """
+
+        if(isinstance(node, Token)):
+            return False
+
+        result = self.contains_clock_by_node.get(id(node))
+        if(result is None):
+            result = any(self.id_type(child) == "clock" for child in node.find_data("id"))
+
+        return result
+
+    def location_ids(self, process: ParseTree) -> list[ParseTree]:
+        """
+        Returns ids of all locations of given process.
+
+        :param process: id of process
+        :return: list of location ids (in order of declaration)
+        """
+
+        return [location.children[4] for _, location in self.locations.get(name(process), [])]
+
+    def fresh_id(self, prefix: str) -> str:
+        """
+        Returns an id name that does not occur in the TA.
+
+        :param prefix: preferred name, a number is appended if it already occurs
+        :return: fresh id name
+        """
+
+        if(prefix not in self.ids):
+            return prefix
+
+        i = 0
+        while(f"{prefix}_{i}" in self.ids):
+            i = i + 1
+        return f"{prefix}_{i}"
+
+def name(id: ParseTree) -> str:
+    """
+    Returns name of given id node.
+
+    :param id: id node
+    :return: name of id
+    """
+
+    return str(id.children[0])
+
+def location_label(location: ParseTree) -> str:
+    """
+    :param location: location declaration
+    :return: names of process and location in TChecker syntax (e.g. P:l)
+    """
+
+    return f"{name(location.children[2])}:{name(location.children[4])}"
+
+def edge_label(edge: ParseTree) -> str:
+    """
+    :param edge: edge declaration
+    :return: names of process, source location, target location and event in TChecker syntax (e.g. P:l0:l1:e)
+    """
+
+    return ":".join(name(edge.children[j]) for j in (2, 4, 6, 8))
+
+def sync_label(sync: ParseTree) -> str:
+    """
+    :param sync: sync declaration
+    :return: sync constraints in TChecker syntax (e.g. P1@e:P2@e?)
+    """
+
+    return ":".join(f"{name(constraint.children[0])}@{name(constraint.children[2])}" + ("?" if len(constraint.children) > 3 else "")
+                    for constraint in sync.children[2].children[::2])
+
+def sync_processes(sync: ParseTree) -> tuple[str, ...]:
+    """
+    :param sync: sync declaration
+    :return: names of processes taking part in synchronisation (in order of sync constraints)
+    """
+
+    return tuple(name(constraint.children[0]) for constraint in sync.children[2].children[::2])
+
+# indices of all ASTs that are still alive by id of AST (ASTs compare and hash by structure, so they can not be keys themselves),
+# an index is dropped when its AST is collected (the index itself does not reference the root of the AST)
+_indices: dict[int, DeclarationIndex] = {}
+_indices_lock = threading.Lock()
+
+def get(tree: ParseTree) -> DeclarationIndex:
+    """
+    Returns index over the declarations of given TA.
+    Every AST is only indexed once, so all operators applied to the same AST share one index, also if they are applied to several ASTs alternately or from several threads.
+
+    :param tree: AST of TA
+    :return: index over declarations of TA
+    """
+
+    with _indices_lock:
+        index = _indices.get(id(tree))
+        if(index is None):
+            index = DeclarationIndex(tree)
+            _indices[id(tree)] = index
+            weakref.finalize(tree, _indices.pop, id(tree), None)
+
+    return index
@@ -0,0 +1,140 @@
+import AST_tools
+
+import json
+
+from typing import NamedTuple
+
+from lark import ParseTree, Token, Tree
+
+class Edit(NamedTuple):
+    """
+    Single change to the AST of a TA.
+    The edited node is addressed by its child-index path from the root of the original AST.
+
+    kind is one of "replace" (exchange node at path with given node), "remove" (remove node at path) or "insert" (insert given node before node at path).
+    """
+
+    kind: str
+    path: tuple[int, ...]
+    node: ParseTree | Token | None = None
+
+class Provenance(NamedTuple):
+    """
+    Parts of the original TA affected by a mutation, recorded by the mutation operator when generating it (see declaration_index for the labels).
+    Locations are labelled by process and location name (P:l), edges by process, source, target and event (P:l0:l1:e) and synchronisations by their sync constraints (P1@e:P2@e?),
+    added declarations by their labels in the mutated TA.
+
+    attribute is the changed attribute of the affected declarations (e.g. "provided" for guards, "event" or "target"), empty if whole declarations are added or removed.
+    """
+
+    processes: tuple[str, ...] = ()
+    locations: tuple[str, ...] = ()
+    edges: tuple[str, ...] = ()
+    syncs: tuple[str, ...] = ()
+    attribute: str = ""
+
+class Mutation(NamedTuple):
+    """
+    Compact description of one mutation of a TA as the list of edits applied by a mutation operator to the original AST.
+    The provenance is not part of the description (see to_json), it is None for mutations that were not generated by an operator (see from_json).
+    """
+
+    op: str
+    edits: tuple[Edit, ...]
+    provenance: Provenance | None = None
+
+def materialize(tree: ParseTree, mutation: Mutation) -> ParseTree:
+    """
+    Applies the edits of given mutation to the original AST.
+    All paths refer to the original AST, so edits are applied in descending path order.
+    Multiple insertions at the same path end up in the order they are listed in.
+
+    :param tree: AST of original TA
+    :param mutation: mutation to be applied
+    :return: AST of mutated TA
+    """
+
+    result = AST_tools.shallow_copy(tree)
+
+    for edit in reversed(sorted(mutation.edits, key = lambda e: e.path)):
+        if(0 == len(edit.path)):
+            raise ValueError("Edit path must not be empty.")
+        idx, path_in_child = edit.path[0], edit.path[1:]
+
+        # edits of declarations are applied to the copied root directly, deeper edits copy the path below the root
+        match edit.kind:
+            case "replace":
+                result.children[idx] = AST_tools.exchange_node_at(result.children[idx], path_in_child, edit.node)
+            case "remove" if 0 == len(path_in_child):
+                result.children.pop(idx)
+            case "remove":
+                result.children[idx] = AST_tools.remove_node_at(result.children[idx], path_in_child)
+            case "insert" if 0 == len(path_in_child):
+                result.children.insert(idx, edit.node)
+            case "insert":
+                result.children[idx] = AST_tools.insert_node_at(result.children[idx], path_in_child, edit.node)
+            case _:
+                raise ValueError(f"Unknown edit kind {edit.kind}.")
+
+    return result
+
+def node_to_json(node: ParseTree | Token) -> list | dict:
+    """
+    Converts given node into JSON compatible representation.
+    Tokens are represented as [type, value], trees as {"rule": data, "children": [...]}.
+
+    :param node: node to be converted
+    :return: JSON compatible representation of node
+    """
+
+    if(isinstance(node, Token)):
+        return [node.type, str(node.value)]
+
+    return {"rule": str(node.data), "children": [node_to_json(child) for child in node.children]}
+
+def node_from_json(value: list | dict) -> ParseTree | Token:
+    """
+    Converts JSON compatible representation created by node_to_json back into a node.
+
+    :param value: JSON compatible representation of node
+    :return: node
+    """
+
+    if(isinstance(value, list)):
+        return Token(value[0], value[1])
+
+    return Tree(Token('RULE', value["rule"]), [node_from_json(child) for child in value["children"]])
+
+def to_json(mutation: Mutation) -> str:
+    """
+    Serializes given mutation into a single line of canonical JSON (equal mutations yield equal strings).
+
+    :param mutation: mutation to be serialized
+    :return: JSON string
+    """
+
+    edits = []
+    for edit in mutation.edits:
+        json_edit = {"kind": edit.kind, "path": list(edit.path)}
+        if(edit.node is not None):
+            json_edit["node"] = node_to_json(edit.node)
+        edits.append(json_edit)
+
+    return json.dumps({"op": mutation.op, "edits": edits}, sort_keys = True, separators = (",", ":"))
+
+def from_json(line: str) -> Mutation:
+    """
+    Deserializes mutation from JSON string created by to_json.
+
+    :param line: JSON string
+    :return: mutation
+    """
+
+    value = json.loads(line)
+
+    edits = []
+    for json_edit in value["edits"]:
+        node = node_from_json(json_edit["node"]) if "node" in json_edit else None
+        edits.append(Edit(json_edit["kind"], tuple(json_edit["path"]), node))
+
+    return Mutation(value["op"], tuple(edits))
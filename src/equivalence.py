@@ -0,0 +1,139 @@
+import declaration_index
+
+from descriptors import Mutation
+from reachability import Reachability
+
+from lark import ParseTree, Token, Tree
+
+def find_equivalence_reason(tree: ParseTree, mutation: Mutation, reachability: Reachability | None = None) -> str | None:
+    """
+    Statically determines whether given mutation is equivalent to the original TA (inspired by the static detection of equivalent mutants in [2] of the README).
+    Only rules that guarantee bisimilarity are applied, so None does not imply that the mutation is not equivalent.
+
+    :param tree: AST of original TA
+    :param mutation: mutation of TA
+    :param reachability: reachable locations and edges of original TA, mutations of unreachable parts are not detected if None
+    :return: reason why mutation is equivalent to original TA, None if equivalence can not be determined statically
+    """
+
+    if(reachability is not None and only_alters_unreachable_parts(tree, mutation, reachability)):
+        return "only unreachable locations or edges are altered"
+
+    if(1 != len(mutation.edits) or "replace" != mutation.edits[0].kind or 1 != len(mutation.edits[0].path)):
+        return None
+
+    original_declaration = tree.children[mutation.edits[0].path[0]]
+    altered_declaration = mutation.edits[0].node
+
+    match mutation.op:
+        case "invert_reset":
+            return reset_equivalence_reason(tree, original_declaration, altered_declaration)
+        case "invert_urgent_location":
+            return urgent_location_equivalence_reason(tree, original_declaration)
+        case _:
+            return None
+
+def only_alters_unreachable_parts(tree: ParseTree, mutation: Mutation, reachability: Reachability) -> bool:
+    """
+    Determines whether given mutation only alters parts of the TA that are unreachable in the original and stay unreachable in the mutation.
+    This is the case if every edit replaces an unreachable location or an edge with unreachable source location by such a declaration,
+    removes an unreachable location or an edge that is never taken, or inserts such a declaration (or a newline).
+    As all reachable declarations are left unchanged, the reachable parts of original and mutation coincide.
+
+    :param tree: AST of original TA
+    :param mutation: mutation of TA
+    :param reachability: reachable locations and edges of original TA
+    :return: True iff mutation only alters unreachable parts of TA
+    """
+
+    def is_removable(declaration: ParseTree | Token) -> bool:
+        if(reachability.is_unreachable(declaration)):
+            return True
+        if(not isinstance(declaration, Tree) or "edge_declaration" != declaration.data):
+            return False
+        return not reachability.is_edge_taken(*(declaration_index.name(declaration.children[j]) for j in (2, 4, 6, 8)))
+
+    if(0 == len(mutation.edits)):
+        return False
+
+    for edit in mutation.edits:
+        if(1 != len(edit.path)):
+            return False
+
+        match edit.kind:
+            case "replace":
+                if(not reachability.is_unreachable(tree.children[edit.path[0]]) or not reachability.is_unreachable(edit.node)):
+                    return False
+            case "remove":
+                if(not is_removable(tree.children[edit.path[0]])):
+                    return False
+            case "insert":
+                if(not isinstance(edit.node, Token) and not reachability.is_unreachable(edit.node)):
+                    return False
+            case _:
+                return False
+
+    return True
+
+def reset_equivalence_reason(tree: ParseTree, original_edge: ParseTree, altered_edge: ParseTree) -> str | None:
+    """
+    Determines whether the resets of given edges only differ in clocks that are never read (i.e. that do not occur in any constraint or expression of the TA).
+
+    :param tree: AST of original TA
+    :param original_edge: edge of original TA
+    :param altered_edge: edge of mutated TA
+    :return: reason why mutation is equivalent to original TA, None if equivalence can not be determined
+    """
+
+    index = declaration_index.get(tree)
+
+    def reset_clocks(edge: ParseTree) -> set[str]:
+        reset_ids = (assignment.children[0].children[0] for assignment in edge.find_data("int_assignment"))
+        return set(declaration_index.name(id) for id in reset_ids if index.id_type(id) == "clock")
+
+    inverted_clocks = reset_clocks(original_edge) ^ reset_clocks(altered_edge)
+
+    if(0 == len(inverted_clocks) or not inverted_clocks.isdisjoint(index.read_clocks)):
+        return None
+
+    return f"inverted reset of clock {', '.join(sorted(inverted_clocks))} which is never read"
+
+def urgent_location_equivalence_reason(tree: ParseTree, location: ParseTree) -> str | None:
+    """
+    Determines whether time can not elapse in given location regardless of its urgency.
+    This is the case if the location is committed or if its invariant contains an upper bound of at most 0 for a clock.
+
+    :param tree: AST of original TA
+    :param location: location of original TA
+    :return: reason why mutation is equivalent to original TA, None if equivalence can not be determined
+    """
+
+    if(any(True for _ in location.find_data("committed_attribute"))):
+        return "location is committed"
+
+    index = declaration_index.get(tree)
+
+    def is_clock(term: ParseTree | Token) -> bool:
+        return (isinstance(term, Tree) and 1 == len(term.children) and isinstance(term.children[0], Tree)
+                and "int_or_clock_id" == term.children[0].data and "clock" == index.id_type(term.children[0].children[0]))
+
+    def is_non_positive_constant(term: ParseTree | Token) -> bool:
+        return (isinstance(term, Tree) and 1 == len(term.children) and isinstance(term.children[0], Token)
+                and "SIGNED_INT" == term.children[0].type and int(term.children[0]) <= 0)
+
+    for invariant in location.find_data("invariant_attribute"):
+        # only consider atomic expressions that are conjuncts of the invariant (i.e. not negated)
+        for atomic_expr in invariant.children[2].children:
+            if(not isinstance(atomic_expr, Tree) or not isinstance(atomic_expr.children[0], Tree) or "predicate_expr" != atomic_expr.children[0].data):
+                continue
+
+            predicate_expr = atomic_expr.children[0]
+            if(3 != len(predicate_expr.children)):
+                continue
+            left, cmp, right = predicate_expr.children
+
+            if((is_clock(left) and cmp in ["<=", "<", "=="] and is_non_positive_constant(right)) or
+               (is_non_positive_constant(left) and cmp in [">=", ">", "=="] and is_clock(right))):
+                return "invariant of location forbids delay"
+
+    return None
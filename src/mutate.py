@@ -1,20 +1,137 @@
+import bundle
+import checkpoint
+import counting
+import descriptors
+import equivalence
 import operators
+import pipeline
+import printer
+import profiling
+import reachability
+import sampling
+import slicing
 import transformers
+import verdict_cache
 from tcheckerpy.tools import tck_compare, tck_reach, tck_syntax
 
 import argparse
+import asyncio
+import glob
 import os.path
+import sys
 import lark
-import lark.reconstruct
 import csv
+import collections
+import hashlib
+import itertools
+import json
+import concurrent.futures
+import functools
+import cProfile
+import multiprocessing
+import multiprocessing.connection
+import signal
+import threading
+import time
+import tracemalloc
 
-def apply_mutation(ta_tree: lark.ParseTree, op: str, value: int) -> list[lark.ParseTree]:
+try:
+    import resource
+except ImportError:
+    # memory limits can only be enforced on Unix
+    resource = None
+
+from collections.abc import Callable, Collection, Iterable, Iterator
+
+# outputs of mutations are written to disk after this number of mutations or seconds, whichever comes first
+flush_batch_size = 100
+flush_interval = 5.0
+
+# steps of checking a mutation with TChecker in order (see check_mutation)
+check_steps = ("tck_syntax", "tck_reach", "tck_compare")
+
+op_choices = ["all",
+              "change_event",
+              "change_constraint_cmp", 
+              "change_constraint_clock", 
+              "decrease_constraint_constant",
+              "increase_constraint_constant",
+              "invert_committed_location",
+              "invert_reset",
+              "invert_urgent_location",
+              "negate_guard",
+              "add_location", 
+              "add_transition", 
+              "change_transition_source", 
+              "change_transition_target", 
+              "remove_location", 
+              "remove_transition",
+              "add_sync",
+              "add_sync_constraint",
+              "change_sync_event",
+              "invert_sync_weakness",
+              "remove_sync",
+              "remove_sync_constraint"]
+
+def find_input_files(in_ta: str) -> list[str]:
+    """
+    Determines TA files to be mutated.
+
+    :param in_ta: path to a TA file (.txt or .tck), to a directory (all .txt and .tck files in it are mutated),
+                  to a manifest file (one path to a TA file per line, relative to the manifest, lines starting with # are ignored) or a glob pattern
+    :return: paths to TA files
+    """
+
+    if(os.path.isdir(in_ta)):
+        return sorted(os.path.join(in_ta, file_name) for file_name in os.listdir(in_ta) if file_name.endswith((".txt", ".tck")))
+
+    if(os.path.isfile(in_ta)):
+        if(in_ta.endswith((".txt", ".tck"))):
+            return [in_ta]
+        with open(in_ta) as file:
+            lines = [line.strip() for line in file]
+        return [os.path.join(os.path.dirname(in_ta), line) for line in lines if len(line) > 0 and not line.startswith("#")]
+
+    return sorted(glob.glob(in_ta))
+
+def load_parser() -> lark.Lark:
+    """
+    Loads LALR parser of TChecker syntax.
+    The grammar analysis is cached in the temp directory, so the grammar is only analysed on first use. The parser can be reused for any number of TAs.
+
+    :return: parser of TA text files
+    """
+
+    return lark.Lark.open("parsing/grammar.lark", __file__, parser = "lalr", cache = True, maybe_placeholders = False)
+
+def parse_ta(ta_parser: lark.Lark, ta: str, profile: profiling.Profile | None = None) -> lark.ParseTree:
+    """
+    Parses TA and simplifies complex expressions in its AST, as expected by the mutation operators.
+
+    :param ta_parser: parser of TChecker syntax (see load_parser)
+    :param ta: TA in TChecker syntax
+    :param profile: profile to record resource usage of parsing and simplification in
+    :return: simplified AST of TA
+    """
+
+    profile = profile or profiling.Profile()
+
+    # parse input TA text file to AST
+    with profile.stage("parse"):
+        ta_tree = ta_parser.parse(ta)
+
+    # simplify complex expressions in AST
+    with profile.stage("simplify_expressions"):
+        return transformers.SimplifyExpressions().transform(ta_tree)
+
+def apply_mutation(ta_tree: lark.ParseTree, op: str, value: int) -> Iterator[descriptors.Mutation]:
     """
     Applies mutation operator to given TA.
+    Mutations are computed lazily and described by their edits to the original AST, they can be turned into an AST with descriptors.materialize.
 
     :param ta_tree: AST of TA to be mutated
     :param op: mutation operator to be used
-    :return: list of mutations as AST
+    :return: iterator over mutation descriptors
     """ 
 
     # mutate AST
@@ -64,30 +181,294 @@ def apply_mutation(ta_tree: lark.ParseTree, op: str, value: int) -> list[lark.Pa
         case _:
             raise ValueError("Unknown mutation operator.")
 
-if "__main__" == __name__:
+def generate_mutations(ta_tree: lark.ParseTree, op: str, value: int, sample: int | None = None, seed: int = 0, stratify: str | None = None) -> Iterator[descriptors.Mutation]:
+    """
+    Generates all mutations of TA by given operator (see apply_mutation) or a random sample of them (see sampling.sample).
+
+    :param ta_tree: AST of TA to be mutated
+    :param op: mutation operator to be used (not "all")
+    :param value: value to decrease/increase constants by
+    :param sample: number of mutations to be drawn, all mutations are generated if None
+    :param seed: seed for drawing mutations
+    :param stratify: draw mutations evenly across the processes ("process") or declarations ("declaration") they alter, uniformly if None
+    :return: iterator over mutation descriptors
+    """
+
+    mutations = apply_mutation(ta_tree, op, value)
+    if(sample is not None):
+        mutations = sampling.sample(ta_tree, op, mutations, sample, seed, stratify)
+    return mutations
+
+def materialize_mutations(original_ta: str, ta_tree: lark.ParseTree, mutations: Iterable[descriptors.Mutation], op: str, ta_printer: printer.Printer,
+                          reachable_parts: reachability.Reachability | None = None, dependencies: slicing.ProcessDependencies | None = None,
+                          profile: profiling.Profile | None = None) -> Iterator[tuple[str, str | None, tuple[str, str], descriptors.Mutation]]:
+    """
+    Reconstructs TA text from mutated ASTs and determines how each mutation is checked.
+    Mutations that are statically known to be equivalent to the original are not checked (see equivalence.find_equivalence_reason).
+    If process dependencies are given, mutations are checked on the slices of the processes they affect (see slicing.independent_slices).
+
+    :param original_ta: original TA in TChecker syntax
+    :param ta_tree: AST of original TA
+    :param mutations: mutations of TA
+    :param op: mutation operator of given mutations (only used for profiling)
+    :param ta_printer: printer of original AST
+    :param reachable_parts: reachable locations and edges of original TA, mutations of unreachable parts are not detected if None
+    :param dependencies: dependencies between processes of original TA, whole TAs are checked if None
+    :param profile: profile to record resource usage of all stages in
+    :return: iterator over tuples of mutated TA in TChecker syntax, reason why it is equivalent to the original (None if unknown),
+             pair of original and mutated TA to be checked (see check_mutations) and mutation
+    """
+
+    profile = profile or profiling.Profile()
+    original_text = ta_printer.to_text(ta_tree)
+
+    for mutation in profile.iterate(mutations, "generate", op):
+        with profile.stage("materialize", op):
+            out_ta_tree = descriptors.materialize(ta_tree, mutation)
+            out_ta = ta_printer.to_text(out_ta_tree)
+
+        with profile.stage("static_equivalence", op):
+            reason = "identical to original" if out_ta == original_text else equivalence.find_equivalence_reason(ta_tree, mutation, reachable_parts)
+
+        checked_tas = (original_ta, out_ta)
+        if(dependencies is not None and reason is None):
+            with profile.stage("slicing", op):
+                slices = slicing.independent_slices(ta_tree, out_ta_tree, mutation, dependencies)
+                if(slices is not None):
+                    checked_tas = (ta_printer.to_text(slices[0]), ta_printer.to_text(slices[1]))
+
+        yield out_ta, reason, checked_tas, mutation
+
+def remove_duplicates(mutated_tas: Iterable[tuple[str, ...]], fingerprints: set[bytes]) -> Iterator[tuple[str, ...]]:
+    """
+    Yields given mutations of TA, skipping every mutation that is textually identical to a previous one.
+    Mutations are identified by a hash of their text. Fingerprints of all yielded mutations are added to given set, so duplicates are also removed across multiple calls sharing the set.
+
+    :param mutated_tas: tuples of mutated TA in TChecker syntax and further information on the mutation (see check_mutations)
+    :param fingerprints: fingerprints of mutations already yielded
+    :return: iterator over given tuples without duplicates
+    """
+
+    for mutated_ta in mutated_tas:
+        fingerprint = hashlib.sha256(mutated_ta[0].encode()).digest()
+        if(fingerprint in fingerprints):
+            continue
+        fingerprints.add(fingerprint)
+        yield mutated_ta
+
+def check_mutation(original_ta: str, mutated_ta: str, timings: dict[str, dict[str, float]] | None = None, steps: Collection[str] = check_steps) -> bool | None:
+    """
+    Checks given mutation of TA with TChecker.
+    The check consists of the steps in check_steps, which can also be run separately (e.g. in the stages of pipeline.check_mutations).
 
-    op_choices = ["all",
-                  "change_event",
-                  "change_constraint_cmp", 
-                  "change_constraint_clock", 
-                  "decrease_constraint_constant",
-                  "increase_constraint_constant",
-                  "invert_committed_location",
-                  "invert_reset",
-                  "invert_urgent_location",
-                  "negate_guard",
-                  "add_location", 
-                  "add_transition", 
-                  "change_transition_source", 
-                  "change_transition_target", 
-                  "remove_location", 
-                  "remove_transition",
-                  "add_sync",
-                  "add_sync_constraint",
-                  "change_sync_event",
-                  "invert_sync_weakness",
-                  "remove_sync",
-                  "remove_sync_constraint"]
+    :param original_ta: original TA in TChecker syntax
+    :param mutated_ta: mutated TA in TChecker syntax
+    :param timings: resource usage of the TChecker tools is added to this dict if given (see profiling.measure)
+    :param steps: steps of the check to be run
+    :return: None if mutation is semantically faulty (i.e. there is an out-of-bounds array access/value), otherwise True iff mutation is bisimilar to original
+             (True if tck_compare is not among the steps)
+    :raises RuntimeError: if mutated TA contains syntax errors
+    :raises MemoryError: if a TChecker tool runs out of memory (e.g. due to a memory limit, see limited_check_mutation)
+    """
+
+    # assert that mutated TA does not contain syntax errors
+    if("tck_syntax" in steps):
+        with profiling.measure(timings, "tck_syntax"):
+            tck_syntax.check(mutated_ta)
+
+    # mutation is semantically faulty if reachability check fails
+    if("tck_reach" in steps):
+        try:
+            with profiling.measure(timings, "tck_reach"):
+                tck_reach.reach(mutated_ta, tck_reach.Algorithm.REACH)
+        except Exception as error:
+            # running out of memory does not imply that the mutation is faulty
+            if(is_out_of_memory(error)):
+                raise MemoryError(str(error))
+            return None
+
+    if("tck_compare" not in steps):
+        return True
+
+    # check whether mutation is bisimilar to original
+    with profiling.measure(timings, "tck_compare"):
+        try:
+            is_bisimilar_to_original, _, _ = tck_compare.compare(original_ta, mutated_ta)
+        except RuntimeError as error:
+            if(is_out_of_memory(error)):
+                raise MemoryError(str(error))
+            raise
+
+    return is_bisimilar_to_original
+
+def is_out_of_memory(error: Exception) -> bool:
+    """
+    :param error: error raised by a TChecker tool
+    :return: True iff the error was caused by running out of memory
+    """
+
+    return isinstance(error, MemoryError) or "bad_alloc" in str(error) or "Cannot allocate memory" in str(error)
+
+def timed_check_mutation(original_ta: str, mutated_ta: str, steps: Collection[str] = check_steps) -> tuple[bool | None, dict[str, dict[str, float]]]:
+    """
+    Checks given mutation of TA with TChecker (see check_mutation) and measures the resource usage of the TChecker tools.
+
+    :param original_ta: original TA in TChecker syntax
+    :param mutated_ta: mutated TA in TChecker syntax
+    :param steps: steps of the check to be run
+    :return: pair of result of check_mutation and resource usage by TChecker tool
+    """
+
+    timings = {}
+    return check_mutation(original_ta, mutated_ta, timings, steps), timings
+
+def run_limited_check(connection: multiprocessing.connection.Connection, original_ta: str, mutated_ta: str, memory_limit: int | None, steps: Collection[str] = check_steps) -> None:
+    """
+    Checks given mutation of TA (see timed_check_mutation) in a worker process started by limited_check_mutation and sends the outcome through given connection.
+
+    :param connection: connection to process that started the worker
+    :param original_ta: original TA in TChecker syntax
+    :param mutated_ta: mutated TA in TChecker syntax
+    :param memory_limit: maximum virtual memory of the worker and the TChecker tools it calls in megabytes (no limit if None)
+    :param steps: steps of the check to be run
+    """
+
+    # start new process group, so the TChecker tools called by the worker are killed together with it
+    os.setsid()
+    if(memory_limit is not None):
+        limit = memory_limit * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+    try:
+        connection.send(("result", timed_check_mutation(original_ta, mutated_ta, steps)))
+    except MemoryError:
+        connection.send(("memory limit", None))
+    except Exception as error:
+        connection.send(("error", str(error)))
+
+def limited_check_mutation(original_ta: str, mutated_ta: str, timeout: float | None = None, memory_limit: int | None = None,
+                           steps: Collection[str] = check_steps) -> tuple[bool | str | None, dict[str, dict[str, float]]]:
+    """
+    Checks given mutation of TA with TChecker (see timed_check_mutation) in an isolated worker process with given wall-clock and memory limits.
+    The worker and the TChecker tools it calls are killed if the check exceeds the timeout.
+
+    :param original_ta: original TA in TChecker syntax
+    :param mutated_ta: mutated TA in TChecker syntax
+    :param timeout: maximum wall-clock time of the check in seconds (no limit if None)
+    :param memory_limit: maximum virtual memory of the check in megabytes (no limit if None)
+    :param steps: steps of the check to be run
+    :return: pair of result of check_mutation ("timeout" or "memory limit" if the check exceeded a limit) and resource usage by TChecker tool
+             (wall time until the check was stopped as "exceeded_limit" if it exceeded a limit)
+    :raises RuntimeError: if mutated TA contains syntax errors
+    :raises ValueError: if a memory limit is given on a platform without memory limits (i.e. not on Unix)
+    """
+
+    if(memory_limit is not None and resource is None):
+        raise ValueError("Memory limits are only supported on Unix.")
+
+    if(timeout is None and memory_limit is None):
+        return timed_check_mutation(original_ta, mutated_ta, steps)
+
+    # checks exceeding a limit report the wall time until they were stopped instead of the resource usage of the TChecker tools
+    start = time.perf_counter()
+    def exceeded_limit(limit: str) -> tuple[str, dict[str, dict[str, float]]]:
+        return limit, {"exceeded_limit": profiling.new_usage() | {"calls": 1, "wall_time": time.perf_counter() - start}}
+
+    receiver, sender = multiprocessing.Pipe(duplex = False)
+    worker = multiprocessing.Process(target = run_limited_check, args = (sender, original_ta, mutated_ta, memory_limit, steps), daemon = True)
+    worker.start()
+    sender.close()
+
+    try:
+        if(not receiver.poll(timeout)):
+            try:
+                os.killpg(worker.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                # worker has not started its process group yet
+                worker.kill()
+            return exceeded_limit("timeout")
+        outcome, value = receiver.recv()
+    except EOFError:
+        # worker was killed without reporting (e.g. by the operating system when running out of memory)
+        outcome, value = "memory limit" if memory_limit is not None else "error", "Worker checking mutation terminated unexpectedly."
+    finally:
+        worker.join()
+        receiver.close()
+
+    if("result" == outcome):
+        return value
+    if("memory limit" == outcome):
+        return exceeded_limit("memory limit")
+    raise RuntimeError(value)
+
+def check_mutations(original_ta: str | None, mutated_tas: Iterable[tuple[str, str | None, tuple[str, str] | None]], executor: concurrent.futures.Executor | None = None, max_pending: int = 1,
+                    cache: verdict_cache.VerdictCache | None = None, timeout: float | None = None, memory_limit: int | None = None) -> Iterator[tuple[str, bool | str | None, str | None, dict[str, dict[str, float]]]]:
+    """
+    Checks given mutations of TA with TChecker (see check_mutation).
+    Mutations that are known to be equivalent to the original are not checked, they are reported as bisimilar.
+    If a pair of TAs to be checked instead is given for a mutation (e.g. slices of original and mutated TA), this pair is checked.
+    If a cache is given, cached results are reused and results of new checks are added to the cache.
+    If a timeout or memory limit is given, every check is run in an isolated worker process with these limits (see limited_check_mutation), checks exceeding a limit are not cached.
+    If an executor is given, up to max_pending mutations are checked concurrently. 
+    Results are always yielded in order of given mutations, so the output does not depend on the number of workers.
+
+    :param original_ta: original TA in TChecker syntax (only needed for mutations without a pair of TAs to be checked instead)
+    :param mutated_tas: triples of mutated TA in TChecker syntax, reason why it is equivalent to the original (None if unknown) and
+                        pair of original and mutated TA to be checked instead (None if whole TAs are checked)
+    :param executor: executor to run checks in, checks are run sequentially if None
+    :param max_pending: maximum number of mutations submitted to executor but not yet yielded
+    :param cache: cache of results of previous checks
+    :param timeout: maximum wall-clock time of every check in seconds (no limit if None)
+    :param memory_limit: maximum virtual memory of every check in megabytes (no limit if None)
+    :return: iterator over tuples of mutated TA, result of check_mutation (True if mutation is known to be equivalent, "timeout" or "memory limit" if a limit was exceeded),
+             reason of equivalence and resource usage of the TChecker tools (empty if mutation was not checked, see timed_check_mutation)
+    """
+
+    def done(result: bool | str | None, timings: dict[str, dict[str, float]] = {}) -> concurrent.futures.Future:
+        future = concurrent.futures.Future()
+        future.set_result((result, timings))
+        return future
+
+    # returns future result of checking mutation and whether the result is new (i.e. needs to be cached)
+    def submit(checked_tas: tuple[str, str], reason: str | None) -> tuple[concurrent.futures.Future, bool]:
+        if(reason is not None):
+            return done(True), False
+        if(cache is not None):
+            try:
+                return done(cache.get(*checked_tas)), False
+            except KeyError:
+                pass
+        if(executor is None):
+            return done(*limited_check_mutation(*checked_tas, timeout, memory_limit)), True
+        return executor.submit(limited_check_mutation, *checked_tas, timeout, memory_limit), True
+
+    def result(checked_tas: tuple[str, str], future: concurrent.futures.Future, is_new: bool) -> tuple[bool | str | None, dict[str, dict[str, float]]]:
+        is_bisimilar_to_original, timings = future.result()
+        # results of checks exceeding a limit are unknown and may differ with other limits
+        if(cache is not None and is_new and not isinstance(is_bisimilar_to_original, str)):
+            cache.put(*checked_tas, is_bisimilar_to_original)
+        return is_bisimilar_to_original, timings
+
+    if(executor is None):
+        max_pending = 1
+
+    pending = collections.deque()
+    for mutated_ta, reason, checked_tas in mutated_tas:
+        checked_tas = checked_tas or (original_ta, mutated_ta)
+        pending.append((mutated_ta, reason, checked_tas, *submit(checked_tas, reason)))
+
+        # wait for oldest check if too many checks are pending
+        if(len(pending) >= max_pending):
+            mutated_ta, reason, checked_tas, future, is_new = pending.popleft()
+            is_bisimilar_to_original, timings = result(checked_tas, future, is_new)
+            yield mutated_ta, is_bisimilar_to_original, reason, timings
+
+    while(len(pending) > 0):
+        mutated_ta, reason, checked_tas, future, is_new = pending.popleft()
+        is_bisimilar_to_original, timings = result(checked_tas, future, is_new)
+        yield mutated_ta, is_bisimilar_to_original, reason, timings
+
+if "__main__" == __name__:
 
     # input
     parser = argparse.ArgumentParser()
@@ -96,7 +477,8 @@ if "__main__" == __name__:
         "--in_ta",
         type = str,
         required = True,
-        help = "Timed automaton to be mutated. Must be .txt or .tck file in valid TChecker syntax."
+        help = "Timed automaton to be mutated. Must be .txt or .tck file in valid TChecker syntax. " +
+               "For batch mode, a directory, a manifest file (one path per line) or a quoted glob pattern of TA files can be given, the output of every TA is written to a subdirectory of the output directory."
     )
     parser.add_argument(
         "--out_dir",
@@ -117,9 +499,100 @@ if "__main__" == __name__:
         required = False,
         help = "Value to decrease/increase constants by (for operators decrease_constraint_constant and increase_constraint_constant). Must be positive integer. Default is 1." 
     )
+    parser.add_argument(
+        "--jobs",
+        type = int,
+        default = 1,
+        help = "Number of worker processes used to check mutations in parallel. The written mutations do not depend on the number of workers (their numbering follows the order in which checks complete). Default is 1."
+    )
+    parser.add_argument(
+        "--bundle",
+        action = "store_true",
+        help = "Write all mutations to a single compressed file mutations.jsonl.gz with an index mutations.jsonl.gz.index.csv in the output directory instead of one file per mutation."
+    )
+    parser.add_argument(
+        "--sample",
+        type = int,
+        help = "Only generate given number of randomly drawn mutations per operator instead of all mutations. Drawn mutations that are textually identical to previously generated ones are still dropped (see --keep_duplicates)."
+    )
+    parser.add_argument(
+        "--seed",
+        type = int,
+        default = 0,
+        help = "Seed for drawing mutations (see --sample). Equal seeds yield equal mutations. Default is 0."
+    )
+    parser.add_argument(
+        "--stratify",
+        type = str,
+        choices = list(sampling.strata.keys()),
+        help = "Draw mutations (see --sample) evenly across the processes or declarations (e.g. locations and edges) they alter instead of uniformly."
+    )
+    parser.add_argument(
+        "--timeout",
+        type = float,
+        help = "Maximum wall-clock time in seconds for checking a single mutation with TChecker. Mutations exceeding it are written to unknown_mutations in the output directory and logged as unknown. By default, there is no limit."
+    )
+    parser.add_argument(
+        "--memory_limit",
+        type = int,
+        help = "Maximum memory in megabytes for checking a single mutation with TChecker (Unix only). Mutations exceeding it are written to unknown_mutations in the output directory and logged as unknown. By default, there is no limit."
+    )
+    parser.add_argument(
+        "--keep_duplicates",
+        action = "store_true",
+        help = "Check and write mutations that are textually identical to a previously generated mutation (of any operator). By default, such duplicates are dropped before checking."
+    )
+    parser.add_argument(
+        "--cache",
+        type = str,
+        nargs = "?",
+        const = "",
+        help = "Cache results of checking mutations in given SQLite database file and reuse them in later runs. Default file is verdict_cache.sqlite in the output directory."
+    )
+    parser.add_argument(
+        "--cache_size",
+        type = int,
+        default = 1000000,
+        help = "Maximum number of results kept in cache, least recently used results are evicted. Default is 1000000."
+    )
+    parser.add_argument(
+        "--incremental",
+        action = "store_true",
+        help = "Check mutations only on the processes they alter and all processes depending on them (if the remaining processes can not interfere) and cache results (see --cache), " +
+               "so results for mutations of unaltered processes are reused after editing other processes of the TA."
+    )
+    parser.add_argument(
+        "--checkpoint",
+        action = "store_true",
+        help = "Record progress in checkpoint.jsonl in the output directory and write all outputs to disk before recording them, so an interrupted run can be resumed (see --resume)."
+    )
+    parser.add_argument(
+        "--resume",
+        action = "store_true",
+        help = "Resume an interrupted run with the same input TA and arguments in the same output directory (recorded with --checkpoint). Mutations that were already processed are skipped. Implies --checkpoint."
+    )
+    parser.add_argument(
+        "--profile",
+        action = "store_true",
+        help = "Write wall time, CPU time and peak memory of all stages per operator to profile.json and the times of the TChecker tools for every checked mutation to check_timings.csv in the output directory."
+    )
+    parser.add_argument(
+        "--cprofile",
+        type = str,
+        help = "Profile run with cProfile and write statistics to given file (readable with pstats)."
+    )
+    parser.add_argument(
+        "--count_only",
+        action = "store_true",
+        help = "Only write the number of mutations per operator and per process to mutation_counts.csv in the output directory, computed from the declarations of the TA without generating or checking any mutation."
+    )
+    parser.add_argument(
+        "--descriptors_only",
+        action = "store_true",
+        help = "Only write descriptors of all mutations to mutation_descriptors.jsonl in the output directory (one JSON object per line) without materializing or checking them."
+    )
 
     args = parser.parse_args()
-    in_file = args.in_ta
     out_dir = args.out_dir
     op = args.op
 
@@ -130,82 +603,342 @@ if "__main__" == __name__:
     else:
         value = 1
 
-    os.makedirs(out_dir, exist_ok=True)
-    
-    with open(in_file) as file:
-        in_ta = file.read()
+    if(args.jobs < 1):
+        raise ValueError("Number of jobs must be positive.")
 
-    # assert that input TA file does not contain syntax errors
-    tck_syntax.check(in_ta)
+    if(args.sample is not None and args.sample < 0):
+        raise ValueError("Sample size must not be negative.")
+    if(args.sample is None and (args.stratify is not None)):
+        raise Warning("Stratification is only used for sampling and will be omitted.")
 
-    # parse input TA text file to AST
-    ta_parser = lark.Lark.open("parsing/grammar.lark", __file__)
-    ta_parser.options.maybe_placeholders = False
-    in_ta_tree = ta_parser.parse(in_ta)
+    if(args.timeout is not None and args.timeout <= 0):
+        raise ValueError("Timeout must be positive.")
 
-    # simplify complex expressions in AST
-    in_ta_tree = transformers.SimplifyExpressions().transform(in_ta_tree)
+    if(args.memory_limit is not None):
+        if(args.memory_limit <= 0):
+            raise ValueError("Memory limit must be positive.")
+        if(resource is None):
+            raise ValueError("Memory limits are only supported on Unix.")
 
-    # create folder for bisimilar mutations
-    bisimilar_mutations_folder = os.path.join(out_dir, "bisimilar_mutations")
-    if not os.path.isdir(bisimilar_mutations_folder):
-        os.makedirs(bisimilar_mutations_folder)
+    # determine TA files to be mutated, in batch mode the output of every TA is written to a subdirectory named after its file
+    in_files = find_input_files(args.in_ta)
+    is_batch = not(os.path.isfile(args.in_ta) and args.in_ta.endswith((".txt", ".tck")))
+    if(len(in_files) == 0):
+        raise ValueError("No TA files found.")
 
-    # create log file for bisimilar mutations
-    bisimilarity_log_file = open(os.path.join(bisimilar_mutations_folder, "bisimilarity_log.csv"), mode='w+', newline='')
-    csv_writer = csv.writer(bisimilarity_log_file)
-    csv_writer.writerow(["mutation", "result of bisimilarity check"])
+    model_names = [os.path.basename(in_file)[:-4] for in_file in in_files]
+    if(len(set(model_names)) < len(model_names)):
+        raise ValueError("TA files to be mutated in batch mode must have distinct names.")
 
-    def write_mutations(mutations: list[lark.ParseTree], op: str) -> None:
+    os.makedirs(out_dir, exist_ok=True)
 
-        original_file_name = os.path.basename(in_file)[:-4]
+    # resource usage of all stages (only written if requested, the peak memory of stages is only traced then)
+    profile = profiling.Profile()
+    if(args.profile):
+        tracemalloc.start()
+    if(args.cprofile):
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+    # load parser once for all TAs
+    with profile.stage("parse"):
+        ta_parser = load_parser()
 
-        i = 0
-        for mutation in mutations:
-              
-            file_name = f"{original_file_name}_mutation_{op}_{i}.tck"
-            i = i + 1
-            out_file = os.path.join(out_dir, file_name)
+    def read_model(in_file: str) -> tuple[str, lark.ParseTree]:
+        with open(in_file) as file:
+            in_ta = file.read()
 
-            # reconstruct TA text file from mutated AST
-            reconstructor = lark.reconstruct.Reconstructor(ta_parser)
-            out_ta = reconstructor.reconstruct(mutation)
-            
-            with open(out_file, "w") as file:
-                file.write(out_ta)
+        # assert that input TA file does not contain syntax errors
+        # (not needed for counting mutations, the parser rejects invalid TA files as well)
+        if(not args.count_only):
+            with profile.stage("input_syntax_check"):
+                tck_syntax.check(in_ta)
 
-            # assert that output TA file does not contain syntax errors
-            tck_syntax.check(out_ta)
+        return in_ta, parse_ta(ta_parser, in_ta, profile)
 
-            # delete mutation if it is semantically faulty (i.e. there is an out-of-bounds array access/value)
+    # determine mutation operators to be applied
+    if (op == "all"):
+        ops = op_choices.copy()
+        ops.remove("all")
+    else:
+        ops = [op]
+
+    # yields TA files to be mutated together with their output directory and contents (in batch mode, TA files that can not be read are reported and skipped)
+    def read_models() -> Iterator[tuple[str, str, str, lark.ParseTree]]:
+        for in_file, model_name in zip(in_files, model_names):
+            model_out_dir = os.path.join(out_dir, model_name) if is_batch else out_dir
             try:
-                tck_reach.reach(out_ta, tck_reach.Algorithm.REACH)
-            except:
-                os.remove(out_file)
-                i = i - 1
+                in_ta, in_ta_tree = read_model(in_file)
+            except Exception as error:
+                if(not is_batch):
+                    raise
+                print(f"Skipping {in_file}: {error}", file = sys.stderr)
                 continue
+            os.makedirs(model_out_dir, exist_ok = True)
+            yield in_file, model_out_dir, in_ta, in_ta_tree
 
-            # check whether mutation is bisimilar to original
-            is_bisimilar_to_original, _, _ = tck_compare.compare(in_ta, out_ta)
+    # only write number of mutations if requested, mutations are neither generated nor checked
+    if(args.count_only):
+        for in_file, model_out_dir, _, in_ta_tree in read_models():
+            with open(os.path.join(model_out_dir, "mutation_counts.csv"), "w", newline = '') as file:
+                csv_writer = csv.writer(file)
+                csv_writer.writerow(["op", "process", "mutations"])
+                counter = counting.MutationCounter(in_ta_tree)
+                for operator in ops:
+                    counts = counter.count(operator)
+                    csv_writer.writerow([operator, "", counts.total])
+                    csv_writer.writerows([operator, process, count] for process, count in counts.by_process.items())
+                    print(f"{in_file}: {operator}: {counts.total}" if is_batch else f"{operator}: {counts.total}")
+        sys.exit()
 
-            # log bisimilarity of mutation
-            csv_writer.writerow([file_name, is_bisimilar_to_original])
+    # only write mutation descriptors if requested, mutations are neither materialized nor checked
+    if(args.descriptors_only):
+        for _, model_out_dir, _, in_ta_tree in read_models():
+            with open(os.path.join(model_out_dir, "mutation_descriptors.jsonl"), "w") as file:
+                for operator in ops:
+                    for mutation in generate_mutations(in_ta_tree, operator, value, args.sample, args.seed, args.stratify):
+                        file.write(descriptors.to_json(mutation) + "\n")
+        sys.exit()
 
-            # move mutation into seperate folder if it is bisimilar
-            if(is_bisimilar_to_original):
-                os.replace(out_file, os.path.join(bisimilar_mutations_folder, file_name))
+    # open cache of results of previous runs (shared by all TAs)
+    if(args.cache is not None or args.incremental):
+        cache = verdict_cache.VerdictCache(args.cache or os.path.join(out_dir, "verdict_cache.sqlite"), args.cache_size)
+    else:
+        cache = None
 
-    # compute mutations
-    if (op == "all"):
-        ops = op_choices.copy()
-        ops.remove("all")
+    # record progress of resumable runs
+    is_resumable = args.checkpoint or args.resume
+
+    # create worker pool for checking mutations in parallel (shared by all TAs),
+    # with a single job, mutations are checked one at a time in a separate thread, so the event loop of the pipeline is not blocked
+    if(args.jobs > 1):
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers = args.jobs)
+    else:
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers = 1)
+
+    # yields mutations of given TA to be checked together with the handlers writing their results to the output directory
+    # (mutations are generated in the thread of the generation stage of the pipeline, the handlers are called by the thread running the event loop)
+    def mutate_model(in_file: str, model_out_dir: str, in_ta: str, in_ta_tree: lark.ParseTree) -> Iterator[tuple[str, str | None, tuple[str, str], Callable]]:
+
+        # compute reachable locations and edges of input TA once, mutations that only alter unreachable parts are not checked
+        # (in batch mode, TAs whose reachability can not be computed are reported and skipped)
+        try:
+            with profile.stage("reachability"):
+                _, _, state_space = tck_reach.reach(in_ta, tck_reach.Algorithm.REACH, certificate = tck_reach.Certificate.GRAPH)
+                reachable_parts = reachability.Reachability(in_ta_tree, state_space)
+        except Exception as error:
+            if(not is_batch):
+                raise
+            print(f"Skipping {in_file}: {error}", file = sys.stderr)
+            return
+
+        # create folder for bisimilar mutations
+        bisimilar_mutations_folder = os.path.join(model_out_dir, "bisimilar_mutations")
+        if not os.path.isdir(bisimilar_mutations_folder):
+            os.makedirs(bisimilar_mutations_folder)
+
+        original_file_name = os.path.basename(in_file)[:-4]
+
+        # record progress if requested, so an interrupted run can be resumed (otherwise, progress is only kept in memory)
+        # options changing which mutations are written and where or how they are checked
+        run = {"in_ta": hashlib.sha256(in_ta.encode()).hexdigest(), "op": op, "val": str(value), "keep_duplicates": args.keep_duplicates,
+               "bundle": args.bundle, "incremental": args.incremental, "timeout": args.timeout, "memory_limit": args.memory_limit, "cache": args.cache}
+        if(args.sample is not None):
+            run.update({"sample": args.sample, "seed": args.seed, "stratify": args.stratify})
+        progress = checkpoint.Checkpoint(os.path.join(model_out_dir, "checkpoint.jsonl") if is_resumable else None, run, args.resume)
+
+        # whether mutation with given file name has been written by an interrupted run according to the checkpoint
+        # (file names are numbered in order of completion, so the mutations written by an interrupted run are numbered without gaps)
+        def is_recorded(file_name: str) -> bool:
+            logged_op, _, number = file_name[len(f"{original_file_name}_mutation_"):-len(".tck")].rpartition("_")
+            return number.isdigit() and int(number) < progress.get(logged_op)[1]
+
+        # remove mutations written by an interrupted run after its last recorded batch
+        # (files are numbered in order of completion, so a file name may be given to another mutation in another folder when resuming)
+        if(args.resume):
+            for folder_name in ["", "bisimilar_mutations", "unknown_mutations"]:
+                folder = os.path.join(model_out_dir, folder_name)
+                if(not os.path.isdir(folder)):
+                    continue
+                for file_name in os.listdir(folder):
+                    if(file_name.startswith(f"{original_file_name}_mutation_") and file_name.endswith(".tck") and not is_recorded(file_name)):
+                        os.remove(os.path.join(folder, file_name))
+
+        # create log file for bisimilar mutations
+        # (when resuming, only rows of mutations recorded in the checkpoint are kept)
+        bisimilarity_log_path = os.path.join(bisimilar_mutations_folder, "bisimilarity_log.csv")
+        logged_rows = []
+        if(args.resume and os.path.isfile(bisimilarity_log_path)):
+            with open(bisimilarity_log_path, newline='') as file:
+                logged_rows = [row for row in itertools.islice(csv.reader(file), 1, None) if is_recorded(row[0])]
+
+        with open(bisimilarity_log_path + ".tmp", mode='w', newline='') as file:
+            csv_writer = csv.writer(file)
+            csv_writer.writerow(["mutation", "result of bisimilarity check", "reason of static equivalence"])
+            csv_writer.writerows(logged_rows)
+        os.replace(bisimilarity_log_path + ".tmp", bisimilarity_log_path)
+
+        bisimilarity_log_file = open(bisimilarity_log_path, mode='a', newline='')
+        csv_writer = csv.writer(bisimilarity_log_file)
+
+        # create manifest of the parts of the input TA affected by every logged mutation, as recorded by the operators
+        # (when resuming, only lines of mutations recorded in the checkpoint are kept)
+        manifest_path = os.path.join(bisimilar_mutations_folder, "mutation_manifest.jsonl")
+        manifest_lines = []
+        if(args.resume and os.path.isfile(manifest_path)):
+            with open(manifest_path) as file:
+                manifest_lines = [line for line in file if is_recorded(json.loads(line)["mutation"])]
+
+        with open(manifest_path + ".tmp", mode='w') as file:
+            file.writelines(manifest_lines)
+        os.replace(manifest_path + ".tmp", manifest_path)
+
+        manifest_file = open(manifest_path, mode='a')
+
+        # open bundle for all mutations if requested (when resuming, only mutations recorded in the checkpoint are kept)
+        mutations_bundle = bundle.Bundle(os.path.join(model_out_dir, "mutations.jsonl.gz"), is_recorded if args.resume else None) if args.bundle else None
+
+        # serializes mutated ASTs, declarations shared with the original AST are only serialized once
+        ta_printer = printer.Printer(in_ta_tree)
+
+        # fingerprints of all mutations generated so far (shared by all operators)
+        fingerprints = set()
+
+        # dependencies between processes of input TA, used to check mutations only on the processes they affect
+        dependencies = slicing.ProcessDependencies(in_ta_tree.children) if args.incremental else None
+
+        # number of mutations whose results are not handled yet and whether all mutations have been submitted,
+        # the log and checkpoint files are closed once all results are handled
+        # (mutations are submitted and results are handled by different threads)
+        unhandled = 0
+        is_exhausted = False
+        handled_lock = threading.Lock()
 
+        # outputs are written to disk in batches, in resumable runs before the progress of the batch is recorded
+        unflushed = 0
+        last_flush = time.monotonic()
+
+        def flush_outputs() -> None:
+            nonlocal unflushed, last_flush
+            for file in [bisimilarity_log_file, manifest_file]:
+                file.flush()
+                if(is_resumable):
+                    os.fsync(file.fileno())
+            if(mutations_bundle is not None):
+                mutations_bundle.flush(is_resumable)
+            progress.sync()
+            unflushed, last_flush = 0, time.monotonic()
+
+        # must be called with handled_lock held
+        def close_if_done() -> None:
+            if(is_exhausted and 0 == unhandled):
+                flush_outputs()
+                progress.close()
+                bisimilarity_log_file.close()
+                manifest_file.close()
+                if(mutations_bundle is not None):
+                    mutations_bundle.close()
+
+        def write_mutations(mutations: Iterable[descriptors.Mutation], op: str) -> Iterator[tuple[str, str | None, tuple[str, str], Callable]]:
+            nonlocal unhandled
+
+            # reconstruct TA text files from mutated ASTs, mutations that are statically known to be equivalent to the original are not checked
+            # (in incremental mode, mutations are checked on the slices of the processes they affect)
+            out_tas = materialize_mutations(in_ta, in_ta_tree, mutations, op, ta_printer, reachable_parts, dependencies, profile)
+
+            # drop textually identical mutations before they are checked
+            if(not args.keep_duplicates):
+                out_tas = remove_duplicates(out_tas, fingerprints)
+
+            # skip mutations already processed by an interrupted run (duplicates are still removed in the same way, so mutations are numbered in the same way)
+            processed, i, done = progress.get(op)
+            skipped = set(done)
+            done = set(done)
+            numbered_out_tas = ((number, out_ta) for number, out_ta in enumerate(out_tas) if number >= processed and number not in skipped)
+
+            # results are handled in order of completion, mutations are numbered in order of generation and files in order of completion
+            def handle_result(number: int, mutation: descriptors.Mutation, out_ta: str, is_bisimilar_to_original: bool | str | None, equivalence_reason: str | None,
+                              timings: dict[str, dict[str, float]]) -> None:
+                nonlocal processed, i, unhandled, unflushed
+                done.add(number)
+                while(processed in done):
+                    done.remove(processed)
+                    processed = processed + 1
+                file_name = ""
+
+                # skip mutation if it is semantically faulty (i.e. there is an out-of-bounds array access/value)
+                if(is_bisimilar_to_original is not None):
+                    file_name = f"{original_file_name}_mutation_{op}_{i}.tck"
+                    i = i + 1
+
+                    with profile.stage("write", op):
+                        # write mutation into seperate folder if it is bisimilar or if its check exceeded a limit (or into bundle with name of folder)
+                        if(isinstance(is_bisimilar_to_original, str)):
+                            out_folder_name = "unknown_mutations"
+                            logged_result = f"unknown/{is_bisimilar_to_original}"
+                        else:
+                            out_folder_name = "bisimilar_mutations" if is_bisimilar_to_original else ""
+                            logged_result = is_bisimilar_to_original
+                        if(mutations_bundle is not None):
+                            mutations_bundle.add(file_name, out_folder_name, out_ta)
+                        else:
+                            # folder for mutations whose check exceeded a limit is only created if needed
+                            if("unknown_mutations" == out_folder_name):
+                                os.makedirs(os.path.join(model_out_dir, out_folder_name), exist_ok = True)
+                            with open(os.path.join(model_out_dir, out_folder_name, file_name), "w") as file:
+                                file.write(out_ta)
+
+                        # log bisimilarity of mutation
+                        csv_writer.writerow([file_name, logged_result, equivalence_reason or ""])
+
+                        # record affected parts of input TA
+                        provenance = mutation.provenance or descriptors.Provenance()
+                        manifest_file.write(json.dumps({"mutation": file_name, "op": op, **provenance._asdict()}) + "\n")
+
+                if(len(timings) > 0):
+                    profile.add_check(op, number, file_name, is_bisimilar_to_original, timings)
+
+                progress.record(op, processed, i, done)
+
+                unflushed = unflushed + 1
+                if(unflushed >= flush_batch_size or time.monotonic() - last_flush >= flush_interval):
+                    flush_outputs()
+
+                with handled_lock:
+                    unhandled = unhandled - 1
+                    close_if_done()
+
+            for number, (out_ta, reason, checked_tas, mutation) in numbered_out_tas:
+                with handled_lock:
+                    unhandled = unhandled + 1
+                yield out_ta, reason, checked_tas, functools.partial(handle_result, number, mutation)
+
+        # compute mutations
         for operator in ops:
-            mutations = apply_mutation(in_ta_tree, operator, value)
-            write_mutations(mutations, operator)
+            yield from write_mutations(generate_mutations(in_ta_tree, operator, value, args.sample, args.seed, args.stratify), operator)
 
-    else:
-        mutations = apply_mutation(in_ta_tree, op, value)
-        write_mutations(mutations, op)
+        with handled_lock:
+            is_exhausted = True
+            close_if_done()
+
+    # the mutations of all TAs and operators are checked in a single stream, so workers do not idle at the end of an operator or TA,
+    # syntax check, reachability check and bisimulation check are stages of a pipeline and results are handled in order of completion (see pipeline.check_mutations)
+    async def check_all() -> None:
+        out_tas = itertools.chain.from_iterable(mutate_model(*model) for model in read_models())
+        async for out_ta, is_bisimilar_to_original, equivalence_reason, timings, handle_result in pipeline.check_mutations(None, out_tas, executor, args.jobs, 2 * args.jobs, cache,
+                                                                                                                        args.timeout, args.memory_limit):
+            handle_result(out_ta, is_bisimilar_to_original, equivalence_reason, timings)
+
+    asyncio.run(check_all())
+
+    executor.shutdown()
+
+    if(cache is not None):
+        cache.close()
+
+    if(args.profile):
+        profile.write(out_dir)
 
-    bisimilarity_log_file.close()
+    if(args.cprofile):
+        profiler.disable()
+        profiler.dump_stats(args.cprofile)
@@ -0,0 +1,150 @@
+import descriptors
+import mutate
+import pipeline
+import printer
+import profiling
+import reachability
+import slicing
+import verdict_cache
+from tcheckerpy.tools import tck_reach, tck_syntax
+
+import collections
+import concurrent.futures
+
+from collections.abc import AsyncIterator, Iterable, Iterator
+from typing import NamedTuple
+
+class Mutant(NamedTuple):
+    """
+    Mutation of a TA together with the result of checking it with TChecker.
+
+    result is True if the mutation is bisimilar to the original, False if not, "timeout" or "memory limit" if its check exceeded a limit (see mutate.check_mutations)
+    and None if it was not checked.
+    """
+
+    ta: str
+    result: bool | str | None
+    reason: str | None
+    mutation: descriptors.Mutation
+
+class Mutator:
+    """
+    In-process interface for mutating TAs and checking the mutations with TChecker, without writing any files (TChecker itself is called on temporary files).
+    The parser is loaded once and reused by all calls, so a single mutator can serve any number of TAs.
+    """
+
+    def __init__(self):
+        self.parser = mutate.load_parser()
+
+    def materialize(self, ta: str, ops: Iterable[str] | None = None, value: int = 1, check: bool = True, keep_duplicates: bool = False,
+                    sample: int | None = None, seed: int = 0, stratify: str | None = None, incremental: bool = False,
+                    profile: profiling.Profile | None = None) -> Iterator[tuple[str, str | None, tuple[str, str], descriptors.Mutation]]:
+        """
+        Lazily generates and materializes mutations of given TA to be checked (see mutate.materialize_mutations), the input TA is only analysed once the first mutation is requested.
+        For the parameters, see mutate.
+
+        :return: iterator over tuples of mutated TA, reason of static equivalence, pair of TAs to be checked and mutation
+        :raises RuntimeError: if given TA contains syntax errors
+        """
+
+        ops = [op for op in mutate.op_choices if op != "all"] if ops is None else list(ops)
+        profile = profile or profiling.Profile()
+
+        # assert that input TA does not contain syntax errors
+        if(check):
+            with profile.stage("input_syntax_check"):
+                tck_syntax.check(ta)
+
+        ta_tree = mutate.parse_ta(self.parser, ta, profile)
+
+        # compute reachable locations and edges of input TA once, mutations that only alter unreachable parts are not checked
+        reachable_parts = None
+        if(check):
+            with profile.stage("reachability"):
+                _, _, state_space = tck_reach.reach(ta, tck_reach.Algorithm.REACH, certificate = tck_reach.Certificate.GRAPH)
+                reachable_parts = reachability.Reachability(ta_tree, state_space)
+
+        ta_printer = printer.Printer(ta_tree)
+        dependencies = slicing.ProcessDependencies(ta_tree.children) if incremental else None
+
+        # fingerprints of all mutations generated so far (shared by all operators)
+        fingerprints = set()
+
+        for op in ops:
+            mutations = mutate.generate_mutations(ta_tree, op, value, sample, seed, stratify)
+            out_tas = mutate.materialize_mutations(ta, ta_tree, mutations, op, ta_printer, reachable_parts, dependencies, profile)
+            if(not keep_duplicates):
+                out_tas = mutate.remove_duplicates(out_tas, fingerprints)
+            yield from out_tas
+
+    def mutate(self, ta: str, ops: Iterable[str] | None = None, value: int = 1, check: bool = True, keep_duplicates: bool = False,
+               sample: int | None = None, seed: int = 0, stratify: str | None = None,
+               executor: concurrent.futures.Executor | None = None, max_pending: int = 1, cache: verdict_cache.VerdictCache | None = None,
+               incremental: bool = False, timeout: float | None = None, memory_limit: int | None = None,
+               profile: profiling.Profile | None = None) -> Iterator[Mutant]:
+        """
+        Generates mutations of given TA and checks them with TChecker, in the same way as mutate.py does for its options of the same name.
+        Mutations are yielded lazily in the order they are generated, mutations that are semantically faulty (i.e. there is an out-of-bounds array access/value) are skipped.
+
+        :param ta: TA to be mutated in TChecker syntax
+        :param ops: mutation operators to be applied in given order (see mutate.apply_mutation), all operators if None
+        :param value: value to decrease/increase constants by
+        :param check: whether to check mutations with TChecker, otherwise only mutations that are statically known to be equivalent to the original (without reachability) get a result
+        :param keep_duplicates: whether to keep mutations that are textually identical to a previously generated mutation (of any operator)
+        :param sample: number of randomly drawn mutations per operator, all mutations are generated if None (see sampling.sample)
+        :param seed: seed for drawing mutations
+        :param stratify: draw mutations evenly across the processes ("process") or declarations ("declaration") they alter, uniformly if None
+        :param executor: executor to run checks in (e.g. a process pool shared by all calls), checks are run sequentially if None
+        :param max_pending: maximum number of mutations submitted to executor but not yet yielded
+        :param cache: cache of results of previous checks
+        :param incremental: whether to check mutations only on the processes they affect (see slicing.independent_slices)
+        :param timeout: maximum wall-clock time of every check in seconds (no limit if None)
+        :param memory_limit: maximum virtual memory of every check in megabytes (no limit if None)
+        :param profile: profile to record resource usage of all stages in
+        :return: iterator over mutants
+        :raises RuntimeError: if given TA contains syntax errors
+        :raises ValueError: if a memory limit is given on a platform without memory limits (i.e. not on Unix)
+        """
+
+        out_tas = self.materialize(ta, ops, value, check, keep_duplicates, sample, seed, stratify, incremental, profile)
+
+        if(not check):
+            for out_ta, reason, _, mutation in out_tas:
+                yield Mutant(out_ta, True if reason is not None else None, reason, mutation)
+            return
+
+        # mutations submitted for checking, in order of submission (results are yielded in the same order)
+        submitted = collections.deque()
+
+        def submit_all() -> Iterator[tuple[str, str | None, tuple[str, str]]]:
+            for out_ta, reason, checked_tas, mutation in out_tas:
+                submitted.append(mutation)
+                yield out_ta, reason, checked_tas
+
+        for out_ta, is_bisimilar_to_original, reason, _ in mutate.check_mutations(None, submit_all(), executor, max_pending, cache, timeout, memory_limit):
+            mutation = submitted.popleft()
+            if(is_bisimilar_to_original is not None):
+                yield Mutant(out_ta, is_bisimilar_to_original, reason, mutation)
+
+    async def mutate_async(self, ta: str, ops: Iterable[str] | None = None, value: int = 1, keep_duplicates: bool = False,
+                           sample: int | None = None, seed: int = 0, stratify: str | None = None,
+                           executor: concurrent.futures.Executor | None = None, workers: int = 1, queue_size: int = 16, cache: verdict_cache.VerdictCache | None = None,
+                           incremental: bool = False, timeout: float | None = None, memory_limit: int | None = None,
+                           profile: profiling.Profile | None = None) -> AsyncIterator[Mutant]:
+        """
+        Generates mutations of given TA and checks them with TChecker in a pipeline of stages connected by bounded queues (see pipeline.check_mutations).
+        Unlike mutate, mutations are yielded in the order their checks complete, so a slow check does not hold back the results of others.
+        Semantically faulty mutations are skipped. For the parameters, see mutate.
+
+        :param executor: executor to run checks in (e.g. a process pool shared by all calls), the default executor of the event loop is used if None
+        :param workers: maximum number of concurrent checks of every step
+        :param queue_size: maximum number of mutations waiting between two stages of the pipeline
+        :return: async iterator over mutants
+        :raises RuntimeError: if given TA contains syntax errors
+        :raises ValueError: if a memory limit is given on a platform without memory limits (i.e. not on Unix)
+        """
+
+        out_tas = self.materialize(ta, ops, value, True, keep_duplicates, sample, seed, stratify, incremental, profile)
+        async for out_ta, is_bisimilar_to_original, reason, _, mutation in pipeline.check_mutations(None, out_tas, executor, workers, queue_size, cache, timeout, memory_limit):
+            if(is_bisimilar_to_original is not None):
+                yield Mutant(out_ta, is_bisimilar_to_original, reason, mutation)
@@ -1,8 +1,11 @@
 import AST_tools
+import declaration_index
 import transformers
 
-import sys
-import copy
+import random
+
+from collections.abc import Iterator
+from descriptors import Edit, Mutation, Provenance
 
 from lark import ParseTree, Token, Tree
 
@@ -16,93 +19,101 @@ cmp_tokens = {
             ">": Token("CMP_GT_TOK", ">")
             }
 
+def declaration_provenance(declaration: ParseTree, attribute: str = "") -> Provenance:
+    """
+    :param declaration: location or edge declaration of original TA
+    :param attribute: changed attribute of declaration, empty if declaration is removed
+    :return: provenance of mutations altering given declaration
+    """
+
+    processes = (declaration_index.name(declaration.children[2]),)
+    if(declaration.data == "location_declaration"):
+        return Provenance(processes, locations = (declaration_index.location_label(declaration),), attribute = attribute)
+    return Provenance(processes, edges = (declaration_index.edge_label(declaration),), attribute = attribute)
+
+def sync_provenance(sync: ParseTree, attribute: str = "", added_processes: tuple[str, ...] = ()) -> Provenance:
+    """
+    :param sync: sync declaration of original TA
+    :param attribute: changed attribute of synchronisation, empty if synchronisation is removed
+    :param added_processes: names of processes added to synchronisation
+    :return: provenance of mutations altering given synchronisation (affecting all processes taking part in it)
+    """
+
+    return Provenance(declaration_index.sync_processes(sync) + added_processes, syncs = (declaration_index.sync_label(sync),), attribute = attribute)
+
 # attribute changing operators
 
-def change_event(tree: ParseTree) -> list[ParseTree]:
+def change_event(tree: ParseTree) -> Iterator[Mutation]:
     """
-    Computes a list of mutations of the given TA such that for each mutation the event in one transition is changed.
+    Yields mutations of the given TA such that for each mutation the event in one transition is changed.
 
     :param tree: AST of TA to be mutated
-    :return: list of mutated ASTs
+    :return: iterator over mutations
     """
 
-    mutations = []
+    index = declaration_index.get(tree)
 
-    for edge in tree.find_data("edge_declaration"):
+    for i, edge in index.edges:
         
         old_event = edge.children[8]
+        provenance = declaration_provenance(edge, "event")
 
-        for event in [event.children[2] for event in tree.find_data("event_declaration")]:
+        for event in index.events:
             # skip mutation if new event is old event
             if (event == old_event):
                 continue
             # exchange event
-            altered_edge = AST_tools.exchange_node(edge, old_event, event)
+            altered_edge = AST_tools.exchange_node_at(edge, (8,), event)
             # exchange transition
-            mutations.append(AST_tools.exchange_node(tree, edge, altered_edge))
-
-    return mutations
+            yield Mutation("change_event", (Edit("replace", (i,), altered_edge),), provenance)
 
-def change_constraint_cmp(tree: ParseTree) -> list[ParseTree]:
+def change_constraint_cmp(tree: ParseTree) -> Iterator[Mutation]:
     """
-    Computes a list of mutations of the given TA such that for each mutation one comparator of one clock expression in one guard or invariant is changed.
+    Yields mutations of the given TA such that for each mutation one comparator of one clock expression in one guard or invariant is changed.
 
     :param tree: AST of TA to be mutated
-    :return: list of mutated ASTs
+    :return: iterator over mutations
     """
 
-    mutations = []
+    for i, edge_or_location in AST_tools.find_declarations(tree, "edge_declaration", "location_declaration"):
+        constraint_data = "provided_attribute" if edge_or_location.data == "edge_declaration" else "invariant_attribute"
+        provenance = declaration_provenance(edge_or_location, "provided" if edge_or_location.data == "edge_declaration" else "invariant")
 
-    for edge_or_location in tree.find_pred(lambda t: t.data == "edge_declaration" or t.data == "location_declaration"):
-        if (edge_or_location.data == "edge_declaration"):
-            constraints = edge_or_location.find_data("provided_attribute")
-        else:
-            constraints = edge_or_location.find_data("invariant_attribute")
-
-        for constraint in constraints:
+        for constraint_path, constraint in AST_tools.find_data_with_paths(edge_or_location, constraint_data):
 
-            for expr in AST_tools.get_all_clock_exprs(tree, constraint):
+            for expr_path, expr in AST_tools.get_all_clock_exprs_with_paths(tree, constraint):
 
                 # new comparator can not be old comparator       
-                old_cmp = next(expr.scan_values(lambda t: t in cmps))
+                cmp_idx, old_cmp = next((j, child) for j, child in enumerate(expr.children) if child in cmps)
                 cmp_options = cmps.copy()
                 cmp_options.remove(old_cmp)
 
-                # define old comparator node
-                old_cmp_node = cmp_tokens[old_cmp]
-
                 for cmp in cmp_options:
 
                     # change node
-                    altered_expr = AST_tools.exchange_node(expr, old_cmp_node, cmp_tokens[cmp])
-                    altered_constraint = AST_tools.exchange_node(constraint, expr, altered_expr)
-                    altered_edge_or_location = AST_tools.exchange_node(edge_or_location, constraint, altered_constraint)
+                    altered_edge_or_location = AST_tools.exchange_node_at(edge_or_location, constraint_path + expr_path + (cmp_idx,), cmp_tokens[cmp])
 
-                    mutations.append(AST_tools.exchange_node(tree, edge_or_location, altered_edge_or_location))
-                
-    return mutations
+                    yield Mutation("change_constraint_cmp", (Edit("replace", (i,), altered_edge_or_location),), provenance)
 
-def change_constraint_clock(tree: ParseTree) -> list[ParseTree]:
+def change_constraint_clock(tree: ParseTree) -> Iterator[Mutation]:
     """
-    Computes a list of mutations of the given TA such that for each mutation, one clock in one clock constraint is exchanged for another.
+    Yields mutations of the given TA such that for each mutation, one clock in one clock constraint is exchanged for another.
 
     :param tree: AST of TA to be mutated
-    :return: list of mutated ASTs
+    :return: iterator over mutations
     """
 
-    mutations = []
+    clocks = AST_tools.get_all_clocks(tree)
 
-    for edge_or_location in tree.find_pred(lambda t: t.data == "edge_declaration" or t.data == "location_declaration"):
-        if (edge_or_location.data == "edge_declaration"):
-            constraints = edge_or_location.find_data("provided_attribute")
-        else:
-            constraints = edge_or_location.find_data("invariant_attribute")
+    for i, edge_or_location in AST_tools.find_declarations(tree, "edge_declaration", "location_declaration"):
+        constraint_data = "provided_attribute" if edge_or_location.data == "edge_declaration" else "invariant_attribute"
+        provenance = declaration_provenance(edge_or_location, "provided" if edge_or_location.data == "edge_declaration" else "invariant")
 
-        for constraint in constraints:
-            for expr in AST_tools.get_all_clock_exprs(tree, constraint):
-                for clock in AST_tools.get_all_clocks(tree):
+        for constraint_path, constraint in AST_tools.find_data_with_paths(edge_or_location, constraint_data):
+            for expr_path, expr in AST_tools.get_all_clock_exprs_with_paths(tree, constraint):
+                for clock in clocks:
 
-                    def add_mutation_with_exchanged_clock(idx_in_expr: int, idx_in_term: int) -> None:
+                    def mutations_with_exchanged_clock(idx_in_expr: int, idx_in_term: int) -> Iterator[Mutation]:
 
                         # skip mutation if element to exchange with clock is not a clock
                         if(not AST_tools.is_clock_expr(tree, expr.children[idx_in_expr].children[idx_in_term])): 
@@ -117,55 +128,44 @@ def change_constraint_clock(tree: ParseTree) -> list[ParseTree]:
                             return
 
                         # exchange clock
-                        altered_expr = copy.deepcopy(expr)
-                        altered_expr.children[idx_in_expr].children[idx_in_term] = clock 
-                        # exchange expression
-                        altered_constraint = AST_tools.exchange_node(constraint, expr, altered_expr)
-                        altered_edge_or_location = AST_tools.exchange_node(edge_or_location, constraint, altered_constraint)
-                        mutations.append(AST_tools.exchange_node(tree, edge_or_location, altered_edge_or_location))
+                        altered_edge_or_location = AST_tools.exchange_node_at(edge_or_location, constraint_path + expr_path + (idx_in_expr, idx_in_term), clock)
+                        yield Mutation("change_constraint_clock", (Edit("replace", (i,), altered_edge_or_location),), provenance)
 
                     # exchange clock in left part of clock expression (if it is a clock)
-                    add_mutation_with_exchanged_clock(0, 0)
+                    yield from mutations_with_exchanged_clock(0, 0)
                     # exchange clock in right part of clock expression (if it is a clock)
-                    add_mutation_with_exchanged_clock(2, 0)
+                    yield from mutations_with_exchanged_clock(2, 0)
                     # for expressions of form x - y == 0: exchange second element in left part of clock expression (if it is a clock)
                     if(1 < len(expr.children[0].children)):
-                        add_mutation_with_exchanged_clock(0, 2)
+                        yield from mutations_with_exchanged_clock(0, 2)
                     # for expressions of form 0 == x - y: exchange second element in right part of clock expression (if it is a clock)
                     if(1 < len(expr.children[2].children)):
-                        add_mutation_with_exchanged_clock(2, 2)
+                        yield from mutations_with_exchanged_clock(2, 2)
                     
 
-    return mutations
-
-def decrease_or_increase_constraint_constant(tree: ParseTree, decrease_constant: bool, value: int) -> list[ParseTree]:
+def decrease_or_increase_constraint_constant(tree: ParseTree, decrease_constant: bool, value: int) -> Iterator[Mutation]:
     """
-    Computes a list of mutations of the given TA such that for each mutation the constant in one clock constraint is decreased or increased by given value.
+    Yields mutations of the given TA such that for each mutation the constant in one clock constraint is decreased or increased by given value.
 
     :param tree: AST of TA to be mutated
     :param decrease_constant: Method decreases constant iff True, increases otherwise.
     :param value: value to decrease/increase constant by
-    :return: list of mutated ASTs
+    :return: iterator over mutations
     """
 
-    mutations = []
+    op = "decrease_constraint_constant" if decrease_constant else "increase_constraint_constant"
 
-    for edge_or_location in tree.find_pred(lambda t: t.data == "edge_declaration" or t.data == "location_declaration"):
-        if (edge_or_location.data == "edge_declaration"):
-            constraints = edge_or_location.find_data("provided_attribute")
-        else:
-            constraints = edge_or_location.find_data("invariant_attribute")
+    for i, edge_or_location in AST_tools.find_declarations(tree, "edge_declaration", "location_declaration"):
+        constraint_data = "provided_attribute" if edge_or_location.data == "edge_declaration" else "invariant_attribute"
+        provenance = declaration_provenance(edge_or_location, "provided" if edge_or_location.data == "edge_declaration" else "invariant")
 
-        for constraint in constraints:
+        for constraint_path, constraint in AST_tools.find_data_with_paths(edge_or_location, constraint_data):
             
-            for expr in AST_tools.get_all_clock_exprs(tree, constraint):
+            for expr_path, expr in AST_tools.get_all_clock_exprs_with_paths(tree, constraint):
 
                 # check whether first or second compared value is constant
-                for clock_declaration in tree.find_data("clock_declaration"):
-                    if(AST_tools.contains_child_node(expr.children[0], clock_declaration.children[4])):
-                        old_constant_node = expr.children[2]
-                    elif(AST_tools.contains_child_node(expr.children[2], clock_declaration.children[4])):
-                        old_constant_node = expr.children[0]
+                constant_idx = 2 if AST_tools.is_clock_expr(tree, expr.children[0]) else 0
+                old_constant_node = expr.children[constant_idx]
 
                 # define new constant node
                 op_node = Tree(Token('RULE', 'op'), [Token('OP_SUB_TOK', '-')]) if decrease_constant else Tree(Token('RULE', 'op'), [Token('OP_ADD_TOK', '+')])
@@ -173,48 +173,41 @@ def decrease_or_increase_constraint_constant(tree: ParseTree, decrease_constant:
                 new_constant_node = Tree(Token('RULE', 'int_term'), [old_constant_node, op_node, one_node])
 
                 # change node
-                altered_expr = AST_tools.exchange_node(expr, old_constant_node, new_constant_node)
-                altered_constraint = AST_tools.exchange_node(constraint, expr, altered_expr)
-                altered_edge_or_location = AST_tools.exchange_node(edge_or_location, constraint, altered_constraint)
+                altered_edge_or_location = AST_tools.exchange_node_at(edge_or_location, constraint_path + expr_path + (constant_idx,), new_constant_node)
 
-                mutations.append(AST_tools.exchange_node(tree, edge_or_location, altered_edge_or_location))
+                yield Mutation(op, (Edit("replace", (i,), altered_edge_or_location),), provenance)
 
-    return mutations
-
-def invert_reset(tree: ParseTree) -> list[ParseTree]:
+def invert_reset(tree: ParseTree) -> Iterator[Mutation]:
     """
-    Computes a list of mutations of the given TA.
+    Yields mutations of the given TA.
     For each mutation, the occurrence of one clock in the set of reset clocks of one guard is flipped (added if non-existent, removed if existent).
     Only considers resets to 0.
 
     :param tree: AST of TA to be mutated
-    :return: list of mutated ASTs
+    :return: iterator over mutations
     """
 
-    mutations = []
+    clocks = AST_tools.get_all_clocks(tree)
 
-    for edge in tree.find_data("edge_declaration"):
+    for i, edge in AST_tools.find_declarations(tree, "edge_declaration"):
 
-        # add attribute list if edge declaration does not already have one
-        if(10 > len(edge.children)):
-            attributes = Tree(Token('RULE', 'attributes'), 
-                              [Token('LEFT_BRACE_TOK', '{'), Token('RIGHT_BRACE_TOK', '}')])
-            edge.children.append(attributes)
-
-        non_reset_clocks = AST_tools.get_all_clocks(tree)
+        non_reset_clocks = clocks.copy()
+        provenance = declaration_provenance(edge, "do")
 
         # replace reset with nop if clock is reset by transition, add clock to non_reset_clocks otherwise
-        for do_attribute in edge.find_data("do_attribute"):
-            for assignment in do_attribute.find_pred(lambda t: t.data == "int_assignment" or t.data == "clock_assignment"):
-                for clock in AST_tools.get_all_clocks(tree):
+        for do_attribute_path, do_attribute in AST_tools.find_data_with_paths(edge, "do_attribute"):
+            for assignment_path, assignment in AST_tools.find_data_with_paths(do_attribute, "int_assignment"):
+                for clock in clocks:
                     # also consider resets of form x = 0 in addition to x[0] = 0
                     is_same_clock_without_index = (isinstance(assignment.children[0], Tree) and len(assignment.children[0].children) == 1 and clock.children[0] == assignment.children[0].children[0])
                     if(clock == assignment.children[0] or is_same_clock_without_index):
-                        non_reset_clocks.remove(clock)
+                        # clock might be reset more than once by transition
+                        if(clock in non_reset_clocks):
+                            non_reset_clocks.remove(clock)
 
                         nop = Tree(Token('RULE', 'nop'), [Token('NOP_TOK', 'nop')])
-                        altered_edge = AST_tools.exchange_node(edge, assignment, nop)
-                        mutations.append(AST_tools.exchange_node(tree, edge, altered_edge))
+                        altered_edge = AST_tools.exchange_node_at(edge, do_attribute_path + assignment_path, nop)
+                        yield Mutation("invert_reset", (Edit("replace", (i,), altered_edge),), provenance)
 
         # add reset to attributes list if clock is not reset by transition
         for clock in non_reset_clocks:
@@ -223,7 +216,7 @@ def invert_reset(tree: ParseTree) -> list[ParseTree]:
                              [Token('DO_TOK', 'do'),
                               Token('COLON_TOK', ':'), 
                               Tree(Token('RULE', 'stmt'),
-                                   [Tree(Token('RULE', 'clock_assignment'),
+                                   [Tree(Token('RULE', 'int_assignment'),
                                          [clock,
                                           Token('ASSIGNMENT_TOK', '='),
                                           Tree(Token('RULE', 'int_term'),
@@ -231,27 +224,28 @@ def invert_reset(tree: ParseTree) -> list[ParseTree]:
             colon = Token('COLON_TOK', ':')
 
             # define new edge
-            altered_edge = copy.deepcopy(edge)
+            altered_edge = edge
+            # add attribute list if edge declaration does not already have one
+            if(10 > len(altered_edge.children)):
+                attributes = Tree(Token('RULE', 'attributes'), 
+                                  [Token('LEFT_BRACE_TOK', '{'), Token('RIGHT_BRACE_TOK', '}')])
+                altered_edge = AST_tools.insert_node_at(altered_edge, (9,), attributes)
             # add colon after new reset if attributes list was nonempty before
             if (altered_edge.children[9].children[1] != Token('RIGHT_BRACE_TOK', '}')):
-                altered_edge.children[9].children.insert(1, colon)
+                altered_edge = AST_tools.insert_node_at(altered_edge, (9, 1), colon)
             # add new reset
-            altered_edge.children[9].children.insert(1, new_reset)
-            mutations.append(AST_tools.exchange_node(tree, edge, altered_edge))
-
-    return mutations
+            altered_edge = AST_tools.insert_node_at(altered_edge, (9, 1), new_reset)
+            yield Mutation("invert_reset", (Edit("replace", (i,), altered_edge),), provenance)
 
-def invert_urgent_or_committed_location(tree: ParseTree, invert_committed: bool) -> list[ParseTree]:
+def invert_urgent_or_committed_location(tree: ParseTree, invert_committed: bool) -> Iterator[Mutation]:
     """
-    Computes a list of mutations of the given TA such that for each mutation the urgent or committed attribute of one location gets flipped (added if non-existent, removed if existent).
+    Yields mutations of the given TA such that for each mutation the urgent or committed attribute of one location gets flipped (added if non-existent, removed if existent).
 
     :param tree: AST of TA to be mutated
     :param invert_committed: Method turns location committed iff True, urgent otherwise.
-    :return: list of mutated ASTs
+    :return: iterator over mutations
     """
 
-    mutations = []
-
     if(invert_committed):
         attribute = Tree(Token('RULE', 'committed_attribute'),
                          [Token('COMMITTED_TOK', 'committed'), Token('COLON_TOK', ':')])
@@ -259,50 +253,49 @@ def invert_urgent_or_committed_location(tree: ParseTree, invert_committed: bool)
         attribute = Tree(Token('RULE', 'urgent_attribute'),
                          [Token('URGENT_TOK', 'urgent'), Token('COLON_TOK', ':')])    
 
-    for location in tree.find_data("location_declaration"):
+    op = "invert_committed_location" if invert_committed else "invert_urgent_location"
+
+    for i, location in AST_tools.find_declarations(tree, "location_declaration"):
+        provenance = declaration_provenance(location, "committed" if invert_committed else "urgent")
+
         # remove attribute if it already is urgent/committed
         if(AST_tools.contains_child_node(location, attribute)):
-            altered_location = copy.deepcopy(location)
+            idx = location.children[5].children.index(attribute)
 
-            idx = altered_location.children[5].children.index(attribute)
+            # remove attribute
+            altered_location = AST_tools.remove_node_at(location, (5, idx))
 
             # remove preceding and succeeding colons if necessary
             if(idx > 1):
-                altered_location.children[5].children.pop(idx - 1)
-                idx = idx - 1
-            elif(idx < len(altered_location.children[5].children) - 2):
-                altered_location.children[5].children.pop(idx + 1)
+                altered_location = AST_tools.remove_node_at(altered_location, (5, idx - 1))
+            elif(idx < len(altered_location.children[5].children) - 1):
+                altered_location = AST_tools.remove_node_at(altered_location, (5, idx))
 
-            # remove attribute
-            altered_location = AST_tools.remove_node(altered_location, attribute)
-            mutations.append(AST_tools.exchange_node(tree, location, altered_location))
+            yield Mutation(op, (Edit("replace", (i,), altered_location),), provenance)
             continue
 
-        # add attribute list if location declaration does not already have one
-        if(6 > len(location.children)):
-            attributes = Tree(Token('RULE', 'attributes'), 
-                              [Token('LEFT_BRACE_TOK', '{'), Token('RIGHT_BRACE_TOK', '}')])
-            location.children.append(attributes)
-
         colon = Token('COLON_TOK', ':')
 
         # define new location
-        altered_location = copy.deepcopy(location)
+        altered_location = location
+        # add attribute list if location declaration does not already have one
+        if(6 > len(altered_location.children)):
+            attributes = Tree(Token('RULE', 'attributes'), 
+                              [Token('LEFT_BRACE_TOK', '{'), Token('RIGHT_BRACE_TOK', '}')])
+            altered_location = AST_tools.insert_node_at(altered_location, (5,), attributes)
         # add colon after new attribute if attributes list was nonempty before
         if (altered_location.children[5].children[1] != Token('RIGHT_BRACE_TOK', '}')):
-            altered_location.children[5].children.insert(1, colon)
+            altered_location = AST_tools.insert_node_at(altered_location, (5, 1), colon)
         # add new attribute
-        altered_location.children[5].children.insert(1, attribute)
-        mutations.append(AST_tools.exchange_node(tree, location, altered_location))
-
-    return mutations
+        altered_location = AST_tools.insert_node_at(altered_location, (5, 1), attribute)
+        yield Mutation(op, (Edit("replace", (i,), altered_location),), provenance)
 
-def negate_guard(tree: ParseTree) -> list[ParseTree]:
+def negate_guard(tree: ParseTree) -> Iterator[Mutation]:
     """
-    Computes a list of mutations of the given TA such that for each mutation one transition is removed.
+    Yields mutations of the given TA such that for each mutation one transition is removed.
 
     :param tree: AST of TA to be mutated
-    :return: list of mutated ASTs
+    :return: iterator over mutations
     """
 
     # transform equals comparator before negation since neq comparator is not allowed in clock expressions
@@ -310,13 +303,10 @@ def negate_guard(tree: ParseTree) -> list[ParseTree]:
     # combine multiple guards of one transition into one guard
     transformed_tree = transformers.CombineGuards().transform(transformed_tree)
 
-    mutations = []
-
-    for edge in transformed_tree.find_data("edge_declaration"):
-        for guard in edge.find_data("provided_attribute"):
+    for i, edge in AST_tools.find_declarations(transformed_tree, "edge_declaration"):
+        for guard_path, guard in AST_tools.find_data_with_paths(edge, "provided_attribute"):
 
             atomic_expressions = list(guard.find_data("predicate_expr"))
-            atomic_expressions.extend(guard.find_data("clock_expr"))
 
             clock_expressions = AST_tools.get_all_clock_exprs(tree, guard)
             if(len(clock_expressions) == 0):
@@ -338,22 +328,22 @@ def negate_guard(tree: ParseTree) -> list[ParseTree]:
                 int_term_part_of_guard.append(int_term)
 
             # remove original transition
-            mutation = AST_tools.remove_node(transformed_tree, edge)
+            edits = [Edit("remove", (i,))]
 
             for expr in clock_expressions:
                 
                 def negate_expr(expr: ParseTree) -> ParseTree:
-                    old_cmp = next(expr.scan_values(lambda t: t in cmps))
+                    cmp_idx, old_cmp = next((j, child) for j, child in enumerate(expr.children) if child in cmps)
 
                     match old_cmp:
                         case "<=":
-                            return Tree(Token('RULE', 'atomic_expr'), [AST_tools.exchange_node(expr, cmp_tokens[old_cmp], Token("CMP_GEQ_TOK", ">"))])
+                            return Tree(Token('RULE', 'atomic_expr'), [AST_tools.exchange_node_at(expr, (cmp_idx,), cmp_tokens[">"])])
                         case "<":
-                            return Tree(Token('RULE', 'atomic_expr'), [AST_tools.exchange_node(expr, cmp_tokens[old_cmp], Token("CMP_GEQ_TOK", ">="))])
+                            return Tree(Token('RULE', 'atomic_expr'), [AST_tools.exchange_node_at(expr, (cmp_idx,), cmp_tokens[">="])])
                         case ">=":
-                            return Tree(Token('RULE', 'atomic_expr'), [AST_tools.exchange_node(expr, cmp_tokens[old_cmp], Token("CMP_GEQ_TOK", "<"))])
+                            return Tree(Token('RULE', 'atomic_expr'), [AST_tools.exchange_node_at(expr, (cmp_idx,), cmp_tokens["<"])])
                         case ">":
-                            return Tree(Token('RULE', 'atomic_expr'), [AST_tools.exchange_node(expr, cmp_tokens[old_cmp], Token("CMP_GEQ_TOK", "<="))])
+                            return Tree(Token('RULE', 'atomic_expr'), [AST_tools.exchange_node_at(expr, (cmp_idx,), cmp_tokens["<="])])
                         # there should be no equals comparators left after transformation
                         case _: 
                             raise ValueError(f"Unknown cmp {old_cmp}")
@@ -370,35 +360,29 @@ def negate_guard(tree: ParseTree) -> list[ParseTree]:
                                   Tree(Token('RULE', 'expr'), all_atomic_expressions)])
 
                 # exchange node                
-                new_edge = AST_tools.exchange_node(edge, guard, new_guard)
-                mutation.children.append(Token('NEWLINE_TOK', '\n\n'))
-                mutation.children.append(new_edge)
+                new_edge = AST_tools.exchange_node_at(edge, guard_path, new_guard)
+                edits.append(Edit("insert", (len(tree.children),), Token('NEWLINE_TOK', '\n\n')))
+                edits.append(Edit("insert", (len(tree.children),), new_edge))
             
-            mutations.append(mutation)
-
-    return mutations
+            yield Mutation("negate_guard", tuple(edits), declaration_provenance(edge, "provided"))
 
 # structure changing operators
 
-def add_location(tree: ParseTree) -> list[ParseTree]:
+def add_location(tree: ParseTree) -> Iterator[Mutation]:
     """
-    Computes a list of mutations of the given TA by adding a sink location.
+    Yields mutations of the given TA by adding a sink location.
     For each mutation, one transition of the TA is redirected to the new location.
 
     :param tree: AST of TA to be mutated
-    :return: list of mutated ASTs
+    :return: iterator over mutations
     """
 
-    mutations = []
+    index = declaration_index.get(tree)
 
     # find fresh location id non-existent in original TA
-    new_location_id = Tree(Token('RULE', 'id'), [Token('__ANON_0', 'new_loc')])
-    for i in range(sys.maxsize):
-        if(not AST_tools.contains_child_node(tree, new_location_id)):
-            break
-        new_location_id = Tree(Token('RULE', 'id'), [Token('__ANON_0', f'new_loc_{i}')])
+    new_location_id = Tree(Token('RULE', 'id'), [Token('ID_TOK', index.fresh_id('new_loc'))])
 
-    for process in tree.find_data("process_declaration"):
+    for process_idx, process in AST_tools.find_declarations(tree, "process_declaration"):
 
         process_id = process.children[2]
         # attribute list for new location is empty
@@ -414,61 +398,64 @@ def add_location(tree: ParseTree) -> list[ParseTree]:
                              new_location_id, 
                              attributes])
         
-        # add new location 
-        mutation = copy.deepcopy(tree)
-        new_location_index = mutation.children.index(process) + 1
-        mutation.children.insert(new_location_index, Token('NEWLINE_TOK', '\n\n'))
-        mutation.children.insert(new_location_index + 1, new_location)
-        mutation.children.insert(new_location_index + 2, Token('NEWLINE_TOK', '\n'))
+        # add new location after process declaration
+        new_location_index = process_idx + 1
+        new_location_edits = (Edit("insert", (new_location_index,), Token('NEWLINE_TOK', '\n\n')),
+                              Edit("insert", (new_location_index,), new_location),
+                              Edit("insert", (new_location_index,), Token('NEWLINE_TOK', '\n')))
 
-        # redirect transitions belonging to same process
-        for edge in tree.find_pred(lambda t: t.data == "edge_declaration" and t.children[2] == process_id):
+        # only redirect transitions belonging to same process
+        for i, edge in index.edges_by_process.get(declaration_index.name(process_id), []):
 
-            altered_edge = copy.deepcopy(edge)
+            altered_edge = AST_tools.shallow_copy(edge)
             altered_edge.children[6] = new_location_id
 
-            mutations.append(AST_tools.exchange_node(mutation, edge, altered_edge))
+            # the redirected transition is labelled as in the original TA, the new location as in the mutated TA
+            provenance = declaration_provenance(edge, "target")._replace(locations = (declaration_index.location_label(new_location),))
+            yield Mutation("add_location", new_location_edits + (Edit("replace", (i,), altered_edge),), provenance)
 
-    return mutations
-
-def add_transition(tree: ParseTree) -> list[ParseTree]:
+def add_transition(tree: ParseTree) -> Iterator[Mutation]:
     """
-    Computes a list of mutations of the given TA.
+    Yields mutations of the given TA.
     For each mutation, the first declared transition of the TA is cloned and its source and target location are changed to two different locations (both in the same process).
 
     :param tree: AST of TA to be mutated
-    :return: list of mutated ASTs
+    :return: iterator over mutations
     """
 
-    mutations = []
+    index = declaration_index.get(tree)
+
+    # transitions can only be added if there is a transition to be cloned and an event declaration to add the dummy event before
+    first_event = next(AST_tools.find_declarations(tree, "event_declaration"), None)
+    if(first_event is None or len(index.edges) == 0):
+        return
 
     # find fresh event id non-existent in original TA
-    dummy_event_id = Tree(Token('RULE', 'id'), [Token('__ANON_0', 'dummy')])
-    for i in range(sys.maxsize):
-        if(not AST_tools.contains_child_node(tree, dummy_event_id)):
-            break
-        dummy_event_id = Tree(Token('RULE', 'id'), [Token('__ANON_0', f'dummy_{i}')])
-
-    # add dummy event declaration to tree
-    tree_with_dummy_event = copy.deepcopy(tree)
-    dummy_idx = tree_with_dummy_event.children.index(next(tree.find_data("event_declaration")))
+    dummy_event_id = Tree(Token('RULE', 'id'), [Token('ID_TOK', index.fresh_id('dummy'))])
+
+    # add dummy event declaration before first event declaration
+    dummy_idx, _ = first_event
     dummy_event = Tree(Token('RULE', 'event_declaration'), 
                        [Token('EVENT_TOK', 'event'), Token('COLON_TOK', ':'), dummy_event_id])
-    tree_with_dummy_event.children.insert(dummy_idx, Token('NEWLINE_TOK', '\n'))
-    tree_with_dummy_event.children.insert(dummy_idx, dummy_event)
+    dummy_event_edits = (Edit("insert", (dummy_idx,), dummy_event),
+                         Edit("insert", (dummy_idx,), Token('NEWLINE_TOK', '\n')))
 
-    for process in tree.find_data("process_declaration"):
+    # find transition to be cloned (first transition)
+    _, first_edge = index.edges[0]
 
-        process_id = process.children[2]
+    for process_id in index.processes:
 
         # choose source and target location belonging to same process
-        locations = [location.children[4] for location in tree.find_data("location_declaration") if location.children[2] == process_id]
+        locations = index.location_ids(process_id)
 
         for source_location in locations:
             for target_location in locations:
 
-                # find transition to be cloned (first transition)
-                new_edge = copy.deepcopy(next(tree.find_data("edge_declaration")))
+                # skip this mutation if there already is a transition with same source and target location
+                if((declaration_index.name(process_id), declaration_index.name(source_location), declaration_index.name(target_location)) in index.edges_by_source_and_target):
+                    continue
+
+                new_edge = AST_tools.shallow_copy(first_edge)
                 
                 # exchange source and target location as well as event
                 new_edge.children[2] = process_id
@@ -476,115 +463,112 @@ def add_transition(tree: ParseTree) -> list[ParseTree]:
                 new_edge.children[6] = target_location
                 new_edge.children[8] = dummy_event_id
 
-                # skip this mutation if there already is a transition with same source and target location
-                if(0 < len([edge for edge in tree.find_data("edge_declaration") if edge.children[2] == process_id and edge.children[4] == source_location and edge.children[6] == target_location])):
-                    continue
-
                 # add transition    
-                mutation = copy.deepcopy(tree_with_dummy_event)
-                mutation.children.append(Token('NEWLINE_TOK', '\n\n'))
-                mutation.children.append(new_edge)
-
-                mutations.append(mutation)
+                new_edge_edits = (Edit("insert", (len(tree.children),), Token('NEWLINE_TOK', '\n\n')),
+                                  Edit("insert", (len(tree.children),), new_edge))
 
-    return mutations
+                # the new transition is labelled as in the mutated TA (i.e. with the dummy event)
+                process_name = declaration_index.name(process_id)
+                provenance = Provenance((process_name,),
+                                        locations = tuple(dict.fromkeys(f"{process_name}:{declaration_index.name(location)}" for location in (source_location, target_location))),
+                                        edges = (declaration_index.edge_label(new_edge),))
+                yield Mutation("add_transition", dummy_event_edits + new_edge_edits, provenance)
 
-def change_transition_source_or_target(tree: ParseTree, change_source: bool) -> list[ParseTree]:
+def change_transition_source_or_target(tree: ParseTree, change_source: bool) -> Iterator[Mutation]:
     """
-    Computes a list of mutations of the given TA such that for each mutation the source or target location of one transition is changes to a different location in the same process.
+    Yields mutations of the given TA such that for each mutation the source or target location of one transition is changes to a different location in the same process.
 
     :param tree: AST of TA to be mutated
     :param change_source: Method changes source location of transition iff True, target location otherwise.
-    :return: list of mutated ASTs
+    :return: iterator over mutations
     """
 
-    mutations = []
+    op = "change_transition_source" if change_source else "change_transition_target"
+    index = declaration_index.get(tree)
 
-    for edge in tree.find_data("edge_declaration"):
+    for i, edge in index.edges:
 
         process_id = edge.children[2]
         source_location_id = edge.children[4]
         target_location_id = edge.children[6]
 
         # find new source or target location
-        new_location_options = [location.children[4] for location in tree.find_data("location_declaration") if location.children[2] == process_id]
-        new_location_options.remove(source_location_id if change_source else target_location_id)
+        old_location_id = source_location_id if change_source else target_location_id
+        new_location_options = index.location_ids(process_id)
+        new_location_options.remove(old_location_id)
+
+        provenance = declaration_provenance(edge, "source" if change_source else "target")
+        process_name = declaration_index.name(process_id)
             
         for location in new_location_options:
             # change transition
-            altered_edge = copy.deepcopy(edge)
+            altered_edge = AST_tools.shallow_copy(edge)
             old_location_idx = 4 if change_source else 6
             altered_edge.children[old_location_idx] = location
-            mutations.append(AST_tools.exchange_node(tree, edge, altered_edge))
+            # old and new source or target location are affected
+            locations = tuple(f"{process_name}:{declaration_index.name(location_id)}" for location_id in (old_location_id, location))
+            yield Mutation(op, (Edit("replace", (i,), altered_edge),), provenance._replace(locations = locations))
 
-    return mutations
-
-def remove_location(tree: ParseTree) -> list[ParseTree]:
+def remove_location(tree: ParseTree) -> Iterator[Mutation]:
     """
-    Computes a list of mutations of the given TA such that for each mutation one location is removed.
+    Yields mutations of the given TA such that for each mutation one location is removed.
 
     :param tree: AST of TA to be mutated
-    :return: list of mutated ASTs
+    :return: iterator over mutations
     """
 
-    mutations = []
+    index = declaration_index.get(tree)
 
     # find non-initial locations
-    locations = list(tree.find_data("location_declaration"))
+    locations = list(AST_tools.find_declarations(tree, "location_declaration"))
     initial_attribute = next(tree.find_data("initial_attribute"))
-    locations = [location for location in locations if not AST_tools.contains_child_node(location, initial_attribute)]
+    locations = [(i, location) for i, location in locations if not AST_tools.contains_child_node(location, initial_attribute)]
 
-    for location in locations:
-        process_id = location.children[2]
-        location_id = location.children[4]
+    for i, location in locations:
+        process_name = declaration_index.name(location.children[2])
+        location_name = declaration_index.name(location.children[4])
 
         # find all transitions going into or out of location
-        edges_to_be_removed = [edge for edge in tree.find_data("edge_declaration") if edge.children[2] == process_id and (edge.children[4] == location_id or edge.children[6] == location_id)]
+        edges_to_be_removed = index.edges_by_location.get((process_name, location_name), [])
 
-        # remove location and transitions belonging to it
-        mutation = AST_tools.remove_node(tree, location)
-        for edge in edges_to_be_removed:
-            mutation = AST_tools.remove_node(mutation, edge)
-        mutations.append(mutation)
+        provenance = declaration_provenance(location)._replace(edges = tuple(declaration_index.edge_label(edge) for _, edge in edges_to_be_removed))
 
-    return mutations
+        # remove location and transitions belonging to it
+        yield Mutation("remove_location", tuple(Edit("remove", (j,)) for j in [i] + [j for j, _ in edges_to_be_removed]), provenance)
 
-def remove_transition(tree: ParseTree) -> list[ParseTree]:
+def remove_transition(tree: ParseTree) -> Iterator[Mutation]:
     """
-    Computes a list of mutations of the given TA such that for each mutation one transition is removed.
+    Yields mutations of the given TA such that for each mutation one transition is removed.
 
     :param tree: AST of TA to be mutated
-    :return: list of mutated ASTs
+    :return: iterator over mutations
     """
 
-    mutations = []
-
-    for edge in tree.find_data("edge_declaration"):
+    for i, edge in declaration_index.get(tree).edges:
         # remove transition
-        mutations.append(AST_tools.remove_node(tree, edge))
-
-    return mutations
+        yield Mutation("remove_transition", (Edit("remove", (i,)),), declaration_provenance(edge))
 
 # synchronisation changing operators
 
-def add_sync(tree: ParseTree) -> list[ParseTree]:
+def add_sync(tree: ParseTree) -> Iterator[Mutation]:
     """
-    Computes a list of mutations of the given TA such that for each mutation one synchronisation is added.
+    Yields mutations of the given TA such that for each mutation one synchronisation is added.
     Number of sync constraints in one synchronistion is at least two and at most the number of processes in the TA.
 
     :param tree: AST of TA to be mutated
-    :return: list of mutated ASTs
+    :return: iterator over mutations
     """
 
-    mutations = []
+    index = declaration_index.get(tree)
+    existing_syncs = set(sync for _, sync in index.syncs)
 
     # find every process
-    processes = [process.children[2] for process in tree.find_data("process_declaration")]
+    processes = index.processes.copy()
 
     # find every possible sync_constraint
     sync_constraints = []
     for process in processes:
-        for event in [event.children[2] for event in tree.find_data("event_declaration")]:
+        for event in index.events:
             new_sync_constraint = Tree(Token('RULE', 'sync_constraint'), 
                                        [process, Token('AT_TOK', '@'), event])
             sync_constraints.append(new_sync_constraint)
@@ -595,9 +579,9 @@ def add_sync(tree: ParseTree) -> list[ParseTree]:
         # get all sync constraints containing process
         sync_constraints_for_process = [sync_constraint for sync_constraint in sync_constraints if sync_constraint.children[0] == process]
 
-        def add_sync_helper(sync_constraints_already_in_declaration: list[Tree | Token], remaining_processes: list[Tree | Token]) -> None:
+        def add_sync_helper(sync_constraints_already_in_declaration: list[Tree | Token], remaining_processes: list[Tree | Token]) -> Iterator[Mutation]:
 
-            remaining_processes = copy.deepcopy(remaining_processes)
+            remaining_processes = remaining_processes.copy()
             while(len(remaining_processes) > 0):
 
                 process = remaining_processes.pop(0)
@@ -606,8 +590,6 @@ def add_sync(tree: ParseTree) -> list[ParseTree]:
 
                 for new_sync_constraint in sync_constraints_for_process:
 
-                    mutation = copy.deepcopy(tree)
-
                     # add new sync constraint
                     new_sync_constraints = sync_constraints_already_in_declaration + [Token('COLON_TOK', ':'), new_sync_constraint]
                     # define new sync declaration
@@ -618,156 +600,187 @@ def add_sync(tree: ParseTree) -> list[ParseTree]:
                                                     new_sync_constraints)])
                     
                     # skip mutation if original TA already constains this exact sync declaration
-                    if(not AST_tools.contains_child_node(tree, new_sync_declaration)):
+                    if(new_sync_declaration not in existing_syncs):
                         # add new sync declaration
-                        mutation.children.append(new_sync_declaration)
-                        mutations.append(mutation)
+                        yield Mutation("add_sync", (Edit("insert", (len(tree.children),), new_sync_declaration),), sync_provenance(new_sync_declaration))
                     
-                    add_sync_helper(new_sync_constraints, remaining_processes)
+                    yield from add_sync_helper(new_sync_constraints, remaining_processes)
 
         for sync_constraint in sync_constraints_for_process:
-            add_sync_helper([sync_constraint], processes)
+            yield from add_sync_helper([sync_constraint], processes)
 
-    return mutations
+def sample_add_sync(tree: ParseTree, size: int, rng: random.Random, by_processes: bool = False) -> list[Mutation] | None:
+    """
+    Draws distinct mutations of add_sync (see add_sync) at random without enumerating all of them.
+    For each mutation, every process independently takes part in the new synchronisation with one of the events or not at all (uniformly over all mutations),
+    or, if drawn by processes, the synchronising processes are drawn first and their events afterwards (uniformly over all sets of synchronising processes).
+    Drawings with less than two sync constraints or yielding an existing synchronisation are repeated.
+
+    :param tree: AST of TA to be mutated
+    :param size: number of mutations to be drawn
+    :param rng: random generator
+    :param by_processes: whether to draw the set of synchronising processes uniformly instead of the mutation
+    :return: mutations in the order they are yielded by add_sync, None if there are not considerably more mutations than requested (they should be enumerated then)
+    """
+
+    index = declaration_index.get(tree)
+    existing_syncs = set(sync for _, sync in index.syncs)
+    processes, events = index.processes, index.events
+
+    # number of synchronisations of at least two processes, drawing is only efficient if most of them are not requested
+    number_of_syncs = (len(events) + 1) ** len(processes) - 1 - len(processes) * len(events)
+    if(2 * (size + len(existing_syncs)) > number_of_syncs):
+        return None
+
+    # mutations by chosen (process, event) pairs, the pairs are ordered by process like the sync constraints of add_sync
+    mutations = {}
+    while(len(mutations) < size):
+        if(by_processes):
+            choice = tuple((p, rng.randrange(len(events))) for p in range(len(processes)) if rng.random() < 0.5)
+        else:
+            choice = tuple((p, e) for p, e in enumerate(rng.randrange(len(events) + 1) for _ in processes) if e < len(events))
+        if(len(choice) < 2 or choice in mutations):
+            continue
 
-def add_sync_constraint(tree: ParseTree) -> list[ParseTree]:
+        new_sync_constraints = []
+        for p, e in choice:
+            if(len(new_sync_constraints) > 0):
+                new_sync_constraints.append(Token('COLON_TOK', ':'))
+            new_sync_constraints.append(Tree(Token('RULE', 'sync_constraint'), [processes[p], Token('AT_TOK', '@'), events[e]]))
+        new_sync_declaration = Tree(Token('RULE', 'sync_declaration'), 
+                                    [Token('SYNC_TOK', 'sync'), 
+                                    Token('COLON_TOK', ':'), 
+                                    Tree(Token('RULE', 'sync_constraints'), 
+                                        new_sync_constraints)])
+
+        # skip mutation if original TA already constains this exact sync declaration
+        if(new_sync_declaration not in existing_syncs):
+            mutations[choice] = Mutation("add_sync", (Edit("insert", (len(tree.children),), new_sync_declaration),), sync_provenance(new_sync_declaration))
+
+    # add_sync yields synchronisations in lexicographic order of their (process, event) pairs
+    return [mutations[choice] for choice in sorted(mutations)]
+
+def add_sync_constraint(tree: ParseTree) -> Iterator[Mutation]:
     """
-    Computes a list of mutations of the given TA such that for each mutation one sync constraint is added to an already existing synchronisation.
+    Yields mutations of the given TA such that for each mutation one sync constraint is added to an already existing synchronisation.
 
     :param tree: AST of TA to be mutated
-    :return: list of mutated ASTs
+    :return: iterator over mutations
     """
-    
-    # move all sync declarations to the end of system declaration to avoid references to undeclared processes or events
-    transformed_tree = transformers.MoveSyncsToEnd().transform(tree)
 
-    mutations = []
+    index = declaration_index.get(tree)
 
     # find every possible sync_constraint
     sync_constraints = []
-    for process in [process.children[2] for process in transformed_tree.find_data("process_declaration")]:
-        for event in [event.children[2] for event in transformed_tree.find_data("event_declaration")]:
+    for process in index.processes:
+        for event in index.events:
             new_sync_constraint = Tree(Token('RULE', 'sync_constraint'), 
                                        [process, Token('AT_TOK', '@'), event])
             sync_constraints.append(new_sync_constraint)
 
-    for sync in transformed_tree.find_data("sync_declaration"):
+    for i, sync in index.syncs:
         for sync_constraint in sync_constraints:
 
             # skip sync constraint if its process is already appearing in sycnhronisation
             if(AST_tools.contains_child_node(sync, sync_constraint.children[0])):
                 continue
 
-            new_sync = copy.deepcopy(sync)
-
-            new_sync.children[2].children.append(Token('COLON_TOK', ':'))
-            new_sync.children[2].children.append(sync_constraint)
+            num_sync_constraints = len(sync.children[2].children)
+            new_sync = AST_tools.insert_node_at(sync, (2, num_sync_constraints), Token('COLON_TOK', ':'))
+            new_sync = AST_tools.insert_node_at(new_sync, (2, num_sync_constraints + 1), sync_constraint)
 
-            mutations.append(AST_tools.exchange_node(transformed_tree, sync, new_sync))
+            # move altered sync declaration to the end of system declaration to avoid references to undeclared processes or events
+            yield Mutation("add_sync_constraint", (Edit("remove", (i,)),
+                                                   Edit("insert", (len(tree.children),), Token('NEWLINE_TOK', '\n')),
+                                                   Edit("insert", (len(tree.children),), new_sync)),
+                           sync_provenance(sync, "sync constraint", (declaration_index.name(sync_constraint.children[0]),)))
 
-    return mutations
-
-def change_sync_event(tree: ParseTree) -> list[ParseTree]:
+def change_sync_event(tree: ParseTree) -> Iterator[Mutation]:
     """
-    Computes a list of mutations of the given TA such that for each mutation one event in one synchronisation is changed.
+    Yields mutations of the given TA such that for each mutation one event in one synchronisation is changed.
 
     :param tree: AST of TA to be mutated
-    :return: list of mutated ASTs
+    :return: iterator over mutations
     """
 
-    mutations = []
+    index = declaration_index.get(tree)
 
-    for sync in tree.find_data("sync_declaration"):
+    for i, sync in index.syncs:
+        provenance = sync_provenance(sync, "event")
 
-        for sync_constraint in sync.find_data("sync_constraint"):
+        for sync_constraint_path, sync_constraint in AST_tools.find_data_with_paths(sync, "sync_constraint"):
 
             old_event = sync_constraint.children[2]
 
-            for event in [event.children[2] for event in tree.find_data("event_declaration")]:
+            for event in index.events:
                 # skip mutation if new event is old event
                 if (event == old_event):
                     continue
                 # exchange event
-                altered_sync_constraint = AST_tools.exchange_node(sync_constraint, old_event, event)
-                altered_sync = AST_tools.exchange_node(sync, sync_constraint, altered_sync_constraint)
+                altered_sync = AST_tools.exchange_node_at(sync, sync_constraint_path + (2,), event)
                 # exchange synchronisation
-                mutations.append(AST_tools.exchange_node(tree, sync, altered_sync))
-
-    return mutations
+                yield Mutation("change_sync_event", (Edit("replace", (i,), altered_sync),), provenance)
 
-def invert_sync_weakness(tree: ParseTree) -> list[ParseTree]:
+def invert_sync_weakness(tree: ParseTree) -> Iterator[Mutation]:
     """
-    Computes a list of mutations of the given TA such that for each mutation the weakness of one sync constraint is flipped (added if non-existent, removed if existent).
+    Yields mutations of the given TA such that for each mutation the weakness of one sync constraint is flipped (added if non-existent, removed if existent).
 
     :param tree: AST of TA to be mutated
-    :return: list of mutated ASTs
+    :return: iterator over mutations
     """
 
-    mutations = []
-
-    for sync in tree.find_data("sync_declaration"):
+    for sync_idx, sync in AST_tools.find_declarations(tree, "sync_declaration"):
+        provenance = sync_provenance(sync, "weakness")
         
         # skip colons
         for i in range(0, len(sync.children[2].children), 2):
-            altered_sync = copy.deepcopy(sync)
             weakness_op = Token('QUESTION_MARK_TOK', '?')
 
             # remove or add weakness operator
-            if(3 == len(altered_sync.children[2].children[i].children)): 
-                altered_sync.children[2].children[i].children.append(weakness_op) 
+            if(3 == len(sync.children[2].children[i].children)): 
+                altered_sync = AST_tools.insert_node_at(sync, (2, i, 3), weakness_op)
             else: 
-                altered_sync.children[2].children[i].children.pop(3) 
+                altered_sync = AST_tools.remove_node_at(sync, (2, i, 3))
 
             # exchange node
-            mutations.append(AST_tools.exchange_node(tree, sync, altered_sync))
+            yield Mutation("invert_sync_weakness", (Edit("replace", (sync_idx,), altered_sync),), provenance)
 
-    return mutations
-
-def remove_sync(tree: ParseTree) -> list[ParseTree]:
+def remove_sync(tree: ParseTree) -> Iterator[Mutation]:
     """
-    Computes a list of mutations of the given TA such that for each mutation one synchronisation is removed.
+    Yields mutations of the given TA such that for each mutation one synchronisation is removed.
 
     :param tree: AST of TA to be mutated
-    :return: list of mutated ASTs
+    :return: iterator over mutations
     """
 
-    mutations = []
-
-    for sync in tree.find_data("sync_declaration"):
+    for i, sync in AST_tools.find_declarations(tree, "sync_declaration"):
         # remove sync
-        mutations.append(AST_tools.remove_node(tree, sync))
+        yield Mutation("remove_sync", (Edit("remove", (i,)),), sync_provenance(sync))
 
-    return mutations
-
-def remove_sync_constraint(tree: ParseTree) -> list[ParseTree]:
+def remove_sync_constraint(tree: ParseTree) -> Iterator[Mutation]:
     """
-    Computes a list of mutations of the given TA such that for each mutation one sync constraint is removed from a synchronisation with more than one sync constraint.
+    Yields mutations of the given TA such that for each mutation one sync constraint is removed from a synchronisation with more than one sync constraint.
 
     :param tree: AST of TA to be mutated
-    :return: list of mutated ASTs
+    :return: iterator over mutations
     """
 
-    mutations = []
-
-    for sync in tree.find_data("sync_declaration"):
+    for sync_idx, sync in AST_tools.find_declarations(tree, "sync_declaration"):
 
         # only remove sync constraints from synchronisation if there are more than two
         if(len(sync.children[2].children) > 3):
+            provenance = sync_provenance(sync, "sync constraint")
             
             # skip colons
             for i in range(0, len(sync.children[2].children), 2):
-                altered_sync = copy.deepcopy(sync)
-                
                 # remove sync constraint
-                altered_sync.children[2].children.pop(i)
+                altered_sync = AST_tools.remove_node_at(sync, (2, i))
 
                 # remove preceding and succeeding colons if necessary
                 if(i == len(sync.children[2].children) - 1):
-                    altered_sync.children[2].children.pop(i - 1)
+                    altered_sync = AST_tools.remove_node_at(altered_sync, (2, i - 1))
                 else: 
-                    altered_sync.children[2].children.pop(i)
+                    altered_sync = AST_tools.remove_node_at(altered_sync, (2, i))
 
                 # exchange node
-                mutations.append(AST_tools.exchange_node(tree, sync, altered_sync))
-
-    return mutations
\ No newline at end of file
+                yield Mutation("remove_sync_constraint", (Edit("replace", (sync_idx,), altered_sync),), provenance)
@@ -0,0 +1,126 @@
+import mutate
+import verdict_cache
+
+import asyncio
+import concurrent.futures
+
+from collections.abc import AsyncIterator, Iterable
+
+# marks the end of the items passed from one stage to the next
+end = object()
+
+async def check_mutations(original_ta: str | None, mutated_tas: Iterable[tuple], executor: concurrent.futures.Executor | None = None, workers: int = 1, queue_size: int = 16,
+                          cache: verdict_cache.VerdictCache | None = None, timeout: float | None = None, memory_limit: int | None = None) -> AsyncIterator[tuple]:
+    """
+    Checks given mutations of TA with TChecker like mutate.check_mutations, but in a pipeline of stages connected by bounded queues, yielding results in order of completion.
+
+    The generation stage advances the lazy iterable of mutations (i.e. generation, materialization and static equivalence detection, see mutate.materialize_mutations) in a separate thread,
+    so the event loop is not blocked. Mutations that are known to be equivalent to the original or whose results are cached are passed on to the results directly.
+    Every step of the check (syntax check, reachability check and bisimulation check, see mutate.check_steps) is a stage of its own,
+    in which given number of workers each dispatch one step at a time to the executor (see mutate.limited_check_mutation).
+    Mutations that fail a step (i.e. are semantically faulty or exceed a limit) are passed on to the results directly, the others to the next stage.
+    Every queue holds at most queue_size mutations, so fast stages run ahead of slow ones only that far, and the stages wait for a slow consumer instead of buffering all results.
+
+    :param original_ta: original TA in TChecker syntax (only needed for mutations without a pair of TAs to be checked instead)
+    :param mutated_tas: tuples of mutated TA, reason why it is equivalent to the original and pair of TAs to be checked instead (see mutate.check_mutations),
+                        further elements of the tuples (e.g. the mutation) are passed through
+    :param executor: executor to run checks in, the default executor of the event loop (a thread pool) is used if None
+    :param workers: maximum number of concurrent checks of every step
+    :param queue_size: maximum number of mutations waiting between two stages
+    :param cache: cache of results of previous checks (only accessed from the thread running the event loop)
+    :param timeout: maximum wall-clock time of every check in seconds, shared by all of its steps (no limit if None)
+    :param memory_limit: maximum virtual memory of every step of a check in megabytes (no limit if None)
+    :return: async iterator over tuples of mutated TA, result of check, reason of equivalence, resource usage of the TChecker tools (see mutate.check_mutations)
+             and the further elements of the given tuple
+    """
+
+    loop = asyncio.get_running_loop()
+    # mutations waiting for every step of the check
+    to_check = [asyncio.Queue(queue_size) for _ in mutate.check_steps]
+    results = asyncio.Queue(queue_size)
+
+    async def generate() -> None:
+        iterator = iter(mutated_tas)
+        # the thread is not waited for when the stage is cancelled (e.g. if the consumer stops early), as it may still be advancing the iterator
+        generator_thread = concurrent.futures.ThreadPoolExecutor(max_workers = 1)
+        try:
+            while(True):
+                item = await loop.run_in_executor(generator_thread, next, iterator, end)
+                if(item is end):
+                    break
+
+                mutated_ta, reason, checked_tas, *rest = item
+                checked_tas = checked_tas or (original_ta, mutated_ta)
+                if(reason is not None):
+                    await results.put((mutated_ta, True, reason, {}, *rest))
+                    continue
+                if(cache is not None):
+                    try:
+                        is_bisimilar_to_original = cache.get(*checked_tas)
+                    except KeyError:
+                        pass
+                    else:
+                        await results.put((mutated_ta, is_bisimilar_to_original, reason, {}, *rest))
+                        continue
+                await to_check[0].put((mutated_ta, checked_tas, {}, rest))
+        finally:
+            generator_thread.shutdown(wait = False, cancel_futures = True)
+
+        for _ in range(workers):
+            await to_check[0].put(end)
+
+    # number of workers of every step that are done, the last one passes the end on to the next step
+    done = [0 for _ in mutate.check_steps]
+
+    async def check(i: int) -> None:
+        step = mutate.check_steps[i]
+        is_last = len(mutate.check_steps) - 1 == i
+
+        while(True):
+            item = await to_check[i].get()
+            if(item is end):
+                break
+
+            mutated_ta, checked_tas, timings, rest = item
+            # the timeout is shared by all steps of a check
+            remaining = None if timeout is None else max(timeout - sum(timing["wall_time"] for timing in timings.values()), 0.0)
+            outcome, step_timings = await loop.run_in_executor(executor, mutate.limited_check_mutation, *checked_tas, remaining, memory_limit, (step,))
+            timings = timings | step_timings
+
+            # mutations that are semantically faulty or exceed a limit are not checked any further
+            if(not is_last and outcome is True):
+                await to_check[i + 1].put((mutated_ta, checked_tas, timings, rest))
+                continue
+            # results of checks exceeding a limit are unknown and may differ with other limits
+            if(cache is not None and not isinstance(outcome, str)):
+                cache.put(*checked_tas, outcome)
+            await results.put((mutated_ta, outcome, None, timings, *rest))
+
+        done[i] = done[i] + 1
+        if(not is_last and workers == done[i]):
+            for _ in range(workers):
+                await to_check[i + 1].put(end)
+
+    # every stage passes its end (or the error it failed with) on to the results
+    async def run(stage, *args) -> None:
+        try:
+            await stage(*args)
+        except Exception as error:
+            await results.put(error)
+            return
+        await results.put(end)
+
+    tasks = [asyncio.create_task(run(generate))] + [asyncio.create_task(run(check, i)) for i in range(len(mutate.check_steps)) for _ in range(workers)]
+    try:
+        running = len(tasks)
+        while(running > 0):
+            item = await results.get()
+            if(item is end):
+                running = running - 1
+            elif(isinstance(item, Exception)):
+                raise item
+            else:
+                yield item
+    finally:
+        for task in tasks:
+            task.cancel()
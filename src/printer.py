@@ -0,0 +1,81 @@
+from collections.abc import Iterable
+
+from lark import ParseTree, Token, Tree
+from lark.utils import is_id_continue
+
+def join_tokens(tokens: Iterable[str]) -> str:
+    """
+    Joins given tokens into one string.
+    A space is inserted between two tokens iff they would otherwise merge into one identifier (same as lark.reconstruct.Reconstructor).
+
+    :param tokens: tokens to be joined
+    :return: joined string
+    """
+
+    result = []
+    prev_token = ""
+    for token in tokens:
+        if(prev_token and token and is_id_continue(prev_token[-1]) and is_id_continue(token[0])):
+            result.append(" ")
+        result.append(token)
+        prev_token = token
+
+    return "".join(result)
+
+def tokens(node: ParseTree | Token) -> Iterable[str]:
+    """
+    Yields all tokens of given node in order, including tokens filtered out by the parser.
+
+    :param node: node to be serialized
+    :return: iterator over tokens
+    """
+
+    stack = [node]
+    while(len(stack) > 0):
+        node = stack.pop()
+
+        if(isinstance(node, Token)):
+            yield str(node)
+            continue
+
+        children = node.children
+        # commas between labels are filtered out by the parser
+        if(node.data == "labels_attribute"):
+            children = children[:3] + [child for label in children[3:] for child in (Token("COMMA", ","), label)]
+
+        stack.extend(reversed(children))
+
+def to_text(node: ParseTree | Token) -> str:
+    """
+    Serializes given node in TChecker syntax in a single pass over the tree.
+
+    :param node: node to be serialized
+    :return: TChecker text of node
+    """
+
+    return join_tokens(tokens(node))
+
+class Printer:
+    """
+    Serializes ASTs of mutations of one TA in TChecker syntax.
+    The text of each declaration of the original AST is computed once, mutations only serialize the declarations they altered.
+    (Mutations share unaltered declarations with the original AST, see descriptors.materialize.)
+    """
+
+    def __init__(self, tree: ParseTree):
+        """
+        :param tree: AST of original TA
+        """
+
+        self.tree = tree
+        self.declaration_texts = {id(child): to_text(child) for child in tree.children}
+
+    def to_text(self, tree: ParseTree) -> str:
+        """
+        Serializes given AST of TA in TChecker syntax.
+
+        :param tree: AST of (mutated) TA
+        :return: TChecker text of TA
+        """
+
+        return join_tokens(self.declaration_texts.get(id(child)) or to_text(child) for child in tree.children)
@@ -0,0 +1,182 @@
+import contextlib
+import csv
+import json
+import os.path
+import threading
+import time
+import tracemalloc
+
+from collections.abc import Iterable, Iterator
+
+try:
+    import resource
+except ImportError:
+    # resource usage of the process is only available on Unix, peak memory is not recorded otherwise
+    resource = None
+
+def usage() -> dict[str, float]:
+    """
+    Returns current resource usage of the process, including CPU time of terminated child processes (e.g. TChecker calls).
+
+    :return: wall time and CPU time in seconds and peak memory of the child processes (maximum resident set size of all terminated children so far) in kilobytes
+    """
+
+    current = {"wall_time": time.perf_counter(), "cpu_time": time.process_time(), "child_peak_memory": 0}
+    if(resource is not None):
+        children = resource.getrusage(resource.RUSAGE_CHILDREN)
+        current["cpu_time"] = current["cpu_time"] + children.ru_utime + children.ru_stime
+        current["child_peak_memory"] = children.ru_maxrss
+    return current
+
+# peak traced memory of all measurements in progress, in bytes (the peak of tracemalloc is reset by every measurement, so it is passed on to the enclosing ones)
+_open_peaks: list[list[int]] = []
+_peaks_lock = threading.Lock()
+
+def _update_peaks() -> None:
+    peak = tracemalloc.get_traced_memory()[1]
+    for open_peak in _open_peaks:
+        open_peak[0] = max(open_peak[0], peak)
+    tracemalloc.reset_peak()
+
+def new_usage() -> dict[str, float]:
+    """
+    :return: resource usage without any calls
+    """
+
+    return {"calls": 0, "wall_time": 0.0, "cpu_time": 0.0, "peak_memory": 0, "child_peak_memory": 0}
+
+@contextlib.contextmanager
+def measure(timings: dict[str, dict[str, float]] | None, name: str) -> Iterator[None]:
+    """
+    Adds resource usage of the enclosed code to given timings.
+
+    The peak memory is the peak of the memory allocated by Python while the code runs, above the memory allocated when it starts
+    (in kilobytes, only recorded if tracemalloc is tracing, e.g. with --profile).
+    Memory allocated by other threads in the meantime is included.
+    The peak memory of child processes is the maximum resident set size of the child processes terminated while the code runs (e.g. TChecker calls),
+    it is only known if one of them exceeds all earlier child processes of the process (0 otherwise), so it is exact in a fresh worker process (e.g. with --timeout).
+
+    :param timings: resource usage by name, nothing is recorded if None
+    :param name: name of measured code
+    """
+
+    if(timings is None):
+        yield
+        return
+
+    is_tracing = tracemalloc.is_tracing()
+    open_peak = [0]
+    allocated = 0
+    if(is_tracing):
+        with _peaks_lock:
+            _update_peaks()
+            _open_peaks.append(open_peak)
+            allocated = tracemalloc.get_traced_memory()[0]
+
+    start = usage()
+    try:
+        yield
+    finally:
+        end = usage()
+        if(is_tracing):
+            with _peaks_lock:
+                _update_peaks()
+                _open_peaks.remove(open_peak)
+
+        total = timings.setdefault(name, new_usage())
+        total["calls"] = total["calls"] + 1
+        total["wall_time"] = total["wall_time"] + end["wall_time"] - start["wall_time"]
+        total["cpu_time"] = total["cpu_time"] + end["cpu_time"] - start["cpu_time"]
+        total["peak_memory"] = max(total["peak_memory"], max(open_peak[0] - allocated, 0) // 1024)
+        if(end["child_peak_memory"] > start["child_peak_memory"]):
+            total["child_peak_memory"] = max(total["child_peak_memory"], end["child_peak_memory"])
+
+class Profile:
+    """
+    Resource usage of the stages of a run of mutate.py (e.g. parsing, generation of mutations per operator, TChecker checks) and of every single check of a mutation.
+    """
+
+    def __init__(self):
+        # resource usage of stages by operator ("" for stages not belonging to an operator)
+        self.stages: dict[str, dict[str, dict[str, float]]] = {}
+        # resource usage of every checked mutation
+        self.checks: list[dict] = []
+
+    def stage(self, name: str, op: str = "") -> contextlib.AbstractContextManager:
+        """
+        Measures resource usage of the enclosed code as (part of) given stage.
+
+        :param name: name of stage
+        :param op: mutation operator the stage belongs to
+        """
+
+        return measure(self.stages.setdefault(op, {}), name)
+
+    def iterate(self, iterable: Iterable, name: str, op: str = "") -> Iterator:
+        """
+        Measures resource usage of computing the items of given (lazy) iterable as (part of) given stage.
+
+        :param iterable: iterable to be measured
+        :param name: name of stage
+        :param op: mutation operator the stage belongs to
+        :return: iterator over items of given iterable
+        """
+
+        iterator = iter(iterable)
+        while(True):
+            with self.stage(name, op):
+                item = next(iterator, StopIteration)
+            if(item is StopIteration):
+                return
+            yield item
+
+    def add_check(self, op: str, index: int, file_name: str, result: bool | str | None, timings: dict[str, dict[str, float]]) -> None:
+        """
+        Records resource usage of checking a mutation with TChecker (see mutate.check_mutation).
+
+        :param op: mutation operator
+        :param index: number of mutation of operator (counting all checked mutations)
+        :param file_name: name of file mutation is written to ("" if it is not written)
+        :param result: result of check
+        :param timings: resource usage of the TChecker tools called for the check
+        """
+
+        stages = self.stages.setdefault(op, {})
+        for tool, tool_usage in timings.items():
+            total = stages.setdefault(tool, new_usage())
+            total["calls"] = total["calls"] + tool_usage["calls"]
+            total["wall_time"] = total["wall_time"] + tool_usage["wall_time"]
+            total["cpu_time"] = total["cpu_time"] + tool_usage["cpu_time"]
+            total["peak_memory"] = max(total["peak_memory"], tool_usage["peak_memory"])
+            total["child_peak_memory"] = max(total["child_peak_memory"], tool_usage["child_peak_memory"])
+
+        match result:
+            case True:
+                outcome = "bisimilar"
+            case False:
+                outcome = "not bisimilar"
+            case None:
+                outcome = "faulty"
+            case _:
+                outcome = result
+
+        self.checks.append({"op": op, "index": index, "mutation": file_name, "outcome": outcome,
+                            "wall_time": sum(tool_usage["wall_time"] for tool_usage in timings.values()),
+                            "child_peak_memory": max((tool_usage["child_peak_memory"] for tool_usage in timings.values()), default = 0),
+                            **{f"{tool}_wall_time": tool_usage["wall_time"] for tool, tool_usage in timings.items()}})
+
+    def write(self, out_dir: str) -> None:
+        """
+        Writes resource usage of all stages to profile.json and of all checks to check_timings.csv in given directory.
+
+        :param out_dir: output directory
+        """
+
+        with open(os.path.join(out_dir, "profile.json"), "w") as file:
+            json.dump({"stages": self.stages}, file, indent = 2)
+
+        tools = ["tck_syntax", "tck_reach", "tck_compare", "exceeded_limit"]
+        with open(os.path.join(out_dir, "check_timings.csv"), "w", newline = '') as file:
+            csv_writer = csv.DictWriter(file, ["op", "index", "mutation", "outcome", "wall_time", "child_peak_memory"] + [f"{tool}_wall_time" for tool in tools], restval = "")
+            csv_writer.writeheader()
+            csv_writer.writerows(self.checks)
@@ -0,0 +1,101 @@
+import declaration_index
+
+import re
+
+from lark import ParseTree, Token, Tree
+
+# nodes and edges of the state space graph written by TChecker (in DOT format)
+node_pattern = re.compile(r'^\s*(\w+)\s*\[(.*)\]\s*$')
+edge_pattern = re.compile(r'^\s*(\w+)\s*->\s*(\w+)\s*\[(.*)\]\s*$')
+attribute_pattern = re.compile(r'(\w+)="([^"]*)"')
+
+class Reachability:
+    """
+    Locations and edges of a TA that are reachable, read from the state space graph of TChecker's reachability check of the TA.
+    Mutations that only alter unreachable parts of the TA do not change its behaviour.
+    """
+
+    def __init__(self, tree: ParseTree, certificate: str):
+        """
+        :param tree: AST of TA
+        :param certificate: state space graph of TA (certificate of tck_reach with tck_reach.Certificate.GRAPH)
+        """
+
+        processes = [declaration_index.name(process) for process in declaration_index.get(tree).processes]
+
+        # reachable locations as pairs of process and location name
+        self.locations: set[tuple[str, str]] = set()
+        # edges that are taken in the state space as quadruples of process, source location, target location and event name
+        self.edges: set[tuple[str, str, str, str]] = set()
+
+        location_tuples: dict[str, list[str]] = {}
+        for line in certificate.splitlines():
+            edge_match = edge_pattern.match(line)
+            if(edge_match is not None):
+                source, target, attributes = edge_match.groups()
+                vedge = dict(attribute_pattern.findall(attributes)).get("vedge", "")
+                for process_event in vedge.strip("<>").split(","):
+                    if("@" not in process_event):
+                        continue
+                    process, event = process_event.split("@", 1)
+                    if(process not in processes or source not in location_tuples or target not in location_tuples):
+                        continue
+                    j = processes.index(process)
+                    self.edges.add((process, location_tuples[source][j], location_tuples[target][j], event))
+                continue
+
+            node_match = node_pattern.match(line)
+            if(node_match is not None):
+                node, attributes = node_match.groups()
+                vloc = dict(attribute_pattern.findall(attributes)).get("vloc")
+                if(vloc is None):
+                    continue
+                location_tuples[node] = vloc.strip("<>").split(",")
+                self.locations.update(zip(processes, location_tuples[node]))
+
+        # without any reachable state, the graph could not be read and nothing is considered to be unreachable,
+        # without any taken edge (e.g. if the graph has no edge attributes in the expected format), every edge is considered to be taken
+        self.is_known = len(self.locations) > 0
+        self.edges_known = len(self.edges) > 0
+
+    def is_location_reachable(self, process: str, location: str) -> bool:
+        """
+        :param process: name of process
+        :param location: name of location
+        :return: True iff location of given process is reachable (or reachability is not known)
+        """
+
+        return not self.is_known or (process, location) in self.locations
+
+    def is_edge_taken(self, process: str, source: str, target: str, event: str) -> bool:
+        """
+        :param process: name of process
+        :param source: name of source location
+        :param target: name of target location
+        :param event: name of event
+        :return: True iff an edge with given process, source, target and event is taken in the state space (or taken edges are not known)
+        """
+
+        return not self.edges_known or (process, source, target, event) in self.edges
+
+    def is_unreachable(self, declaration: ParseTree | Token) -> bool:
+        """
+        Determines whether given declaration is irrelevant for the behaviour of the TA because it belongs to an unreachable part.
+        This is the case for unreachable locations and for edges with an unreachable source location.
+
+        :param declaration: declaration of TA (not necessarily of the original AST)
+        :return: True iff declaration is an unreachable location or an edge with an unreachable source location
+        """
+
+        if(not isinstance(declaration, Tree)):
+            return False
+
+        match declaration.data:
+            case "location_declaration":
+                process, location = (declaration_index.name(declaration.children[j]) for j in (2, 4))
+                return not self.is_location_reachable(process, location)
+            case "edge_declaration":
+                process, source = (declaration_index.name(declaration.children[j]) for j in (2, 4))
+                return not self.is_location_reachable(process, source)
+            case _:
+                return False
@@ -0,0 +1,100 @@
+import operators
+import slicing
+
+import random
+
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from descriptors import Mutation
+
+from lark import ParseTree
+
+def process_stratum(tree: ParseTree, mutation: Mutation) -> Hashable:
+    """
+    :param tree: AST of original TA
+    :param mutation: mutation of TA
+    :return: names of the processes altered by given mutation (None if it alters other declarations, see slicing.touched_processes)
+    """
+
+    processes = slicing.touched_processes(tree, mutation)
+    return None if processes is None else tuple(sorted(processes))
+
+def declaration_stratum(tree: ParseTree, mutation: Mutation) -> Hashable:
+    """
+    :param tree: AST of original TA
+    :param mutation: mutation of TA
+    :return: indices of the declarations (e.g. locations or edges) of the original TA altered or removed by given mutation
+    """
+
+    return tuple(sorted(set(edit.path[0] for edit in mutation.edits if edit.kind != "insert" or len(edit.path) > 1)))
+
+strata = {"process": process_stratum, "declaration": declaration_stratum}
+
+def reservoir_sample(mutations: Iterable[Mutation], size: int, rng: random.Random, stratum: Callable[[Mutation], Hashable] | None = None) -> list[Mutation]:
+    """
+    Draws mutations uniformly at random from given (lazy) iterable in a single pass, only keeping the drawn mutations in memory.
+    If a stratum function is given, mutations are drawn uniformly within each stratum and evenly across strata (as long as a stratum has mutations left).
+
+    :param mutations: mutations to be drawn from
+    :param size: number of mutations to be drawn
+    :param rng: random generator
+    :param stratum: function returning the stratum of a mutation, all mutations are in one stratum if None
+    :return: drawn mutations in the order of given iterable
+    """
+
+    # reservoir of (position, mutation) pairs and number of seen mutations by stratum
+    reservoirs: dict[Hashable, list[tuple[int, Mutation]]] = {}
+    seen: dict[Hashable, int] = {}
+
+    for position, mutation in enumerate(mutations):
+        key = stratum(mutation) if stratum is not None else None
+        reservoir = reservoirs.setdefault(key, [])
+        seen[key] = seen.get(key, 0) + 1
+        if(len(reservoir) < size):
+            reservoir.append((position, mutation))
+        else:
+            j = rng.randrange(seen[key])
+            if(j < size):
+                reservoir[j] = (position, mutation)
+
+    # take drawn mutations from all strata in turn (in random order, so no stratum is preferred if there are more strata than mutations to be drawn),
+    # each reservoir is a uniform sample of its stratum
+    reservoirs_in_order = list(reservoirs.values())
+    rng.shuffle(reservoirs_in_order)
+    for reservoir in reservoirs_in_order:
+        rng.shuffle(reservoir)
+
+    drawn = []
+    while(len(drawn) < size and any(len(reservoir) > 0 for reservoir in reservoirs_in_order)):
+        for reservoir in reservoirs_in_order:
+            if(len(drawn) < size and len(reservoir) > 0):
+                drawn.append(reservoir.pop())
+
+    return [mutation for _, mutation in sorted(drawn, key = lambda drawn_mutation: drawn_mutation[0])]
+
+def sample(tree: ParseTree, op: str, mutations: Iterable[Mutation], size: int, seed: int, stratify: str | None = None) -> Iterator[Mutation]:
+    """
+    Draws given number of mutations of given operator at random (all mutations if there are not more).
+    Mutations of add_sync, whose number grows exponentially in the number of processes, are drawn directly without enumerating them (see operators.sample_add_sync),
+    mutations of all other operators are drawn in a single pass over the lazily generated mutations.
+    The sample only depends on the seed and the operator, so the same mutations are drawn for an operator on its own and as part of operator option all.
+
+    :param tree: AST of TA to be mutated
+    :param op: mutation operator
+    :param mutations: all mutations of TA by given operator (see mutate.apply_mutation)
+    :param size: number of mutations to be drawn
+    :param seed: seed of random generator
+    :param stratify: draw mutations evenly across the processes ("process") or declarations ("declaration") they alter, uniformly if None
+    :return: iterator over drawn mutations in the order they are generated by the operator
+    """
+
+    rng = random.Random(f"{seed}:{op}")
+
+    # all mutations of add_sync only insert a declaration, so they are in the same stratum of declarations
+    if("add_sync" == op):
+        drawn = operators.sample_add_sync(tree, size, rng, by_processes = ("process" == stratify))
+        if(drawn is not None):
+            yield from drawn
+            return
+
+    stratum = (lambda mutation: strata[stratify](tree, mutation)) if stratify is not None else None
+    yield from reservoir_sample(mutations, size, rng, stratum)
@@ -0,0 +1,145 @@
+import declaration_index
+
+from collections.abc import Iterable
+from descriptors import Mutation
+
+from lark import ParseTree, Token, Tree
+
+class ProcessDependencies:
+    """
+    Dependencies between the processes of a TA.
+    Two processes depend on each other if they synchronise, use an event of the same name or share a variable (i.e. any id in the attributes of their locations and edges).
+    Processes that can restrict the elapse of time or the interleaving of other processes (i.e. that have invariants, urgent or committed locations) are interfering,
+    processes with committed locations can restrict the interleaving of all other processes.
+    """
+
+    def __init__(self, declarations: Iterable[ParseTree | Token]):
+        """
+        :param declarations: declarations of TA (i.e. children of its AST)
+        """
+
+        self.processes: list[str] = []
+        self.interfering: set[str] = set()
+        self.committed: set[str] = set()
+        # processes synchronising with each other
+        self.syncs: list[set[str]] = []
+        # processes using an event or variable by its name
+        self.processes_by_name: dict[str, set[str]] = {}
+
+        for declaration in declarations:
+            if(not isinstance(declaration, Tree)):
+                continue
+
+            match declaration.data:
+                case "process_declaration":
+                    self.processes.append(declaration_index.name(declaration.children[2]))
+                case "location_declaration" | "edge_declaration":
+                    process = declaration_index.name(declaration.children[2])
+                    names = set(declaration_index.name(id) for attributes in declaration.find_data("attributes") for id in attributes.find_data("id"))
+                    if("edge_declaration" == declaration.data):
+                        names.add(declaration_index.name(declaration.children[8]))
+                    for name in names:
+                        self.processes_by_name.setdefault(name, set()).add(process)
+                    if(any(True for attribute in declaration.iter_subtrees() if attribute.data in ["invariant_attribute", "urgent_attribute", "committed_attribute"])):
+                        self.interfering.add(process)
+                    if(any(True for _ in declaration.find_data("committed_attribute"))):
+                        self.committed.add(process)
+                case "sync_declaration":
+                    self.syncs.append(set(declaration_index.name(constraint.children[0]) for constraint in declaration.find_data("sync_constraint")))
+
+def touched_processes(tree: ParseTree, mutation: Mutation) -> set[str] | None:
+    """
+    Returns names of all processes whose locations, edges or synchronisations are altered by given mutation.
+
+    :param tree: AST of original TA
+    :param mutation: mutation of TA
+    :return: set of process names, None if mutation alters other declarations (e.g. of events or variables)
+    """
+
+    processes = set()
+    for edit in mutation.edits:
+        declarations = [tree.children[edit.path[0]]] if edit.kind != "insert" or len(edit.path) > 1 else []
+        if(edit.kind != "remove" and len(edit.path) == 1):
+            declarations.append(edit.node)
+
+        for declaration in declarations:
+            if(isinstance(declaration, Token)):
+                continue
+            match declaration.data:
+                case "process_declaration" | "location_declaration" | "edge_declaration":
+                    processes.add(declaration_index.name(declaration.children[2]))
+                case "sync_declaration":
+                    processes.update(declaration_index.name(constraint.children[0]) for constraint in declaration.find_data("sync_constraint"))
+                case _:
+                    return None
+
+    return processes
+
+def slice_tree(tree: ParseTree, processes: set[str]) -> ParseTree:
+    """
+    Restricts given TA to given processes.
+    All declarations of events and variables are kept.
+
+    :param tree: AST of TA
+    :param processes: names of processes to be kept
+    :return: AST of TA only containing given processes
+    """
+
+    def is_kept(declaration: ParseTree | Token) -> bool:
+        if(isinstance(declaration, Token)):
+            return True
+        match declaration.data:
+            case "process_declaration" | "location_declaration" | "edge_declaration":
+                return declaration_index.name(declaration.children[2]) in processes
+            case "sync_declaration":
+                return all(declaration_index.name(constraint.children[0]) in processes for constraint in declaration.find_data("sync_constraint"))
+            case _:
+                return True
+
+    return Tree(tree.data, [child for child in tree.children if is_kept(child)])
+
+def independent_slices(tree: ParseTree, mutated_tree: ParseTree, mutation: Mutation, dependencies: ProcessDependencies) -> tuple[ParseTree, ParseTree] | None:
+    """
+    Restricts original and mutated TA to the processes altered by given mutation and all processes depending on them (see ProcessDependencies).
+    The remaining processes are identical in both TAs and neither depend on nor interfere with the altered processes,
+    so original and mutated TA are bisimilar iff their slices are bisimilar.
+    TAs are not sliced if a kept process has a committed location in either TA, as it blocks the remaining processes in the whole TA but not in the slices.
+
+    :param tree: AST of original TA
+    :param mutated_tree: AST of mutated TA
+    :param mutation: mutation of TA
+    :param dependencies: dependencies between processes of original TA
+    :return: pair of sliced ASTs of original and mutated TA, None if TAs can not be sliced (i.e. the slices would contain all processes)
+    """
+
+    touched = touched_processes(tree, mutation)
+    if(touched is None or 0 == len(touched)):
+        return None
+
+    # committed locations restrict the interleaving of the remaining processes
+    if(mutation.provenance is not None and "committed" == mutation.provenance.attribute):
+        return None
+
+    # declarations of mutated TA that are not declarations of the original TA
+    altered_dependencies = ProcessDependencies(edit.node for edit in mutation.edits if edit.kind != "remove" and len(edit.path) == 1)
+    groups = dependencies.syncs + altered_dependencies.syncs
+    for name in dependencies.processes_by_name.keys() | altered_dependencies.processes_by_name.keys():
+        groups.append(dependencies.processes_by_name.get(name, set()) | altered_dependencies.processes_by_name.get(name, set()))
+
+    # add groups of dependent processes until a fixed point is reached
+    kept = set(touched)
+    changed = True
+    while(changed):
+        changed = False
+        for group in groups:
+            if(not group.isdisjoint(kept) and not group.issubset(kept)):
+                kept.update(group)
+                changed = True
+
+    remaining = set(dependencies.processes) - kept
+    if(0 == len(remaining) or not remaining.isdisjoint(dependencies.interfering)):
+        return None
+    if(not kept.isdisjoint(dependencies.committed | altered_dependencies.committed)):
+        return None
+
+    return slice_tree(tree, kept), slice_tree(mutated_tree, kept)
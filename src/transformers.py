@@ -19,7 +19,7 @@ class SimplifyExpressions(Transformer):
         def is_complex(tree: ParseTree):
             return 2 == sum(1 for _ in tree.scan_values(lambda t: t in ["<=", "<"]))
         
-        is_complex_expression = lambda t: (t.data == "predicate_expr" or t.data == "clock_expr") and is_complex(t)
+        is_complex_expression = lambda t: t.data == "predicate_expr" and is_complex(t)
         complex_expressions = tree.find_pred(is_complex_expression)
 
         complex_expression = next(complex_expressions, None)
@@ -65,7 +65,7 @@ class BreakUpEquals(Transformer):
         result = copy.deepcopy(tree)
 
         # find atomic expressions containing equals comparator
-        is_expr_with_eq_cmp = lambda t: (t.data == "predicate_expr" or t.data == "clock_expr") and AST_tools.contains_child_node(t, Token("CMP_EQ_TOK", "=="))
+        is_expr_with_eq_cmp = lambda t: t.data == "predicate_expr" and AST_tools.contains_child_node(t, Token("CMP_EQ_TOK", "=="))
         exprs_with_eq_cmp = tree.find_pred(is_expr_with_eq_cmp)
 
         expr_with_eq_cmp = next(exprs_with_eq_cmp, None)
@@ -139,7 +139,7 @@ class MoveSyncsToEnd(Transformer):
     @lark.visitors.v_args(tree=True)
     def start(self, tree: ParseTree) -> ParseTree:
 
-        result = copy.deepcopy(tree)
+        result = AST_tools.shallow_copy(tree)
 
         for child in tree.children:
             if isinstance(child, Tree) and child.data == "sync_declaration":
@@ -0,0 +1,74 @@
+import hashlib
+import sqlite3
+import time
+
+class VerdictCache:
+    """
+    On-disk cache of the results of checking mutations with TChecker (see mutate.check_mutation), stored in an SQLite database.
+    Results are keyed by the hashes of original and mutated TA, so they are reused across runs on the same TA.
+    If the cache holds more than max_entries results when it is closed, the least recently used results are evicted.
+    """
+
+    def __init__(self, path: str, max_entries: int):
+        """
+        :param path: path to database file, created if it does not exist
+        :param max_entries: maximum number of results kept in cache
+        """
+
+        self.max_entries = max_entries
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("CREATE TABLE IF NOT EXISTS verdicts (key BLOB PRIMARY KEY, verdict INTEGER, last_used INTEGER NOT NULL)")
+        self.connection.commit()
+
+    def get(self, original_ta: str, mutated_ta: str) -> bool | None:
+        """
+        Returns cached result of checking given mutation.
+
+        :param original_ta: original TA in TChecker syntax
+        :param mutated_ta: mutated TA in TChecker syntax
+        :return: None if mutation is semantically faulty, otherwise True iff mutation is bisimilar to original
+        :raises KeyError: if no result is cached for given mutation
+        """
+
+        cache_key = key(original_ta, mutated_ta)
+        row = self.connection.execute("SELECT verdict FROM verdicts WHERE key = ?", (cache_key,)).fetchone()
+        if(row is None):
+            raise KeyError(cache_key)
+
+        self.connection.execute("UPDATE verdicts SET last_used = ? WHERE key = ?", (time.time_ns(), cache_key))
+
+        return None if row[0] is None else bool(row[0])
+
+    def put(self, original_ta: str, mutated_ta: str, verdict: bool | None) -> None:
+        """
+        Caches result of checking given mutation.
+
+        :param original_ta: original TA in TChecker syntax
+        :param mutated_ta: mutated TA in TChecker syntax
+        :param verdict: None if mutation is semantically faulty, otherwise True iff mutation is bisimilar to original
+        """
+
+        self.connection.execute("INSERT OR REPLACE INTO verdicts VALUES (?, ?, ?)",
+                                (key(original_ta, mutated_ta), None if verdict is None else int(verdict), time.time_ns()))
+        self.connection.commit()
+
+    def close(self) -> None:
+        """
+        Evicts least recently used results exceeding the maximum number of entries and writes cache to disk.
+        """
+
+        (entries,) = self.connection.execute("SELECT COUNT(*) FROM verdicts").fetchone()
+        if(entries > self.max_entries):
+            self.connection.execute("DELETE FROM verdicts WHERE key IN (SELECT key FROM verdicts ORDER BY last_used LIMIT ?)", (entries - self.max_entries,))
+
+        self.connection.commit()
+        self.connection.close()
+
+def key(original_ta: str, mutated_ta: str) -> bytes:
+    """
+    :param original_ta: original TA in TChecker syntax
+    :param mutated_ta: mutated TA in TChecker syntax
+    :return: cache key of given pair of TAs
+    """
+
+    return hashlib.sha256(hashlib.sha256(original_ta.encode()).digest() + hashlib.sha256(mutated_ta.encode()).digest()).digest()
@@ -0,0 +1,17 @@
+import os.path
+import sys
+
+import pytest
+
+# modules of the tool are imported from src like in mutate.py
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import mutate
+
+@pytest.fixture(scope = "session")
+def ta_parser():
+    return mutate.load_parser()
+
+@pytest.fixture
+def parse(ta_parser):
+    return lambda ta: mutate.parse_ta(ta_parser, ta)
@@ -0,0 +1,44 @@
+import declaration_index
+
+import concurrent.futures
+import gc
+
+one_process = """system:one_process
+
+event:a
+
+process:P
+location:P:l0{initial:}
+location:P:l1
+edge:P:l0:l1:a
+"""
+
+def test_index_is_shared_by_alternating_trees(parse):
+    tree = parse(one_process)
+    other_tree = parse(one_process)
+
+    index = declaration_index.get(tree)
+    other_index = declaration_index.get(other_tree)
+
+    # structurally equal trees are indexed separately, as the index refers to their declarations
+    assert index is not other_index
+    assert declaration_index.get(tree) is index
+    assert declaration_index.get(other_tree) is other_index
+
+def test_index_is_built_once_for_concurrent_callers(parse):
+    tree = parse(one_process)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers = 8) as executor:
+        indices = list(executor.map(lambda _: declaration_index.get(tree), range(64)))
+
+    assert all(index is indices[0] for index in indices)
+
+def test_index_is_dropped_with_tree(parse):
+    tree = parse(one_process)
+    declaration_index.get(tree)
+    key = id(tree)
+
+    del tree
+    gc.collect()
+
+    assert key not in declaration_index._indices
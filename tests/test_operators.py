@@ -0,0 +1,31 @@
+import counting
+import descriptors
+import operators
+
+one_process = """system:one_process
+
+event:a
+
+process:P
+location:P:l0{initial:}
+location:P:l1
+edge:P:l0:l1:a
+"""
+
+def test_added_ids_have_type_of_parsed_ids(parse):
+    tree = parse(one_process)
+
+    for mutation in [next(operators.add_location(tree)), next(operators.add_transition(tree))]:
+        mutated_tree = descriptors.materialize(tree, mutation)
+        assert {token.type for node in mutated_tree.find_data("id") for token in node.children} == {"ID_TOK"}
+
+        # descriptors refer to the named terminal instead of a name generated by lark
+        assert "__ANON" not in descriptors.to_json(mutation)
+
+def test_no_transition_is_added_without_events_or_edges(parse):
+    without_edges = parse(one_process.replace("edge:P:l0:l1:a\n", ""))
+    without_events = parse("system:no_events\n\nprocess:P\nlocation:P:l0{initial:}\nlocation:P:l1\n")
+
+    for tree in [without_edges, without_events]:
+        assert list(operators.add_transition(tree)) == []
+        assert counting.MutationCounter(tree).count("add_transition").total == 0
@@ -0,0 +1,51 @@
+import equivalence
+import operators
+import reachability
+
+two_processes = """system:two_processes
+
+event:a
+event:b
+
+process:P
+location:P:l0{initial:}
+location:P:l1
+location:P:l2
+edge:P:l0:l1:a
+edge:P:l1:l0:b
+
+process:Q
+location:Q:m0{initial:}
+edge:Q:m0:m0:a
+"""
+
+nodes = """digraph two_processes {
+  0 [initial="true", intval="", vloc="<l0,m0>"]
+  1 [intval="", vloc="<l1,m0>"]
+"""
+
+edges = """  0 -> 1 [vedge="<P@a>"]
+  1 -> 0 [vedge="<P@b>"]
+"""
+
+def test_taken_edges(parse):
+    tree = parse(two_processes)
+    reachable_parts = reachability.Reachability(tree, nodes + edges + "}\n")
+
+    assert reachable_parts.is_location_reachable("P", "l1")
+    assert not reachable_parts.is_location_reachable("P", "l2")
+    assert reachable_parts.is_edge_taken("P", "l0", "l1", "a")
+    assert not reachable_parts.is_edge_taken("Q", "m0", "m0", "a")
+
+def test_graph_without_edges(parse):
+    tree = parse(two_processes)
+    reachable_parts = reachability.Reachability(tree, nodes + "}\n")
+
+    # locations are known, but taken edges are not, so every edge is considered to be taken
+    assert not reachable_parts.is_location_reachable("P", "l2")
+    assert reachable_parts.is_edge_taken("P", "l0", "l1", "a")
+    assert reachable_parts.is_edge_taken("Q", "m0", "m0", "a")
+
+    # removed transitions are not statically equivalent then
+    for mutation in operators.remove_transition(tree):
+        assert equivalence.find_equivalence_reason(tree, mutation, reachable_parts) is None
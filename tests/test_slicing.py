@@ -0,0 +1,51 @@
+import descriptors
+import operators
+import slicing
+
+# P has an urgent initial location, Q is independent of P
+two_processes = """system:two_processes
+
+event:a
+event:b
+
+process:P
+location:P:l0{initial: : urgent:}
+location:P:l1
+edge:P:l0:l1:a
+
+process:Q
+location:Q:m0{initial:}
+location:Q:m1
+edge:Q:m0:m1:b
+"""
+
+def test_committed_location_in_mutation_is_not_sliced(parse):
+    tree = parse(two_processes)
+    dependencies = slicing.ProcessDependencies(tree.children)
+
+    # l0 is urgent in the original and committed in the mutation, so Q can not move in the mutation while P is in l0
+    mutation = next(mutation for mutation in operators.invert_urgent_or_committed_location(tree, invert_committed = True)
+                    if mutation.provenance.locations == ("P:l0",))
+    mutated_tree = descriptors.materialize(tree, mutation)
+
+    assert slicing.independent_slices(tree, mutated_tree, mutation, dependencies) is None
+
+    # also without provenance, the committed location is found in the altered declaration
+    assert slicing.independent_slices(tree, mutated_tree, mutation._replace(provenance = None), dependencies) is None
+
+def test_committed_location_in_kept_process_is_not_sliced(parse):
+    tree = parse(two_processes.replace("location:P:l1", "location:P:l1{committed:}"))
+    dependencies = slicing.ProcessDependencies(tree.children)
+
+    mutation = next(operators.remove_transition(tree))
+    assert slicing.independent_slices(tree, descriptors.materialize(tree, mutation), mutation, dependencies) is None
+
+def test_independent_process_is_sliced(parse):
+    tree = parse(two_processes)
+    dependencies = slicing.ProcessDependencies(tree.children)
+
+    mutation = next(operators.remove_transition(tree))
+    slices = slicing.independent_slices(tree, descriptors.materialize(tree, mutation), mutation, dependencies)
+
+    assert slices is not None
+    assert {"P"} == set(slicing.ProcessDependencies(slices[0].children).processes)